@@ -5,25 +5,44 @@ Compiles Python application to native executable with all dependencies
 bundled. No Python installation required on target system.
 
 Usage:
-    python build.py
+    python build.py            # Incremental build (reuses compiled modules)
+    python build.py --clean    # Full rebuild from scratch
+    python build.py --release  # Optimized build (LTO, slower to compile)
 
 Output:
-    dist/csv-chart-plotter.exe (standalone executable)
+    dist/main.dist/csv-chart-plotter[.exe] (standalone application folder)
+    dist/main.app (macOS application bundle)
+    dist/csv-chart-plotter-<version>-setup.exe (Windows installer, if NSIS available)
 
 Requirements:
     - Nuitka installed: uv add --dev nuitka
     - Windows: MSVC (Visual Studio Build Tools) with Windows SDK
     - macOS: Xcode Command Line Tools
     - Linux: GCC build-essential
+    - Optional (Windows installer): NSIS (makensis on PATH)
 
 NOTE: Python 3.13 requires MSVC on Windows (MinGW not supported)
 """
 
+import argparse
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
 import logging
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+import tomllib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,7 +50,217 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DIST_DIR = Path('dist')
+APP_NAME = 'csv-chart-plotter'
+EXECUTABLE_NAME = f'{APP_NAME}.exe' if sys.platform == 'win32' else APP_NAME
+if sys.platform == 'darwin':
+    # Nuitka names the bundle after the entry point (main.py) as well
+    APP_DIR = DIST_DIR / 'main.app'
+    STANDALONE_DIR = APP_DIR / 'Contents' / 'MacOS'  # Bundle holds the standalone files here
+else:
+    APP_DIR = STANDALONE_DIR = DIST_DIR / 'main.dist'  # Nuitka names the folder after the entry point
+EXECUTABLE_PATH = STANDALONE_DIR / EXECUTABLE_NAME
+INSTALLER_SCRIPT = Path('installer.nsi')
+REPORT_PATH = DIST_DIR / 'compilation-report.xml'
+BUILD_LOG_PATH = DIST_DIR / 'build.log'  # Full unfiltered Nuitka output
+INPUT_SHA_PATH = DIST_DIR / '.last-input-sha'  # Inputs of the last successful build
 
+# Split builds: application package compiled separately from the dependency layer
+APP_MODULE_DIR = DIST_DIR / 'app-module'
+APP_MODULE_LOG_PATH = DIST_DIR / 'build-app.log'
+SUPPORT_SHA_PATH = DIST_DIR / '.support-sha'  # Inputs of the cached dependency layer
+
+# Console output from Nuitka is batched and written at most this often (seconds)
+OUTPUT_FLUSH_INTERVAL = 0.5
+_DEBUG_LINE = re.compile(r'^Nuitka:DEBUG')
+_PROGRESS_LINE = re.compile(r'^\S+:\s*.*?\d+(?:\.\d+)?%')  # Redrawn progress bar states
+
+# Packages recorded by a tracing run of the application (see produce_hints())
+HINTS_PATH = Path('hints.json')
+
+# Exercises the load -> filter -> figure path without opening a window, then
+# prints every imported module that was loaded from site-packages
+_TRACE_SCRIPT = """
+import json, sys, sysconfig
+from pathlib import Path
+import webview
+import werkzeug.serving
+import csv_chart_plotter.main
+from csv_chart_plotter.chart_app import create_app
+from csv_chart_plotter.column_filter import filter_numeric_columns
+from csv_chart_plotter.csv_indexer import CSVIndexer
+
+indexer = CSVIndexer(Path('sample.csv'))
+index = indexer.build_index()
+df = filter_numeric_columns(indexer.read_range(0, index.row_count))
+create_app(df=df, csv_filename='sample.csv')
+
+site_dirs = {sysconfig.get_paths()['purelib'], sysconfig.get_paths()['platlib']}
+json.dump(sorted(
+    name for name, module in list(sys.modules.items())
+    if any(str(getattr(module, '__file__', None) or '').startswith(d) for d in site_dirs)
+), sys.stdout)
+"""
+
+# Entry modules imported by the application; import following pulls in only
+# what these actually import instead of every submodule of each package
+INCLUDED_MODULES = [
+    'dash',
+    'dash.dcc',
+    'dash.html',
+    'flask',
+    'werkzeug.serving',
+    'pandas',
+    'plotly.graph_objects',
+]
+
+# Imported lazily (module __getattr__) or per platform at runtime, so
+# neither import following nor the tracing run sees all of their modules
+INCLUDED_PACKAGES = [
+    'plotly.graph_objs',
+    'webview',
+]
+
+# Stdlib extension modules and DLLs the application never loads; removed
+# from the standalone folder after compilation (glob patterns)
+UNUSED_BINARIES = [
+    '_sqlite3.*',
+    'sqlite3.dll',
+    '_tkinter.*',
+    'tcl86t.dll',
+    'tk86t.dll',
+    '_hashlib.*',
+    '_bz2.*',
+    '_lzma.*',
+]
+
+# Only removed when the application source does not import ssl
+TLS_BINARIES = [
+    '_ssl.*',
+]
+
+# Nuitka plugins enabled explicitly rather than relying on auto-detection
+NUITKA_PLUGINS = [
+    'anti-bloat',  # Strip test/benchmark/optional-integration code paths from packages
+    'no-qt',  # pywebview must not pull in a Qt binding
+]
+
+# Package data files never read at runtime (Nuitka --noinclude-data-files patterns)
+EXCLUDED_DATA_FILES = [
+    'plotly/package_data/plotly.min.js',  # Dash serves its own plotly.js bundle from dcc
+    'plotly/package_data/widgetbundle.js',  # Jupyter FigureWidget only
+    'plotly/package_data/datasets/*',  # plotly.express sample datasets
+    'dash/dash-renderer/build/*.dev.js',  # Served only with dev tools (debug=True)
+    '**/*.map',  # Source maps, requested only by browser dev tools
+    '**/tests/**',
+    '**/*.pyi',
+]
+
+# Subpackages never imported at runtime, per package. Review against the
+# analyze_report() summary when dependencies are upgraded.
+EXCLUDED_SUBPACKAGES: dict[str, list[str]] = {
+    'pandas': ['tests', 'io.formats.style'],
+    'plotly': ['figure_factory', 'express'],
+    'dash': ['testing'],
+    'werkzeug': ['debug'],
+    'flask': ['testing'],
+}
+
+# Large dependencies whose sources are pre-read into the OS file cache so
+# Nuitka's sequential parse phase is not dominated by cold disk reads
+WARM_CACHE_PACKAGES = ['pandas', 'plotly', 'dash', 'flask', 'werkzeug']
+WARM_CACHE_WORKERS = 16
+
+# Marker for renamed directories awaiting background deletion
+_TRASH_SUFFIX = '.trash.'
+
+# Project-local Nuitka cache (ccache objects, downloaded tools) kept across builds
+NUITKA_CACHE_DIR = Path('.nuitka-cache')
+
+# Successful toolchain probe results, reused while the interpreter is unchanged
+PROBE_CACHE_PATH = Path('.build-probe-cache.json')
+PROBE_CACHE_TTL = 86400  # seconds
+
+# Oldest Nuitka supporting every flag passed below (matches pyproject.toml)
+MIN_NUITKA_VERSION = (2, 8, 9)
+_NUITKA_VERSION = re.compile(r'^(\d+\.\d+(?:\.\d+)?)')
+
+# Visual Studio workload component providing the x64 MSVC compiler
+VC_TOOLS_COMPONENT = 'Microsoft.VisualStudio.Component.VC.Tools.x86.x64'
+
+_probe_cache_lock = threading.Lock()
+
+
+def disk_cache(path: Path, ttl: float) -> Callable[[Callable[[], bool]], Callable[[], bool]]:
+    """
+    Cache a successful environment probe on disk.
+
+    The cache entry is keyed on the interpreter (path and modification
+    time), platform, PATH, installed Nuitka version, and detected compiler,
+    so switching virtualenvs or shells, upgrading Nuitka, or installing a
+    different compiler re-probes. Failed probes are never cached.
+
+    Args:
+        path: JSON file holding cached probe results
+        ttl: Seconds before a cached success expires
+
+    Returns:
+        Decorator for zero-argument probe functions returning bool
+    """
+    def decorator(probe: Callable[[], bool]) -> Callable[[], bool]:
+        @functools.wraps(probe)
+        def wrapper() -> bool:
+            key = hashlib.sha256(
+                f"{sys.executable}|{os.stat(sys.executable).st_mtime}|"
+                f"{sys.platform}|{os.environ.get('PATH', '')}|"
+                f"{_nuitka_version()}|{_compiler_path()}".encode()
+            ).hexdigest()
+
+            with _probe_cache_lock:
+                cache = _read_probe_cache(path)
+
+            entry = cache.get(probe.__name__, {})
+            if entry.get('key') == key and time.time() - entry.get('time', 0) < ttl:
+                logger.info(f"{probe.__name__}: using cached result ({path})")
+                return True
+
+            if not probe():
+                return False
+
+            with _probe_cache_lock:
+                cache = _read_probe_cache(path)
+                cache[probe.__name__] = {'key': key, 'time': time.time()}
+                path.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+            return True
+        return wrapper
+    return decorator
+
+
+def _nuitka_version() -> str:
+    """Installed Nuitka distribution version, or '' if not installed."""
+    try:
+        return importlib.metadata.version('nuitka')
+    except importlib.metadata.PackageNotFoundError:
+        return ''
+
+
+def _compiler_path() -> str:
+    """Location of the C compiler the build would use, or '' if none is found."""
+    if sys.platform == 'win32':
+        vs_path = _find_visual_studio()
+        return str(vs_path) if vs_path is not None else shutil.which('cl.exe') or ''
+    return shutil.which('clang' if sys.platform == 'darwin' else 'gcc') or ''
+
+
+def _read_probe_cache(path: Path) -> dict:
+    """Load the probe cache, treating a missing or corrupt file as empty."""
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+@disk_cache(PROBE_CACHE_PATH, ttl=PROBE_CACHE_TTL)
 def check_nuitka() -> bool:
     """Verify Nuitka is available in environment."""
     try:
@@ -42,34 +271,160 @@ def check_nuitka() -> bool:
             text=True,
             check=False  # Don't raise on non-zero exit (version check may have warnings)
         )
-        # Check if version info present in output
-        if '2.' in result.stdout or 'Nuitka' in result.stdout:
-            # Extract version line only
-            version_line = result.stdout.split('\n')[0]
-            logger.info(f"Nuitka version: {version_line}")
-            return True
-        raise FileNotFoundError("Nuitka not found")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except FileNotFoundError:
+        result = None
+
+    match = _NUITKA_VERSION.match(result.stdout) if result is not None else None
+    if match is None:
         logger.error("Nuitka not found. Install with: uv add --optional build nuitka")
         return False
 
+    # Compared as integer tuples: build.py needs nothing outside the stdlib
+    version = match.group(1)
+    if tuple(int(part) for part in version.split('.')) < MIN_NUITKA_VERSION:
+        minimum = '.'.join(map(str, MIN_NUITKA_VERSION))
+        logger.error(f"Nuitka {version} is too old; {minimum} or newer is required")
+        logger.error("Upgrade with: uv lock --upgrade-package nuitka && uv sync --extra build")
+        return False
 
-def check_compiler() -> bool:
-    """Verify C compiler is available for Nuitka compilation."""
-    if sys.platform == 'win32':
-        # Check for MSVC (required for Python 3.13)
+    logger.info(f"Nuitka version: {version}")
+    return True
+
+
+@functools.cache
+def _find_visual_studio() -> Path | None:
+    """
+    Locate the latest Visual Studio installation with the x64 C++ tools.
+
+    Queries vswhere.exe (shipped with every VS 2017+ installer) instead of
+    invoking cl.exe, which is only on PATH inside a Developer Command Prompt.
+
+    Returns:
+        Installation root, or None if no suitable installation exists
+    """
+    program_files = os.environ.get('ProgramFiles(x86)', r'C:\Program Files (x86)')
+    vswhere = Path(program_files) / 'Microsoft Visual Studio' / 'Installer' / 'vswhere.exe'
+    if not vswhere.exists():
+        return None
+
+    result = subprocess.run(
+        [
+            str(vswhere),
+            '-latest',
+            '-products', '*',
+            '-requires', VC_TOOLS_COMPONENT,
+            '-property', 'installationPath',
+        ],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    path = result.stdout.strip()
+    return Path(path) if result.returncode == 0 and path else None
+
+
+def _msvc_environment() -> dict[str, str]:
+    """
+    Capture the environment set up by vcvars64.bat.
+
+    Lets the build run from a plain cmd.exe or PowerShell: the variables a
+    Developer Command Prompt would define (PATH, INCLUDE, LIB, ...) are
+    merged into the Nuitka child environment.
+
+    Returns:
+        Environment variables to apply; empty when cl.exe is already on PATH
+        or no Visual Studio installation is found
+    """
+    if shutil.which('cl.exe'):
+        return {}
+
+    vs_path = _find_visual_studio()
+    if vs_path is None:
+        return {}
+
+    vcvars = vs_path / 'VC' / 'Auxiliary' / 'Build' / 'vcvars64.bat'
+    result = subprocess.run(
+        f'"{vcvars}" >nul && set',
+        shell=True,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        logger.warning(f"Failed to load MSVC environment from {vcvars}")
+        return {}
+
+    env = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition('=')
+        if sep and key:
+            env[key] = value
+    return env
+
+
+@functools.cache
+def _find_clang_cl() -> Path | None:
+    """
+    Locate a working clang-cl (LLVM's MSVC-compatible driver).
+
+    Checks PATH first, then the LLVM component bundled with Visual Studio.
+
+    Returns:
+        Path to clang-cl.exe, or None if unavailable
+    """
+    candidates = []
+    if found := shutil.which('clang-cl'):
+        candidates.append(Path(found))
+    vs_path = _find_visual_studio()
+    if vs_path is not None:
+        candidates.append(vs_path / 'VC' / 'Tools' / 'Llvm' / 'x64' / 'bin' / 'clang-cl.exe')
+
+    for candidate in candidates:
         try:
             result = subprocess.run(
-                ['cl.exe'],
+                [str(candidate), '--version'],
                 capture_output=True,
                 text=True,
-                check=False
+                check=True
             )
-            if 'Microsoft' in result.stderr:
-                logger.info("MSVC compiler detected")
-                return True
-        except FileNotFoundError:
-            pass
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            continue
+        if 'clang' in result.stdout.lower():
+            return candidate
+    return None
+
+
+def _use_clang() -> bool:
+    """
+    Whether to compile with clang-cl instead of MSVC's cl.exe.
+
+    clang-cl is markedly faster on Nuitka's many generated C files and is
+    used automatically when installed. Set CCP_USE_CLANG=0 to force MSVC.
+    """
+    if sys.platform != 'win32' or os.environ.get('CCP_USE_CLANG') == '0':
+        return False
+    return _find_clang_cl() is not None
+
+
+@disk_cache(PROBE_CACHE_PATH, ttl=PROBE_CACHE_TTL)
+def check_compiler() -> bool:
+    """Verify C compiler is available for Nuitka compilation."""
+    if sys.platform == 'win32':
+        # Check for MSVC (required for Python 3.13)
+        vs_path = _find_visual_studio()
+        if vs_path is not None:
+            logger.info(f"MSVC build tools detected: {vs_path}")
+            clang_cl = _find_clang_cl()
+            if clang_cl is not None:
+                logger.info(f"clang-cl detected: {clang_cl}")
+            return True
+
+        # No vswhere (e.g. a CI image): accept an MSVC already on PATH, as
+        # in a Developer Command Prompt; the build then keeps that environment
+        cl = shutil.which('cl.exe')
+        if cl is not None:
+            logger.info(f"MSVC compiler detected on PATH: {cl}")
+            return True
         
         logger.error("MSVC compiler not found.")
         logger.error("")
@@ -79,8 +434,6 @@ def check_compiler() -> bool:
         logger.error("  3. Check 'Desktop development with C++'")
         logger.error("  4. IMPORTANT: In 'Individual components', also check:")
         logger.error("     - 'Windows XX SDK' (latest version)")
-        logger.error("")
-        logger.error("Then run build from 'Developer Command Prompt for VS 2022'")
         return False
     
     elif sys.platform == 'darwin':
@@ -118,84 +471,790 @@ def check_compiler() -> bool:
     return False
 
 
-def clean_dist() -> None:
-    """Remove previous build artifacts."""
-    dist_dir = Path('dist')
-    if dist_dir.exists():
-        logger.info("Cleaning previous build artifacts...")
-        shutil.rmtree(dist_dir)
+def _remove_in_background(path: Path) -> None:
+    """
+    Remove a directory without blocking the build.
+
+    The directory is renamed to a trash name (a metadata-only operation)
+    and deleted on a daemon thread while compilation proceeds. Trash left
+    behind by an interrupted run is swept by the next clean_dist().
+
+    Args:
+        path: Directory to remove
+    """
+    trash = path.with_name(f'{path.name}{_TRASH_SUFFIX}{os.getpid()}')
+    try:
+        path.rename(trash)
+    except OSError:
+        # Rename can fail if a file is locked (e.g. running executable on Windows)
+        shutil.rmtree(path)
+        return
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={'ignore_errors': True},
+        name=f'Delete-{path.name}',
+        daemon=True,
+    ).start()
+
+
+def clean_dist(full: bool = False) -> None:
+    """
+    Remove previous build artifacts.
+
+    By default only the final standalone folder is removed. Nuitka's build
+    directory (generated C sources and object files) is preserved so
+    unchanged modules are not recompiled. Removal happens in the background.
+
+    Args:
+        full: Remove the entire dist/ directory (forces a from-scratch build)
+    """
+    for parent in (Path('.'), DIST_DIR):
+        for stale in parent.glob(f'*{_TRASH_SUFFIX}*'):
+            _remove_in_background(stale)
+
+    if not DIST_DIR.exists():
+        return
+
+    if full:
+        logger.info("Cleaning all previous build artifacts...")
+        _remove_in_background(DIST_DIR)
+        return
+
+    logger.info("Cleaning previous executable (keeping compiled modules)...")
+    if APP_DIR.exists():
+        _remove_in_background(APP_DIR)
+
+
+def warm_cache() -> None:
+    """
+    Read dependency sources once so Nuitka's parse phase hits the file cache.
+
+    Reads every .py file of WARM_CACHE_PACKAGES concurrently; the content
+    is discarded. Missing packages are skipped.
+    """
+    sources: list[Path] = []
+    for package in WARM_CACHE_PACKAGES:
+        spec = importlib.util.find_spec(package)
+        if spec is None or not spec.submodule_search_locations:
+            continue
+        for location in spec.submodule_search_locations:
+            sources.extend(Path(location).rglob('*.py'))
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=WARM_CACHE_WORKERS) as executor:
+        list(executor.map(Path.read_bytes, sources))
+    logger.info(f"Warmed file cache with {len(sources)} sources in {time.monotonic() - start:.1f}s")
+
+
+def _parallel_jobs() -> int:
+    """
+    Number of parallel C compile jobs.
+
+    Honors CMAKE_BUILD_PARALLEL_LEVEL, then a -jN/--jobs=N in MAKEFLAGS,
+    then the CPUs this process may run on (respecting affinity masks).
+
+    Returns:
+        Job count (at least 1)
+    """
+    level = os.environ.get('CMAKE_BUILD_PARALLEL_LEVEL', '').strip()
+    if level.isdigit() and int(level) > 0:
+        return int(level)
+
+    match = re.search(r'(?:^|\s)(?:-j\s*|--jobs=)(\d+)', os.environ.get('MAKEFLAGS', ''))
+    if match and int(match.group(1)) > 0:
+        return int(match.group(1))
+
+    return os.process_cpu_count() or 4
+
+
+def _compiler_parallel_flags(release: bool = False) -> list[str]:
+    """
+    Nuitka flags enabling parallel C compilation on the current platform.
+
+    Nuitka forwards --jobs to SCons as -jN. LTO is only enabled for release
+    builds since its link step serializes the otherwise parallel compilation
+    and can double or triple C compile time.
+
+    Args:
+        release: Enable link-time optimization
+
+    Returns:
+        List of Nuitka command-line flags
+    """
+    flags = [
+        f'--jobs={_parallel_jobs()}',  # One compile job per available CPU
+        '--lto=yes' if release else '--lto=no',  # LTO link is single-threaded
+    ]
+    if sys.platform == 'win32':
+        flags.insert(0, '--msvc=latest')  # Force latest MSVC detection (required for Python 3.13)
+        if _use_clang():
+            flags.append('--clang')  # clang-cl front-end against the MSVC headers/libraries
+    if os.environ.get('DEBUG_BUILD'):
+        flags.append('--show-scons')  # Verbose SCons output for diagnosing compile issues
+    return flags
+
+
+def _hints_key() -> str:
+    """Hash of everything that can change the traced module set."""
+    digest = hashlib.sha256(sys.platform.encode())
+    for path in sorted(Path('src').rglob('*.py')) + [Path('uv.lock')]:
+        if path.exists():
+            digest.update(path.as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def produce_hints() -> list[str] | None:
+    """
+    Determine the third-party packages the application actually imports.
+
+    Runs the application's load path in a subprocess and records the
+    top-level packages of every module imported from site-packages. The
+    standard library is always compiled; csv_chart_plotter is loaded from
+    src/, so it is not recorded and _follow_flags() adds it explicitly.
+    Results are cached in hints.json and reused
+    until src/, uv.lock, or the platform change.
+
+    Returns:
+        Sorted package names, or None if the tracing run failed
+    """
+    key = _hints_key()
+    if HINTS_PATH.exists():
+        try:
+            hints = json.loads(HINTS_PATH.read_text(encoding='utf-8'))
+            if hints.get('key') == key:
+                logger.info(f"Using cached import hints: {HINTS_PATH}")
+                return hints['packages']
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    logger.info("Tracing application imports for hinted compilation...")
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, ['src', env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-c', _TRACE_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        logger.warning("Import tracing failed; following all imports instead")
+        logger.warning(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output")
+        return None
+
+    packages = sorted({name.split('.')[0] for name in json.loads(result.stdout)})
+
+    HINTS_PATH.write_text(
+        json.dumps({'key': key, 'packages': packages}, indent=2) + '\n',
+        encoding='utf-8',
+    )
+    logger.info(f"Recorded {len(packages)} imported packages in {HINTS_PATH}")
+    return packages
 
 
-def build_executable() -> int:
+def _required_packages(packages: list[str]) -> set[str]:
+    """
+    Top-level packages installed by the traced packages' distributions.
+
+    Walks the (non-extra) requirements of the distributions providing the
+    traced packages, so dependencies imported only at runtime (e.g.
+    pywebview's GUI backends, which the tracing run never opens) are kept.
+
+    Args:
+        packages: Traced package names from produce_hints()
+
+    Returns:
+        Import names provided by the required distributions
+    """
+    def normalize(name: str) -> str:
+        return re.sub(r'[-_.]+', '-', name).lower()
+
+    providers = importlib.metadata.packages_distributions()
+    pending = [dist for package in packages for dist in providers.get(package, [])]
+    required: set[str] = set()
+    while pending:
+        dist = normalize(pending.pop())
+        if dist in required:
+            continue
+        required.add(dist)
+        try:
+            requirements = importlib.metadata.requires(dist) or []
+        except importlib.metadata.PackageNotFoundError:
+            continue  # Not installed on this platform
+        for requirement in requirements:
+            if 'extra ==' not in requirement:
+                pending.append(re.match(r'[A-Za-z0-9._-]+', requirement).group(0))
+    return {
+        package for package, dists in providers.items()
+        if any(normalize(dist) in required for dist in dists)
+    }
+
+
+def _hinted_follow_flags(packages: list[str]) -> list[str]:
+    """
+    Nuitka flags following the traced packages and no other installed ones.
+
+    --nofollow-imports cannot be combined with --standalone (it overrides
+    every other inclusion option), so installed top-level packages that are
+    neither traced nor required by a traced package (test tools, Nuitka,
+    optional pandas/plotly backends) are excluded one by one instead.
+
+    Args:
+        packages: Traced package names from produce_hints()
+
+    Returns:
+        List of --follow-import-to/--nofollow-import-to flags
+    """
+    kept = set(packages) | _required_packages(packages) | {'csv_chart_plotter'}
+    installed = {name for name in importlib.metadata.packages_distributions() if name.isidentifier()}
+    unused = sorted(installed - kept)
+    return [
+        *[f'--follow-import-to={package}' for package in packages],
+        *[f'--nofollow-import-to={package}' for package in unused],
+    ]
+
+
+def _follow_flags() -> list[str]:
+    """
+    Nuitka flags controlling which imports are followed into the build.
+
+    With import hints available, only the application and the traced
+    packages are followed; optional imports of other installed packages
+    (guarded by try/except in pandas, plotly, etc.) are left out. Without
+    hints, all imports are followed.
+
+    Returns:
+        List of Nuitka command-line flags
+    """
+    packages = produce_hints()
+    if packages is None:
+        return ['--follow-imports']
+    return ['--follow-import-to=csv_chart_plotter', *_hinted_follow_flags(packages)]
+
+
+def _import_pruning_flags() -> list[str]:
+    """
+    Nuitka flags restricting compilation to modules the application uses.
+
+    Returns:
+        List of --include-module/--include-package/--nofollow-import-to flags
+    """
+    flags = [f'--include-module={module}' for module in INCLUDED_MODULES]
+    flags.extend(f'--include-package={package}' for package in INCLUDED_PACKAGES)
+    for package, subpackages in EXCLUDED_SUBPACKAGES.items():
+        flags.extend(
+            f'--nofollow-import-to={package}.{subpackage}' for subpackage in subpackages
+        )
+    return flags
+
+
+def _low_priority_popen_kwargs() -> dict:
+    """
+    Popen keyword arguments that start the child at reduced CPU priority.
+
+    Below-normal priority class on Windows. Elsewhere the child is started
+    normally and reniced by _lower_priority(): preexec_fn is unsafe once
+    this process has threads (background dist/ deletion, preflight probes).
+    The build still uses all idle CPU but yields to interactive work.
+    """
+    if sys.platform == 'win32':
+        return {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+    return {}
+
+
+def _lower_priority(pid: int) -> None:
+    """
+    Renice a just-started child by +10 (POSIX; no-op on Windows).
+
+    Compiler processes Nuitka starts later inherit the lowered priority.
+
+    Args:
+        pid: Child process ID
+    """
+    if sys.platform == 'win32':
+        return
+    try:
+        niceness = os.getpriority(os.PRIO_PROCESS, 0) + 10
+        os.setpriority(os.PRIO_PROCESS, pid, min(niceness, 19))
+    except OSError as e:
+        logger.warning(f"Could not lower compiler priority: {e}")
+
+
+def build_executable(
+    release: bool = False, nice: bool = False, split: bool = False
+) -> Path | None:
     """
     Compile application using Nuitka.
 
+    Args:
+        release: Build with link-time optimization
+        nice: Run the compiler at reduced CPU priority
+        split: Build only the dependency (support) layer from the root
+            main.py launcher, leaving csv_chart_plotter to build_app_module()
+
     Returns:
-        Exit code (0 = success, non-zero = failure)
+        Path of the built executable, or None if compilation failed
     """
     logger.info("Starting Nuitka compilation...")
+
+    if split:
+        packages = produce_hints()
+        if packages is None:
+            logger.error("Split builds require import hints; tracing failed")
+            return None
+        # The launcher does not import the dependencies itself, so force them in
+        follow_flags = [
+            '--nofollow-import-to=csv_chart_plotter',
+            *_hinted_follow_flags(packages),
+            *[f'--include-module={package}' for package in packages],
+        ]
+        entry_point = 'main.py'  # Launcher: from csv_chart_plotter.main import main
+    else:
+        follow_flags = [
+            *_follow_flags(),  # Follow only packages recorded by the tracing run
+            '--include-package-data=csv_chart_plotter',  # Dash assets (styles.css, chart.js)
+        ]
+        entry_point = 'src/csv_chart_plotter/main.py'
     
     # Nuitka command with required flags
     cmd = [
         sys.executable, '-m', 'nuitka',
-        '--standalone',  # Bundle all dependencies
-        '--onefile',  # Single executable file
-        '--enable-plugin=no-qt',  # Disable Qt plugin auto-detection
-        '--follow-imports',  # Include all imported modules
-        '--include-package=pandas',  # Required: pandas data structures
-        '--include-package=plotly',  # Required: chart rendering
-        '--include-package=dash',  # Required: web framework
-        '--include-package=flask',  # Required: Dash dependency
-        '--include-package=werkzeug',  # Required: Flask dependency
+        '--standalone',  # Bundle all dependencies (folder; no onefile unpack at startup)
+        *[f'--enable-plugin={plugin}' for plugin in NUITKA_PLUGINS],
+        *follow_flags,
+        *_import_pruning_flags(),  # Entry modules and unused subpackage exclusions
         '--include-package-data=plotly',  # Include plotly data files
         '--include-package-data=dash',  # Include dash data files
+        *[f'--noinclude-data-files={pattern}' for pattern in EXCLUDED_DATA_FILES],
         '--nofollow-import-to=pytest',  # Exclude test framework
         '--nofollow-import-to=unittest',  # Exclude test framework
         '--nofollow-import-to=test',  # Exclude test modules
         '--windows-console-mode=disable',  # No console window on Windows
+        '--python-flag=no_site',  # Skip site.py / usercustomize initialization
+        '--python-flag=no_warnings',  # Drop warnings machinery setup at startup
+        '--python-flag=-O',  # Strip asserts, as with python -O
         '--output-dir=dist',  # Output directory
-        '--output-filename=csv-chart-plotter.exe',  # Executable name
+        f'--output-filename={EXECUTABLE_NAME}',  # Executable name
+        f'--report={REPORT_PATH}',  # Module inclusion report for analyze_report()
+        '--noinclude-dlls=*sqlite3*',  # Never copy unused SQLite DLLs
+        '--noinclude-dlls=*tcl86t*',  # Never copy unused Tcl/Tk DLLs
+        '--noinclude-dlls=*tk86t*',
     ]
     
     # Platform-specific compiler flags
+    cmd.extend(_compiler_parallel_flags(release))
     if sys.platform == 'win32':
-        cmd.extend([
-            '--msvc=latest',  # Force latest MSVC detection (required for Python 3.13)
-            '--jobs=1',  # Disable parallel compilation (prevents SCons environment inheritance issues)
-        ])
-    
-    cmd.append('src/csv_chart_plotter/main.py')  # Entry point
+        cmd.append('--assume-yes-for-downloads')  # Avoid interactive prompts for dependency tools
+    elif sys.platform == 'darwin':
+        cmd.append('--macos-create-app-bundle')  # .app bundle instead of a bare folder
+        cmd.append('--macos-app-mode=gui')  # Regular Dock application
     
+    cmd.append(entry_point)
+
+    if _run_nuitka(cmd, nice) != 0:
+        return None
+    return EXECUTABLE_PATH
+
+
+def build_app_module(nice: bool = False) -> int:
+    """
+    Compile only the csv_chart_plotter package as an extension module.
+
+    Used by split builds: the compiled package and its assets are copied
+    into the standalone folder built by build_executable(split=True), so a
+    source-only change recompiles a handful of modules instead of every
+    dependency.
+
+    Args:
+        nice: Run the compiler at reduced CPU priority
+
+    Returns:
+        Exit code (0 = success, non-zero = failure)
+    """
+    logger.info("Compiling application package module...")
+    cmd = [
+        sys.executable, '-m', 'nuitka',
+        '--module',
+        'src/csv_chart_plotter',
+        '--include-package=csv_chart_plotter',
+        f'--output-dir={APP_MODULE_DIR}',
+        *_compiler_parallel_flags(),
+    ]
+    returncode = _run_nuitka(cmd, nice, log_path=APP_MODULE_LOG_PATH)
+    if returncode != 0:
+        return returncode
+
+    for module_file in APP_MODULE_DIR.glob('csv_chart_plotter.*'):
+        if module_file.suffix in ('.pyd', '.so'):
+            shutil.copy2(module_file, STANDALONE_DIR / module_file.name)
+    shutil.copytree(
+        Path('src/csv_chart_plotter/assets'),
+        STANDALONE_DIR / 'csv_chart_plotter' / 'assets',
+        dirs_exist_ok=True,
+    )
+    return 0
+
+
+def _support_inputs_sha(release: bool = False) -> str:
+    """Hash of inputs that affect the dependency (support) layer of a split build."""
+    digest = hashlib.sha256(f'{sys.platform}|{release}'.encode())
+    for path in [Path('uv.lock'), Path('pyproject.toml'), Path('main.py'), Path(__file__)]:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_split(release: bool = False, nice: bool = False) -> Path | None:
+    """
+    Two-stage build: cached dependency layer plus a fresh application module.
+
+    The standalone support layer is rebuilt only when dependencies or the
+    build configuration change; the application package is recompiled
+    every time.
+
+    Args:
+        release: Build with link-time optimization
+        nice: Run the compiler at reduced CPU priority
+
+    Returns:
+        Path of the built executable, or None if compilation failed
+    """
+    support_sha = _support_inputs_sha(release)
+    if (
+        EXECUTABLE_PATH.exists()
+        and SUPPORT_SHA_PATH.exists()
+        and SUPPORT_SHA_PATH.read_text(encoding='utf-8').strip() == support_sha
+    ):
+        logger.info("Dependency layer unchanged; reusing cached support build")
+    else:
+        clean_dist()
+        SUPPORT_SHA_PATH.unlink(missing_ok=True)
+        if build_executable(release=release, nice=nice, split=True) is None:
+            return None
+        SUPPORT_SHA_PATH.write_text(support_sha + '\n', encoding='utf-8')
+
+    if build_app_module(nice=nice) != 0:
+        return None
+    return EXECUTABLE_PATH
+
+
+def _run_nuitka(cmd: list[str], nice: bool = False, log_path: Path = BUILD_LOG_PATH) -> int:
+    """
+    Run a Nuitka command with the build environment and filtered output.
+
+    Args:
+        cmd: Full Nuitka command line
+        nice: Run the compiler at reduced CPU priority
+        log_path: File receiving the complete, unfiltered output
+
+    Returns:
+        Nuitka exit code
+    """
     logger.info("Nuitka command:")
     logger.info(" ".join(cmd))
+
+    # Keep Nuitka's compilation cache in a stable location so object files
+    # are reused between runs (and survive a --clean of dist/)
+    env = os.environ.copy()
+    env['NUITKA_CACHE_DIR'] = str(NUITKA_CACHE_DIR.resolve())
+    # Reproducible output: fixed embedded timestamps, hash ordering, timezone
+    env['SOURCE_DATE_EPOCH'] = _source_date_epoch()
+    env['PYTHONHASHSEED'] = '0'
+    env['TZ'] = 'UTC'
+    if sys.platform == 'win32':
+        env.update(_msvc_environment())
+        env['CL'] = '/MP'  # Let cl.exe compile multiple sources per invocation in parallel
     
+    DIST_DIR.mkdir(exist_ok=True)
+    with log_path.open('w', encoding='utf-8') as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors='replace',
+            **(_low_priority_popen_kwargs() if nice else {}),
+        )
+        if nice:
+            _lower_priority(proc.pid)
+        reader = threading.Thread(
+            target=_stream_output,
+            args=(proc.stdout, log_file),
+            name='NuitkaOutput',
+            daemon=True,
+        )
+        reader.start()
+        returncode = proc.wait()
+        reader.join()
+
+    if returncode != 0:
+        logger.error(f"Compilation failed with exit code {returncode} (see {log_path})")
+    return returncode
+
+
+def _stream_output(stream, log_file) -> None:
+    """
+    Copy Nuitka output to the build log and a filtered, batched console view.
+
+    Every line goes to the log. The console skips debug lines, keeps only
+    the latest state of consecutive progress-bar lines, and is written at
+    most once per OUTPUT_FLUSH_INTERVAL, so a slow console cannot stall
+    the build.
+
+    Args:
+        stream: Nuitka stdout (text mode)
+        log_file: Open build log file
+    """
+    pending: list[str] = []
+    last_flush = time.monotonic()
+
+    for line in stream:
+        log_file.write(line)
+
+        if _DEBUG_LINE.match(line):
+            continue
+        if pending and _PROGRESS_LINE.match(line) and _PROGRESS_LINE.match(pending[-1]):
+            pending[-1] = line
+        else:
+            pending.append(line)
+
+        now = time.monotonic()
+        if now - last_flush >= OUTPUT_FLUSH_INTERVAL:
+            sys.stdout.writelines(pending)
+            sys.stdout.flush()
+            pending.clear()
+            last_flush = now
+
+    sys.stdout.writelines(pending)
+    sys.stdout.flush()
+
+
+def _source_date_epoch() -> str:
+    """
+    Timestamp embedded in the build, stable for a given source revision.
+
+    Uses the last commit time so every checkout of the same revision
+    produces the same value; falls back to the entry point's mtime
+    outside a git checkout.
+    """
     try:
         result = subprocess.run(
-            cmd,
-            check=True,
+            ['git', 'log', '-1', '--format=%ct'],
+            capture_output=True,
             text=True,
-            # Stream output to console
-            stdout=sys.stdout,
-            stderr=sys.stderr
+            check=True,
         )
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Compilation failed with exit code {e.returncode}")
-        return e.returncode
-
-
-def verify_executable() -> bool:
-    """Check that executable was created successfully."""
-    exe_path = Path('dist/csv-chart-plotter.exe')
-    if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
-        logger.info(f"Executable created: {exe_path}")
-        logger.info(f"Size: {size_mb:.2f} MB")
+        if result.stdout.strip():
+            return result.stdout.strip()
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        pass
+    return str(int(Path('src/csv_chart_plotter/main.py').stat().st_mtime))
+
+
+def build_inputs_sha(release: bool = False, split: bool = False, upx: bool = False) -> str:
+    """
+    Hash every input that affects the build output.
+
+    Covers the application sources and assets, project metadata, the
+    dependency lockfile, this script, and the build type.
+
+    Args:
+        release: Whether this is a release (LTO) build
+        split: Whether this is a split (support layer + app module) build
+        upx: Whether the executable is UPX-compressed
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(f'{release}|{split}|{upx}'.encode())
+    inputs = [
+        path for path in sorted(Path('src').rglob('*'))
+        if path.is_file() and '__pycache__' not in path.parts
+    ]
+    inputs += [Path('pyproject.toml'), Path('uv.lock'), Path('main.py'), Path(__file__)]
+    for path in inputs:
+        if path.exists():
+            digest.update(path.as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _source_uses_tls() -> bool:
+    """Check whether any application module imports ssl."""
+    pattern = re.compile(r'^\s*(?:import|from)\s+ssl\b', re.MULTILINE)
+    return any(
+        pattern.search(path.read_text(encoding='utf-8'))
+        for path in Path('src').rglob('*.py')
+    )
+
+
+def prune_unused_dlls() -> None:
+    """
+    Delete stdlib extension modules and DLLs the application never loads.
+
+    Nuitka copies these into the standalone folder regardless of usage;
+    removing them shrinks the distribution and the files scanned at startup.
+    """
+    patterns = list(UNUSED_BINARIES)
+    if not _source_uses_tls():
+        patterns.extend(TLS_BINARIES)
+
+    removed = 0
+    for pattern in patterns:
+        for path in STANDALONE_DIR.glob(pattern):
+            path.unlink(missing_ok=True)
+            removed += 1
+
+    logger.info(f"Pruned {removed} unused binaries from {STANDALONE_DIR}")
+
+
+def verify_executable(exe_path: Path) -> bool:
+    """
+    Check that executable was created successfully.
+
+    Args:
+        exe_path: Executable path returned by the build
+    """
+    try:
+        size_mb = os.stat(exe_path).st_size / (1024 * 1024)
+    except FileNotFoundError:
+        logger.error(f"Executable not found in {exe_path.parent}/")
+        return False
+
+    logger.info(f"Executable created: {exe_path}")
+    logger.info(f"Size: {size_mb:.2f} MB")
+    return True
+
+
+def compress_artifact(exe_path: Path) -> bool:
+    """
+    Compress the executable in place with UPX (LZMA).
+
+    Shrinks the shipped executable severalfold for a one-time decompression
+    cost at startup. Skipped with a warning when UPX is not installed, and
+    on macOS where compressed binaries break code signing. An executable
+    that is already packed (a split build reusing its cached support layer)
+    is left as is.
+
+    Args:
+        exe_path: Executable path returned by the build
+
+    Returns:
+        False if UPX is installed but compression failed
+    """
+    if sys.platform == 'darwin':
+        logger.info("Skipping UPX compression on macOS (incompatible with code signing)")
         return True
-    else:
-        logger.error("Executable not found in dist/")
+
+    upx = shutil.which('upx')
+    if upx is None:
+        logger.warning("UPX not found; skipping executable compression")
+        return True
+
+    # upx -t succeeds only for a valid UPX-packed file
+    packed = subprocess.run(
+        [upx, '-t', '-q', str(exe_path)],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if packed.returncode == 0:
+        logger.info("Executable already UPX-compressed; skipping")
+        return True
+
+    before_mb = os.stat(exe_path).st_size / (1024 * 1024)
+    result = subprocess.run(
+        [upx, '--best', '--lzma', str(exe_path)],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        logger.error(f"UPX compression failed:\n{result.stderr.strip()}")
         return False
 
+    after_mb = os.stat(exe_path).st_size / (1024 * 1024)
+    logger.info(f"Size: {before_mb:.2f} MB -> {after_mb:.2f} MB (UPX)")
+    return True
+
+
+def analyze_report(top: int = 20) -> None:
+    """
+    Log the largest compiled modules from the Nuitka compilation report.
+
+    Used to keep EXCLUDED_SUBPACKAGES current: large modules that the
+    application never imports are candidates for exclusion.
+
+    Args:
+        top: Number of modules to list
+    """
+    if not REPORT_PATH.exists():
+        logger.warning(f"Compilation report not found: {REPORT_PATH}")
+        return
+
+    placeholders = {
+        '${sys.prefix}': sys.prefix,
+        '${sys.real_prefix}': sys.base_prefix,
+        '${cwd}': os.getcwd(),
+    }
+
+    module_sizes: list[tuple[int, str]] = []
+    for module in ET.parse(REPORT_PATH).getroot().iter('module'):
+        source_path = module.get('source_path')
+        if not source_path:
+            continue
+        for placeholder, value in placeholders.items():
+            source_path = source_path.replace(placeholder, value)
+        try:
+            size = os.stat(source_path).st_size
+        except OSError:
+            continue
+        module_sizes.append((size, module.get('name', '?')))
+
+    module_sizes.sort(reverse=True)
+    logger.info(f"Largest {top} of {len(module_sizes)} compiled modules (source size):")
+    for size, name in module_sizes[:top]:
+        logger.info(f"  {size / 1024:8.1f} KB  {name}")
+
+
+def package_installer() -> bool:
+    """
+    Package the standalone folder into a Windows installer via NSIS.
+
+    Skipped (successfully) on non-Windows platforms or when makensis is
+    not installed.
+
+    Returns:
+        False only if makensis ran and failed
+    """
+    if sys.platform != 'win32':
+        logger.info("Skipping installer packaging (Windows only)")
+        return True
+
+    makensis = shutil.which('makensis')
+    if makensis is None:
+        logger.warning("makensis not found; skipping installer. Install NSIS from https://nsis.sourceforge.io/")
+        return True
+
+    with open('pyproject.toml', 'rb') as f:
+        version = tomllib.load(f)['project']['version']
+
+    logger.info(f"Packaging installer (version {version})...")
+    result = subprocess.run(
+        [makensis, f'/DVERSION={version}', str(INSTALLER_SCRIPT)],
+        check=False,
+    )
+    if result.returncode != 0:
+        logger.error(f"Installer packaging failed with exit code {result.returncode}")
+        return False
+
+    logger.info(f"Installer created: {DIST_DIR / f'csv-chart-plotter-{version}-setup.exe'}")
+    return True
+
 
 def main() -> int:
     """
@@ -204,30 +1263,93 @@ def main() -> int:
     Returns:
         Exit code (0 = success, 1 = failure)
     """
+    parser = argparse.ArgumentParser(
+        description="Build CSV Chart Plotter standalone executable",
+    )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help="Remove all previous build artifacts before compiling",
+    )
+    parser.add_argument(
+        '--release',
+        action='store_true',
+        help="Enable link-time optimization (slower build, faster binary)",
+    )
+    parser.add_argument(
+        '--nice',
+        action=argparse.BooleanOptionalAction,
+        default=not os.environ.get('CI'),
+        help="Compile at reduced CPU priority (default: on, off when CI is set)",
+    )
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help="Cache the dependency layer and recompile only the application package",
+    )
+    parser.add_argument(
+        '--upx',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Compress the executable with UPX (default: on for --release builds)",
+    )
+    args = parser.parse_args()
+    if args.upx is None:
+        args.upx = args.release
+
     logger.info("=== CSV Chart Plotter Build Script ===")
+
+    # Skip entirely when nothing that affects the output has changed
+    inputs_sha = build_inputs_sha(release=args.release, split=args.split, upx=args.upx)
+    if (
+        not args.clean
+        and EXECUTABLE_PATH.exists()
+        and INPUT_SHA_PATH.exists()
+        and INPUT_SHA_PATH.read_text(encoding='utf-8').strip() == inputs_sha
+    ):
+        logger.info("Build inputs unchanged since last build; nothing to do")
+        return 0
     
-    # Pre-flight checks
-    if not check_nuitka():
-        return 1
-    
-    if not check_compiler():
-        return 1
-    
-    # Clean previous builds
-    clean_dist()
+    # Pre-flight checks (independent subprocess probes, run concurrently)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        nuitka_ok = executor.submit(check_nuitka)
+        compiler_ok = executor.submit(check_compiler)
+        if not (nuitka_ok.result() and compiler_ok.result()):
+            return 1
     
+    warm_cache()
+
     # Compile with Nuitka
-    result = build_executable()
-    if result != 0:
+    INPUT_SHA_PATH.unlink(missing_ok=True)
+    if args.split:
+        if args.clean:
+            clean_dist(full=True)
+        exe_path = build_split(release=args.release, nice=args.nice)
+    else:
+        clean_dist(full=args.clean)
+        exe_path = build_executable(release=args.release, nice=args.nice)
+    if exe_path is None:
         logger.error("Build failed")
         return 1
+
+    prune_unused_dlls()
     
     # Verify output
-    if not verify_executable():
+    if not verify_executable(exe_path):
+        return 1
+
+    if args.upx and not compress_artifact(exe_path):
         return 1
+
+    analyze_report()
+
+    if not package_installer():
+        return 1
+
+    INPUT_SHA_PATH.write_text(inputs_sha + '\n', encoding='utf-8')
     
     logger.info("=== Build completed successfully ===")
-    logger.info("Run: dist\\csv-chart-plotter.exe sample.csv")
+    logger.info(f"Run: {exe_path} sample.csv")
     return 0
 
 
@@ -0,0 +1,166 @@
+/* CSV Chart Plotter - Clientside callbacks */
+
+// Quiet period before a zoom/pan is forwarded to the server
+const VIEWPORT_DEBOUNCE_MS = 150;
+let pendingViewport = null;
+
+// Plotly typed array spec dtypes (see _to_typed_array in chart_app.py)
+const TYPED_ARRAYS = {
+    f8: Float64Array, f4: Float32Array,
+    i4: Int32Array, u4: Uint32Array,
+    i2: Int16Array, u2: Uint16Array,
+    i1: Int8Array, u1: Uint8Array,
+};
+
+/* Decode a {dtype, bdata} spec (or plain array) into a typed array. */
+function decodeTypedArray(values, dtype) {
+    if (values && values.bdata !== undefined) {
+        const binary = atob(values.bdata);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new TYPED_ARRAYS[values.dtype](bytes.buffer);
+    }
+    return TYPED_ARRAYS[dtype].from(values || []);
+}
+
+/* Encode a typed array as a {dtype, bdata} spec. */
+function encodeTypedArray(values, dtype) {
+    const bytes = new Uint8Array(values.buffer, values.byteOffset, values.byteLength);
+    let binary = '';
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return {dtype: dtype, bdata: btoa(binary)};
+}
+
+/* Append a tail spec to a trace array, keeping the figure JSON-serializable. */
+function appendTypedArray(values, tail) {
+    const head = decodeTypedArray(values, tail.dtype);
+    const extra = decodeTypedArray(tail);
+    const joined = new TYPED_ARRAYS[tail.dtype](head.length + extra.length);
+    joined.set(head);
+    joined.set(extra, head.length);
+    return encodeTypedArray(joined, tail.dtype);
+}
+
+/*
+ * View-only figure updates run in the browser: the figure is never sent to
+ * the server. Each function returns a shallow copy of the figure so Dash's
+ * stored figure stays in sync with what Plotly renders; trace arrays are
+ * shared, not copied.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    chart: {
+        /* Switch between box-zoom and pan drag modes. */
+        setDragmode: function (dragmode, figure) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            return {...figure, layout: {...figure.layout, dragmode: dragmode}};
+        },
+
+        /*
+         * Forward viewport changes to the server once interaction settles.
+         *
+         * Scroll zoom emits a relayout event per wheel step; only the last
+         * one within VIEWPORT_DEBOUNCE_MS reaches the Y-range callback, and
+         * superseded events resolve to no_update. Resets (double-click,
+         * autosize) restore Y autorange directly and are forwarded at once,
+         * so the server stops extending a range the user has reset.
+         */
+        debounceViewport: function (relayoutData, figure) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!relayoutData) {
+                return [noUpdate, noUpdate];
+            }
+
+            // A newer event supersedes any viewport still waiting to settle
+            if (pendingViewport) {
+                clearTimeout(pendingViewport.timer);
+                pendingViewport.resolve([noUpdate, noUpdate]);
+                pendingViewport = null;
+            }
+
+            const isReset = relayoutData['xaxis.autorange'] === true
+                || relayoutData.autosize === true;
+            if (isReset) {
+                const layout = (figure && figure.layout) || {};
+                const yaxis = layout.yaxis || {};
+                if (!figure || (yaxis.autorange === true && yaxis.range === undefined)) {
+                    return [relayoutData, noUpdate];
+                }
+                const {range, ...autoYaxis} = yaxis;
+                return [relayoutData, {
+                    ...figure,
+                    layout: {...layout, yaxis: {...autoYaxis, autorange: true}},
+                }];
+            }
+
+            return new Promise((resolve) => {
+                const timer = setTimeout(() => {
+                    pendingViewport = null;
+                    resolve([relayoutData, noUpdate]);
+                }, VIEWPORT_DEBOUNCE_MS);
+                pendingViewport = {timer: timer, resolve: resolve};
+            });
+        },
+
+        /*
+         * Append follow-mode points streamed by the server.
+         *
+         * The tail holds only the points added to each trace since the last
+         * tick, so the full arrays are not resent over the network.
+         */
+        appendTail: function (tail, figure) {
+            if (!tail || !figure || !figure.data) {
+                return window.dash_clientside.no_update;
+            }
+            const data = figure.data.map((trace, i) => ({
+                ...trace,
+                x: appendTypedArray(trace.x, tail.x[i]),
+                y: appendTypedArray(trace.y, tail.y[i]),
+            }));
+            let layout = figure.layout;
+            if (tail.range) {
+                layout = {...layout, xaxis: {...layout.xaxis, range: tail.range}};
+            }
+            return {...figure, data: data, layout: layout};
+        },
+
+        /* Apply theme colors to the app container, chart layout and traces. */
+        setTheme: function (theme, figure, themes) {
+            const colors = themes[theme];
+            const style = {backgroundColor: colors.bg};
+            if (!figure) {
+                return [theme, style, window.dash_clientside.no_update];
+            }
+
+            const recolorAxis = (axis) => ({
+                ...axis,
+                gridcolor: colors.grid,
+                linecolor: colors.grid,
+                zerolinecolor: colors.grid,
+            });
+            const layout = figure.layout || {};
+            const data = (figure.data || []).map((trace, i) => ({
+                ...trace,
+                line: {...trace.line, color: colors.palette[i % colors.palette.length]},
+            }));
+
+            return [theme, style, {
+                ...figure,
+                data: data,
+                layout: {
+                    ...layout,
+                    paper_bgcolor: colors.bg,
+                    plot_bgcolor: colors.bg,
+                    font: {color: colors.text, family: colors.font},
+                    xaxis: recolorAxis(layout.xaxis),
+                    yaxis: recolorAxis(layout.yaxis),
+                },
+            }];
+        },
+    },
+});
@@ -5,26 +5,45 @@ Creates a ScatterGL chart with LTTB downsampling for efficient rendering
 of arbitrarily large datasets.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
+import base64
+import copy
+import dataclasses
+import functools
 import logging
+import time
 
 import dash
-from dash import dcc, html, Input, Output, State, no_update
-import plotly.graph_objects as go
+from dash import dcc, html, ClientsideFunction, Input, Output, State, Patch, no_update
 import pandas as pd
 import numpy as np
 
-from .lttb import lttb_downsample, compute_lttb_indices, DEFAULT_MINMAX_RATIO
-from .palettes import get_trace_color, LIGHT_PALETTE, DARK_PALETTE
+try:
+    import webview
+except ImportError:  # Headless or plain-browser use: no native file dialog
+    webview = None
+
+from .lttb import (
+    compute_lttb_indices,
+    compute_lttb_indices_batch,
+    DEFAULT_MINMAX_RATIO,
+)
+from .column_filter import NUMERIC_DTYPES, filter_numeric_columns
+from .csv_indexer import CSVIndexer
+from .palettes import get_trace_colors, LIGHT_PALETTE, DARK_PALETTE
 
 logger = logging.getLogger(__name__)
 
 MAX_DISPLAY_POINTS = 4000
 MINMAX_RATIO = DEFAULT_MINMAX_RATIO  # MinMaxLTTB preselection ratio
 FOLLOW_INTERVAL_MS = 5000
-TAIL_THRESHOLD_RATIO = 0.05
 TAIL_THRESHOLD_MAX = 100_000
+# Binary array dtypes decoded by plotly.js (typed array spec)
+TYPED_ARRAY_DTYPES = frozenset({"f8", "f4", "i4", "u4", "i2", "u2", "i1", "u1"})
+FONT_FAMILY = "Roboto, Helvetica, Arial, sans-serif"
+LTTB_REBUILD_RATIO = 0.05  # Full re-downsample once appended rows exceed this fraction
 
 
 def create_app(
@@ -64,11 +83,25 @@ def create_app(
     app._csv_filepath = csv_filepath
     app._pywebview_window = None  # Set by main.py after window creation
     app._current_df = df  # Store DataFrame for Y-axis auto-scaling on X zoom
+    # Indexed rows covered by _current_df; follow mode reads only rows past this
+    app._current_row_count = (
+        indexer.index.row_count if indexer is not None and indexer.index is not None else None
+    )
+    app._lttb_cache = {}  # Per-column downsampling indices, reused across follow ticks
+    app._legend_visibility = {}  # Trace name -> legend visibility, kept by handle_legend_toggle
+    app._plotted_indices = None  # Row indices shown per trace after a follow patch; None if unknown
+    # What the browser shows, so callbacks need not upload the figure:
+    # trace names in order, and the explicit x-axis range (None: autorange)
+    app._trace_names = list(df.columns) if df is not None else []
+    app._x_range = None
+    # Follow mode reads and downsamples the next tick's data in the background
+    app._follow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="follow")
+    app._follow_future = None
 
     # Build initial figure
     if df is not None and not df.empty:
         x_values = _get_x_values(df)
-        figure = create_figure(df, x_values, theme)
+        figure = create_figure(df, x_values, theme, lttb_cache=app._lttb_cache)
         latest_timestamp = _format_timestamp(df.index[-1])
         has_data = True
     else:
@@ -88,11 +121,15 @@ def create_app(
         children=[
             # Stores for state management
             dcc.Store(id="theme-store", data=theme),
+            dcc.Store(  # Static colors for the clientside theme callback
+                id="theme-colors-store",
+                data={name: _theme_spec(name) for name in ("light", "dark")},
+            ),
             dcc.Store(id="dragmode-store", data="zoom"),  # Default to box-zoom
             dcc.Store(id="follow-active-store", data=follow_mode),
-            dcc.Store(id="legend-state-store", data={}),
-            dcc.Store(id="viewport-store", data={}),
-            dcc.Store(id="last-render-time-store", data=0),
+            dcc.Store(id="relayout-debounced-store", data=None),  # Settled relayoutData
+            dcc.Store(id="last-render-time-store", data=0),  # Monotonic ms (int)
+            dcc.Store(id="follow-tail-store", data=None),  # Points appended per trace
             dcc.Store(id="selected-file-store", data=None),  # For file dialog result
 
             # Control bar
@@ -202,55 +239,36 @@ def create_app(
     # Callbacks
     # -------------------------------------------------------------------------
 
-    @app.callback(
+    # Theme and drag mode only change how the figure is drawn, so they are
+    # handled in the browser (assets/chart.js) without a server round-trip
+    app.clientside_callback(
+        ClientsideFunction(namespace="chart", function_name="setTheme"),
         Output("app-container", "data-theme"),
         Output("app-container", "style"),
         Output("main-chart", "figure", allow_duplicate=True),
         Input("theme-dropdown", "value"),
         State("main-chart", "figure"),
+        State("theme-colors-store", "data"),
         prevent_initial_call=True,
     )
-    def update_theme(new_theme: str, current_figure: dict) -> tuple[str, dict, dict]:
-        """Update theme across the application."""
-        # Update background color based on theme
-        bg_color = "#1a1a1a" if new_theme == "dark" else "#ffffff"
-        style = {"backgroundColor": bg_color}
-        
-        if current_figure is None:
-            return new_theme, style, no_update
 
-        # Update figure colors for new theme
-        updated_figure = _update_figure_theme(current_figure, new_theme)
-        return new_theme, style, updated_figure
-
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="chart", function_name="setDragmode"),
         Output("main-chart", "figure", allow_duplicate=True),
         Input("dragmode-dropdown", "value"),
         State("main-chart", "figure"),
         prevent_initial_call=True,
     )
-    def update_dragmode(new_dragmode: str, current_figure: dict) -> dict:
-        """Update chart drag interaction mode (zoom or pan)."""
-        if current_figure is None:
-            return no_update
-        
-        updated_figure = dict(current_figure)
-        if "layout" in updated_figure:
-            layout = dict(updated_figure["layout"])
-            layout["dragmode"] = new_dragmode
-            updated_figure["layout"] = layout
-        
-        return updated_figure
 
     @app.callback(
         Output("main-chart", "figure", allow_duplicate=True),
         Output("status-text", "children", allow_duplicate=True),
         Output("last-render-time-store", "data", allow_duplicate=True),
+        Output("follow-tail-store", "data"),
         Input("follow-interval", "n_intervals"),
         State("follow-checkbox", "value"),
         State("theme-dropdown", "value"),
         State("dragmode-dropdown", "value"),
-        State("main-chart", "figure"),
         State("last-render-time-store", "data"),
         prevent_initial_call=True,
     )
@@ -259,75 +277,80 @@ def create_app(
         follow_value: list,
         current_theme: str,
         current_dragmode: str,
-        current_figure: dict,
-        last_render_time: float,
+        last_render_time: int,
     ) -> tuple:
         """
         Handle follow mode data refresh.
 
+        The figure is not uploaded from the browser: its trace names and
+        x range are kept in app state, so each tick costs O(new rows) on
+        the network in both directions.
+
         Viewport behavior depends on the current drag mode:
         - Pan mode: Keep the time window width constant and slide the viewport
           to show the latest data (both start and end times shift equally).
         - Zoom mode: Preserve the start time, extend the end time to include
           the latest data point.
         """
-        import time
-
         # Skip if follow mode not active
         if not follow_value or "follow" not in follow_value:
-            return no_update, no_update, no_update
+            return no_update, no_update, no_update, no_update
 
         # Skip if no indexer
         if app._csv_indexer is None:
-            return no_update, no_update, no_update
+            return no_update, no_update, no_update, no_update
 
         # Debounce check (completion-based: compare against last render completion time)
-        current_time = time.time()
-        if current_time - last_render_time < (FOLLOW_INTERVAL_MS / 1000):
-            return no_update, no_update, no_update
+        # Monotonic integer milliseconds: immune to wall-clock jumps and
+        # stored as a JSON int
+        if _monotonic_ms() - last_render_time < FOLLOW_INTERVAL_MS:
+            return no_update, no_update, no_update, no_update
 
         try:
-            # Check for new data (handles truncation with rebuild)
-            try:
-                new_rows = app._csv_indexer.update_index()
-            except ValueError as e:
-                # File truncated - rebuild index from scratch
-                logger.warning("File truncation detected, rebuilding index: %s", e)
-                app._csv_indexer.index = None
-                app._csv_indexer.build_index()
-                new_rows = app._csv_indexer.index.row_count  # Treat as full reload
+            # Take over the data prebuilt in the background since the last
+            # tick, then read only what was appended after that read, so the
+            # chart is current while most I/O and downsampling happened off
+            # the callback thread. The next read starts once this tick is done.
+            pending = app._follow_future
+            if pending is not None and not pending.done():
+                return no_update, no_update, no_update, no_update  # Still building
+            app._follow_future = None
+            prefetched_rows = 0
+            if pending is not None:
+                prefetched_rows = _adopt_follow_prefetch(app, pending.result())
+
+            new_rows, df_numeric, row_count, lttb_cache = _read_follow_data(
+                app._csv_indexer,
+                app._current_df,
+                app._current_row_count,
+                app._lttb_cache,
+            )
+            new_rows += prefetched_rows
+            if lttb_cache is not app._lttb_cache:
+                app._plotted_indices = None  # Truncated and re-read from scratch
+            app._lttb_cache = lttb_cache
+
+            # Update stored DataFrame for Y-axis auto-scaling
+            app._current_df = df_numeric
+            app._current_row_count = row_count
 
             if new_rows == 0:
                 logger.debug("Follow mode: no new rows")
+                _schedule_follow_read(app)
                 # Record completion time even for no-op to maintain debounce rhythm
-                return no_update, no_update, time.time()
+                return no_update, no_update, _monotonic_ms(), no_update
 
             logger.info("Follow mode: %d new rows detected", new_rows)
 
-            # Extract current viewport before rebuild (for viewport extension)
-            x_range = None
-            if current_figure and "layout" in current_figure:
-                layout = current_figure.get("layout", {})
-                xaxis = layout.get("xaxis", {})
-                if "range" in xaxis:
-                    x_range = xaxis["range"]
-
-            # Re-read data and rebuild figure
-            from .column_filter import filter_numeric_columns
-
-            index = app._csv_indexer.index
-            df = app._csv_indexer.read_range(0, index.row_count)
-            df_numeric = filter_numeric_columns(df)
-
-            # Update stored DataFrame for Y-axis auto-scaling
-            app._current_df = df_numeric
+            # Current viewport before rebuild (for viewport extension)
+            x_range = app._x_range
 
             x_values = _get_x_values(df_numeric)
-            new_figure = create_figure(df_numeric, x_values, current_theme)
 
             # Viewport behavior depends on dragmode:
             # - Pan mode: Keep window width constant, slide to latest data
             # - Zoom mode: Preserve start time, extend end to latest data
+            new_x_range = None
             if x_range is not None:
                 # Get the new data's max x value
                 new_x_max = df_numeric.index[-1]
@@ -355,7 +378,7 @@ def create_app(
                         else:
                             new_x_start = str(new_x_start_ts)
 
-                        new_figure.update_layout(xaxis_range=[new_x_start, new_x_end])
+                        new_x_range = [new_x_start, new_x_end]
                         logger.debug(
                             "Follow pan mode: window [%s - %s], duration preserved",
                             new_x_start, new_x_end
@@ -363,25 +386,81 @@ def create_app(
                     except Exception as e:
                         # Fallback to zoom behavior on parse error
                         logger.debug("Pan mode duration calc failed, using zoom behavior: %s", e)
-                        new_figure.update_layout(xaxis_range=[x_range[0], new_x_end])
+                        new_x_range = [x_range[0], new_x_end]
                 else:
                     # Zoom mode (default): preserve start, extend end to latest
-                    new_figure.update_layout(xaxis_range=[x_range[0], new_x_end])
-
-            # Preserve legend visibility state from current figure
-            if current_figure and "data" in current_figure:
-                _preserve_legend_state(current_figure, new_figure)
+                    new_x_range = [x_range[0], new_x_end]
+
+            tail = no_update
+            if app._trace_names == list(df_numeric.columns):
+                # Same traces: update only the data arrays and viewport. Layout,
+                # styling and legend visibility stay as they are in the browser.
+                display_x, numeric_x = x_values
+                Y = _column_matrix(df_numeric)
+                indices = _plot_indices(
+                    numeric_x,
+                    Y,
+                    list(df_numeric.columns),
+                    app._lttb_cache,
+                    _x_range_bounds(new_x_range, df_numeric.index),
+                )
+                tail_starts = _tail_starts(app._plotted_indices, indices)
+                if tail_starts is not None:
+                    # Every trace only gained points at the end: send just
+                    # those and let the browser append them (appendTail)
+                    new_figure = no_update
+                    tail = {"x": [], "y": [], "range": new_x_range}
+                    for i, start in enumerate(tail_starts):
+                        rows = indices[i][start:]
+                        tail["x"].append(_to_typed_array(_to_plot_x(display_x[rows])))
+                        tail["y"].append(_to_typed_array(Y[i, rows]))
+                else:
+                    new_figure = Patch()
+                    for i, rows in enumerate(indices):
+                        new_figure["data"][i]["x"] = _to_typed_array(
+                            _to_plot_x(display_x[rows])
+                        )
+                        new_figure["data"][i]["y"] = _to_typed_array(Y[i, rows])
+                    if new_x_range is not None:
+                        new_figure["layout"]["xaxis"]["range"] = new_x_range
+                app._plotted_indices = indices
+            else:
+                # Column set changed: rebuild the whole figure
+                new_figure = create_figure(
+                    df_numeric,
+                    x_values,
+                    current_theme,
+                    lttb_cache=app._lttb_cache,
+                    visibility=app._legend_visibility,
+                )
+                app._plotted_indices = None
+                app._trace_names = list(df_numeric.columns)
+                if new_x_range is not None:
+                    layout = dict(new_figure["layout"])  # Shared per theme
+                    layout["xaxis"] = {**layout["xaxis"], "range": new_x_range}
+                    new_figure["layout"] = layout
+            if new_x_range is not None:
+                app._x_range = new_x_range
 
             latest_timestamp = _format_timestamp(df_numeric.index[-1])
             status = f"Following | Latest: {latest_timestamp}"
+            _schedule_follow_read(app)
 
             # Record completion time (after all processing) for accurate debounce
-            completion_time = time.time()
-            return new_figure, status, completion_time
+            return new_figure, status, _monotonic_ms(), tail
 
         except Exception as e:
             logger.error("Follow mode update failed: %s", e)
-            return no_update, no_update, no_update
+            return no_update, no_update, no_update, no_update
+
+    # Append streamed follow-mode points to the traces in the browser
+    app.clientside_callback(
+        ClientsideFunction(namespace="chart", function_name="appendTail"),
+        Output("main-chart", "figure", allow_duplicate=True),
+        Input("follow-tail-store", "data"),
+        State("main-chart", "figure"),
+        prevent_initial_call=True,
+    )
 
     @app.callback(
         Output("main-chart", "figure", allow_duplicate=True),
@@ -389,13 +468,11 @@ def create_app(
         Output("reload-btn", "disabled", allow_duplicate=True),
         Input("reload-btn", "n_clicks"),
         State("theme-dropdown", "value"),
-        State("main-chart", "figure"),
         prevent_initial_call=True,
     )
     def reload_data(
         n_clicks: int,
         current_theme: str,
-        current_figure: dict,
     ) -> tuple:
         """Handle manual reload button click."""
         if n_clicks is None or app._csv_indexer is None:
@@ -405,8 +482,7 @@ def create_app(
             logger.info("Manual reload triggered")
 
             # Rebuild index from scratch
-            from .column_filter import filter_numeric_columns
-
+            _discard_follow_prefetch(app)
             app._csv_indexer.index = None
             index = app._csv_indexer.build_index()
 
@@ -415,13 +491,21 @@ def create_app(
 
             # Update stored DataFrame for Y-axis auto-scaling
             app._current_df = df_numeric
+            app._current_row_count = index.row_count
+            app._lttb_cache = {}
+            app._plotted_indices = None
+            app._trace_names = list(df_numeric.columns)
+            app._x_range = None  # New figure starts autoranged
 
             x_values = _get_x_values(df_numeric)
-            new_figure = create_figure(df_numeric, x_values, current_theme)
-
             # Preserve legend visibility
-            if current_figure and "data" in current_figure:
-                _preserve_legend_state(current_figure, new_figure)
+            new_figure = create_figure(
+                df_numeric,
+                x_values,
+                current_theme,
+                lttb_cache=app._lttb_cache,
+                visibility=app._legend_visibility,
+            )
 
             latest_timestamp = _format_timestamp(df_numeric.index[-1])
             status = f"Reloaded {index.row_count} rows | Latest: {latest_timestamp}"
@@ -436,21 +520,29 @@ def create_app(
             logger.error("Reload failed: %s", e)
             return no_update, f"Error: {e}", no_update
 
+    # Debounce zoom/pan events in the browser; resets restore Y autorange there
+    app.clientside_callback(
+        ClientsideFunction(namespace="chart", function_name="debounceViewport"),
+        Output("relayout-debounced-store", "data"),
+        Output("main-chart", "figure", allow_duplicate=True),
+        Input("main-chart", "relayoutData"),
+        State("main-chart", "figure"),
+        prevent_initial_call=True,
+    )
+
     @app.callback(
         Output("follow-checkbox", "value"),
         Output("status-text", "children", allow_duplicate=True),
         Output("main-chart", "figure", allow_duplicate=True),
-        Input("main-chart", "relayoutData"),
+        Input("relayout-debounced-store", "data"),
         State("follow-checkbox", "value"),
         State("status-text", "children"),
-        State("main-chart", "figure"),
         prevent_initial_call=True,
     )
     def handle_viewport_change(
         relayout_data: dict,
         follow_value: list,
         current_status: str,
-        current_figure: dict,
     ) -> tuple:
         """
         Handle viewport changes (zoom/pan).
@@ -458,44 +550,37 @@ def create_app(
         For time-series, both zoom and pan operate on X-axis only.
         Y-axis auto-scales to fit data within the visible X range.
         Auto-unchecks follow mode when user manually pans/zooms.
+
+        Receives relayoutData after the clientside debounce. Resets
+        (autorange/double-click) restore the Y range in the browser and
+        only clear the x range kept for follow mode here. Visible traces
+        come from the names and legend state kept on the app, so the
+        figure is never uploaded.
         """
         if relayout_data is None:
             return no_update, no_update, no_update
 
+        app._x_range = _relayout_x_range(relayout_data, app._x_range)
+
         # Check if X-axis range changed (zoom or pan)
         x_range_changed = any(
             key.startswith("xaxis.range") for key in relayout_data.keys()
         )
 
-        # Check if this is a reset (autorange or double-click)
-        is_reset = (
-            relayout_data.get("xaxis.autorange") is True
-            or relayout_data.get("autosize") is True
-        )
-
         # Handle Y-axis auto-scaling on X zoom/pan
         figure_update = no_update
-        if x_range_changed and current_figure and not is_reset:
+        if x_range_changed:
             # Compute Y-axis range from data within visible X range
             figure_update = _compute_y_range_for_x_viewport(
-                current_figure, relayout_data, app._current_df
+                relayout_data,
+                app._current_df,
+                _visible_columns(app._trace_names, app._legend_visibility),
             )
-        elif is_reset and current_figure:
-            # Double-click reset: restore Y-axis autorange
-            updated_figure = dict(current_figure)
-            if "layout" in updated_figure:
-                layout = dict(updated_figure["layout"])
-                yaxis = dict(layout.get("yaxis", {}))
-                yaxis["autorange"] = True
-                yaxis.pop("range", None)  # Remove explicit range
-                layout["yaxis"] = yaxis
-                updated_figure["layout"] = layout
-                figure_update = updated_figure
 
         # Handle follow mode auto-pause when user manually navigates
         status_update = no_update
         checkbox_update = no_update
-        if x_range_changed and app._csv_indexer is not None and not is_reset:
+        if x_range_changed and app._csv_indexer is not None:
             if follow_value and "follow" in follow_value:
                 # Check if user panned the START of the viewport (indicating manual navigation)
                 start_changed = "xaxis.range[0]" in relayout_data
@@ -514,20 +599,18 @@ def create_app(
     @app.callback(
         Output("main-chart", "figure", allow_duplicate=True),
         Input("main-chart", "restyleData"),
-        State("main-chart", "figure"),
         prevent_initial_call=True,
     )
-    def handle_legend_toggle(
-        restyle_data: list,
-        current_figure: dict,
-    ) -> dict:
+    def handle_legend_toggle(restyle_data: list) -> Any:
         """
         Handle legend visibility toggle events.
 
         When user clicks legend items to hide/show traces, recalculate
-        Y-axis range based on only the visible traces.
+        Y-axis range based on only the visible traces. The browser has
+        already applied the visibility change, so only the range is sent;
+        the new visibility is read from restyleData, not the figure.
         """
-        if restyle_data is None or current_figure is None:
+        if restyle_data is None:
             return no_update
 
         # restyleData is [changes_dict, affected_trace_indices]
@@ -539,15 +622,19 @@ def create_app(
         if not isinstance(changes, dict) or "visible" not in changes:
             return no_update
 
+        # Remember visibility so rebuilt figures keep it
+        app._legend_visibility = _restyle_visibility(
+            restyle_data, app._trace_names, app._legend_visibility
+        )
+        visible_columns = _visible_columns(app._trace_names, app._legend_visibility)
+
         # Legend visibility changed - recalculate Y-axis range
         df = app._current_df
         if df is None or df.empty:
             return no_update
 
-        # Get current X-axis range from figure
-        layout = current_figure.get("layout", {})
-        xaxis = layout.get("xaxis", {})
-        x_range = xaxis.get("range")
+        # Current X-axis range, as tracked from relayout events
+        x_range = app._x_range
 
         if x_range and len(x_range) == 2:
             # Construct relayout_data format for reuse of Y-range computation
@@ -555,17 +642,9 @@ def create_app(
                 "xaxis.range[0]": x_range[0],
                 "xaxis.range[1]": x_range[1],
             }
-            return _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+            return _compute_y_range_for_x_viewport(relayout_data, df, visible_columns)
         else:
             # No explicit X range - compute from full data
-            # Determine visible columns from current figure (with updated visibility)
-            visible_columns = []
-            for trace in current_figure.get("data", []):
-                trace_name = trace.get("name")
-                trace_visible = trace.get("visible", True)
-                if trace_name and trace_visible is True:
-                    visible_columns.append(trace_name)
-
             columns_to_use = [col for col in visible_columns if col in df.columns]
             if not columns_to_use:
                 return no_update
@@ -577,25 +656,7 @@ def create_app(
             if pd.isna(y_min) or pd.isna(y_max):
                 return no_update
 
-            y_range_span = y_max - y_min
-            if y_range_span == 0:
-                y_padding = abs(y_max) * 0.1 if y_max != 0 else 1.0
-            else:
-                y_padding = y_range_span * 0.05
-
-            y_min_padded = y_min - y_padding
-            y_max_padded = y_max + y_padding
-
-            updated_figure = dict(current_figure)
-            if "layout" in updated_figure:
-                layout = dict(updated_figure["layout"])
-                yaxis = dict(layout.get("yaxis", {}))
-                yaxis["range"] = [y_min_padded, y_max_padded]
-                yaxis["autorange"] = False
-                layout["yaxis"] = yaxis
-                updated_figure["layout"] = layout
-
-            return updated_figure
+            return _y_range_patch(y_min, y_max)
 
     @app.callback(
         Output("follow-interval", "disabled"),
@@ -655,13 +716,11 @@ def create_app(
 
         # Access pywebview window via app reference
         window = getattr(app, "_pywebview_window", None)
-        if window is None:
+        if webview is None or window is None:
             logger.warning("No pywebview window available for file dialog")
-            return no_update, "Error: File dialog unavailable", no_update, no_update
+            return no_update, "Error: File dialog unavailable", no_update, no_update, no_update
 
         try:
-            import webview
-
             # Open file dialog (must use evaluate_js or direct call)
             result = window.create_file_dialog(
                 webview.OPEN_DIALOG,
@@ -675,26 +734,30 @@ def create_app(
             selected_path = result[0]
             logger.info("Loading file from dialog: %s", selected_path)
 
-            # Import dependencies for loading
-            from pathlib import Path
-            from .csv_indexer import CSVIndexer
-            from .column_filter import filter_numeric_columns
-
-            # Build index and load data
+            # Build (or load the cached) index and load data
             csv_path = Path(selected_path)
             indexer = CSVIndexer(csv_path)
-            index = indexer.build_index()
+            index = indexer.load_or_build_index()
 
             df = indexer.read_range(0, index.row_count)
             df_numeric = filter_numeric_columns(df)
 
             # Update app state
+            _discard_follow_prefetch(app)
             app._csv_indexer = indexer
             app._current_df = df_numeric  # Store for Y-axis auto-scaling
+            app._current_row_count = index.row_count
+            app._lttb_cache = {}
+            app._plotted_indices = None
+            app._legend_visibility = {}
+            app._trace_names = list(df_numeric.columns)
+            app._x_range = None  # New figure starts autoranged
 
             # Create figure
             x_values = _get_x_values(df_numeric)
-            new_figure = create_figure(df_numeric, x_values, current_theme)
+            new_figure = create_figure(
+                df_numeric, x_values, current_theme, lttb_cache=app._lttb_cache
+            )
 
             # Update window title if possible
             try:
@@ -734,96 +797,348 @@ def create_figure(
     df: pd.DataFrame,
     x_values: np.ndarray,
     theme: str = "light",
-) -> go.Figure:
+    lttb_cache: Optional[dict] = None,
+    visibility: Optional[dict[str, Any]] = None,
+) -> dict:
     """
     Create a complete figure with all traces.
 
+    The figure is a plain dict: Dash serializes it as-is, so Plotly's
+    graph-object validation never runs on the server. The layout is the
+    shared per-theme instance (see create_layout); copy before modifying.
+
     Args:
         df: DataFrame with numeric columns.
         x_values: X-axis values (index values).
         theme: Color theme.
+        lttb_cache: Optional per-column downsampling cache (see create_traces).
+        visibility: Optional trace name -> legend visibility to apply.
 
     Returns:
-        Plotly Figure object.
+        Figure dict with 'data' and 'layout'.
     """
-    traces = create_traces(df, x_values, theme)
-    layout = create_layout(theme)
-
-    fig = go.Figure(data=traces, layout=layout)
-    return fig
+    traces = create_traces(df, x_values, theme, lttb_cache, visibility)
+    return {"data": traces, "layout": create_layout(theme)}
 
 
 def create_traces(
     df: pd.DataFrame,
     x_values: tuple[np.ndarray, np.ndarray],
     theme: str = "light",
-) -> list[go.Scattergl]:
+    lttb_cache: Optional[dict] = None,
+    visibility: Optional[dict[str, Any]] = None,
+) -> list[dict]:
     """
     Create ScatterGL traces for all numeric columns.
 
-    Applies LTTB downsampling if data exceeds MAX_DISPLAY_POINTS.
+    Applies LTTB downsampling if data exceeds MAX_DISPLAY_POINTS. Traces are
+    plain dicts with x/y already encoded as binary typed arrays, so Plotly's
+    per-trace validation has no array work to do (plotly.js validates again
+    in the browser).
 
     Args:
         df: DataFrame with numeric columns only.
         x_values: Tuple of (display_x, numeric_x) from _get_x_values().
         theme: Color theme for palette selection.
+        lttb_cache: Optional dict reused across calls on the same append-only
+            data; already-downsampled prefixes are kept and only appended
+            rows are downsampled. Must be reset when the data is replaced.
+        visibility: Optional trace name -> legend visibility, set when each
+            trace is constructed (columns not listed are visible).
 
     Returns:
-        List of ScatterGL trace objects.
+        List of scattergl trace dicts.
     """
+    visibility = visibility or {}
+    colors = get_trace_colors(len(df.columns), theme)
     traces = []
+    for i, (col, (x_plot, y_plot)) in enumerate(
+        zip(df.columns, _trace_arrays(df, x_values, lttb_cache))
+    ):
+        trace = {
+            "type": "scattergl",
+            "x": _to_typed_array(x_plot),
+            "y": _to_typed_array(y_plot),
+            "mode": "lines",
+            "name": col,
+            "visible": visibility.get(col, True),
+            "connectgaps": False,
+            "line": {"color": colors[i]},
+            "hovertemplate": "%{y:.2f}<extra>%{fullData.name}</extra>",
+        }
+        traces.append(trace)
+
+    logger.debug("Created %d traces with up to %d points each", len(traces), MAX_DISPLAY_POINTS)
+    return traces
+
+
+def _trace_arrays(
+    df: pd.DataFrame,
+    x_values: tuple[np.ndarray, np.ndarray],
+    lttb_cache: Optional[dict] = None,
+    x_bounds: Optional[tuple[float, float]] = None,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Compute the (x, y) arrays to plot for each column.
+
+    Applies LTTB downsampling if data exceeds MAX_DISPLAY_POINTS.
+
+    Args:
+        df: DataFrame with numeric columns only.
+        x_values: Tuple of (display_x, numeric_x) from _get_x_values().
+        lttb_cache: Optional per-column downsampling cache (see create_traces).
+        x_bounds: Optional visible (start, end) in numeric_x units; the
+            visible rows are downsampled at full density (see
+            _refine_viewport_indices).
+
+    Returns:
+        List of (x_plot, y_plot) tuples, one per column.
+    """
+    arrays = []
     display_x, numeric_x = x_values
 
+    Y = _column_matrix(df)
+
+    # Apply MinMaxLTTB downsampling if needed (numeric x for the calculation)
+    downsample = len(numeric_x) > MAX_DISPLAY_POINTS
+    if downsample:
+        all_indices = _plot_indices(numeric_x, Y, list(df.columns), lttb_cache, x_bounds)
+
     for i, col in enumerate(df.columns):
-        y_values = df[col].to_numpy()
+        y_values = Y[i]
 
-        # Apply MinMaxLTTB downsampling if needed
-        if len(numeric_x) > MAX_DISPLAY_POINTS:
-            # Use numeric values for downsampling calculation
-            indices = compute_lttb_indices(numeric_x, y_values, MAX_DISPLAY_POINTS, MINMAX_RATIO)
+        if downsample:
+            indices = all_indices[i]
             x_plot = display_x[indices]
             y_plot = y_values[indices]
         else:
             x_plot, y_plot = display_x, y_values
 
-        trace = go.Scattergl(
-            x=x_plot,
-            y=y_plot,
-            mode="lines",
-            name=col,
-            connectgaps=False,
-            line=dict(color=get_trace_color(i, theme)),
-            hovertemplate="%{y:.2f}<extra>%{fullData.name}</extra>",
+        arrays.append((_to_plot_x(x_plot), y_plot))
+
+    return arrays
+
+
+def _plot_indices(
+    numeric_x: np.ndarray,
+    Y: np.ndarray,
+    columns: list[str],
+    lttb_cache: Optional[dict],
+    x_bounds: Optional[tuple[float, float]] = None,
+) -> list[np.ndarray]:
+    """
+    Select the rows to plot for each column.
+
+    Args:
+        numeric_x: Numeric x values (full length).
+        Y: 2D array (n_columns, n_rows) of column values.
+        columns: Column names (cache keys), one per row of Y.
+        lttb_cache: Optional per-column downsampling cache (see create_traces).
+        x_bounds: Optional visible (start, end) in numeric_x units.
+
+    Returns:
+        Sorted arrays of row indices, one per column (all rows when the
+        data fits within MAX_DISPLAY_POINTS).
+    """
+    if len(numeric_x) <= MAX_DISPLAY_POINTS:
+        return [np.arange(len(numeric_x))] * len(columns)
+
+    indices = _lttb_indices(numeric_x, Y, columns, lttb_cache)
+    if x_bounds is not None:
+        indices = _refine_viewport_indices(numeric_x, Y, indices, x_bounds)
+    return indices
+
+
+def _tail_starts(
+    plotted: Optional[list[np.ndarray]],
+    indices: list[np.ndarray],
+) -> Optional[list[int]]:
+    """
+    Check whether new plot indices only extend the ones already plotted.
+
+    Incremental LTTB keeps the cached prefix, so follow ticks usually only
+    add points after the last plotted row; those can be streamed to the
+    browser instead of resending whole traces.
+
+    Args:
+        plotted: Row indices currently shown per trace, or None if unknown.
+        indices: New row indices per trace.
+
+    Returns:
+        Per-trace position where the new points start, or None if any
+        trace changed before its end.
+    """
+    if plotted is None or len(plotted) != len(indices):
+        return None
+
+    starts = []
+    for old, new in zip(plotted, indices):
+        start = len(old)
+        if len(new) < start or not np.array_equal(new[:start], old):
+            return None
+        starts.append(start)
+    return starts
+
+
+def _column_matrix(df: pd.DataFrame) -> np.ndarray:
+    """
+    Extract all columns as one 2D float32 array, one contiguous row per column.
+
+    float32 is what WebGL renders, and halves the bytes scanned by the
+    downsampler and sent to the browser. After filter_numeric_columns the
+    frame is usually a single block already laid out as (columns, rows), so
+    that block is cast directly instead of going through to_numpy() and a
+    transposed copy. The block layout is pandas-internal; if it changes, the
+    public to_numpy() path is used instead.
+
+    Args:
+        df: DataFrame with numeric columns only.
+
+    Returns:
+        2D array of shape (n_columns, n_rows).
+    """
+    try:
+        blocks = df._mgr.blocks
+        if len(blocks) == 1:
+            block = blocks[0]
+            values = block.values
+            if (
+                isinstance(values, np.ndarray)
+                and values.ndim == 2
+                and np.array_equal(block.mgr_locs.as_array, np.arange(len(df.columns)))
+            ):
+                return np.asarray(values, dtype=np.float32, order="C")
+    except (AttributeError, TypeError) as e:
+        logger.debug("DataFrame block layout unavailable, using to_numpy(): %s", e)
+    return np.ascontiguousarray(df.to_numpy(dtype=np.float32).T)
+
+
+def _lttb_indices(
+    numeric_x: np.ndarray,
+    Y: np.ndarray,
+    columns: list[str],
+    cache: Optional[dict],
+) -> list[np.ndarray]:
+    """
+    Compute downsampling indices for all columns, reusing cached results.
+
+    The cache maps column name to (row_count, indices, base_row_count), where
+    base_row_count is the length of the last full downsample. When rows have
+    only been appended, the cached indices are kept for the prefix and the
+    tail (from the last selected point onward) is downsampled at the same
+    density. A full recompute happens once the appended rows exceed
+    LTTB_REBUILD_RATIO of the base, bounding the point count. Columns that
+    need a full recompute are downsampled together in one batch.
+
+    Args:
+        numeric_x: Numeric x values (full length).
+        Y: 2D array (n_columns, n_rows) of column values.
+        columns: Column names (cache keys), one per row of Y.
+        cache: Cache dict, or None to always compute from scratch.
+
+    Returns:
+        Sorted arrays of selected row indices, one per column.
+    """
+    n = len(numeric_x)
+    result: list[Optional[np.ndarray]] = [None] * len(columns)
+
+    for i, col in enumerate(columns):
+        cached = cache.get(col) if cache is not None else None
+        if cached is None:
+            continue
+        prev_count, prev_indices, base_count = cached
+        appended = n - base_count
+        if n == prev_count:
+            result[i] = prev_indices
+        elif (
+            n > prev_count
+            and n - prev_count < TAIL_THRESHOLD_MAX
+            and appended <= base_count * LTTB_REBUILD_RATIO
+        ):
+            start = int(prev_indices[-1])  # Always the last row of the previous data
+            tail_len = n - start
+            n_out = max(2, int(np.ceil(tail_len * MAX_DISPLAY_POINTS / base_count)))
+            tail_indices = compute_lttb_indices(
+                numeric_x[start:], Y[i, start:], n_out, MINMAX_RATIO
+            )
+            indices = np.concatenate((prev_indices[:-1], tail_indices + start))
+            cache[col] = (n, indices, base_count)
+            result[i] = indices
+
+    missing = [i for i, indices in enumerate(result) if indices is None]
+    if missing:
+        batch = compute_lttb_indices_batch(
+            numeric_x, Y[missing], MAX_DISPLAY_POINTS, MINMAX_RATIO
         )
-        traces.append(trace)
+        for i, indices in zip(missing, batch):
+            result[i] = indices
+            if cache is not None:
+                cache[columns[i]] = (n, indices, n)
 
-    logger.debug("Created %d traces with up to %d points each", len(traces), MAX_DISPLAY_POINTS)
-    return traces
+    return result
+
+
+def _refine_viewport_indices(
+    numeric_x: np.ndarray,
+    Y: np.ndarray,
+    indices: list[np.ndarray],
+    x_bounds: tuple[float, float],
+) -> list[np.ndarray]:
+    """
+    Replace the downsampled points inside the viewport with a denser sample.
+
+    x is sorted, so the visible rows are located by binary search and only
+    that slice is downsampled (cost proportional to the visible rows, not
+    the whole series). The overview points outside the viewport are kept,
+    so panning or resetting the zoom still shows the rest of the data.
+
+    Args:
+        numeric_x: Numeric x values (sorted, full length).
+        Y: 2D array (n_columns, n_rows) of column values.
+        indices: Full-range downsampling indices, one array per column.
+        x_bounds: Visible (start, end) in numeric_x units.
+
+    Returns:
+        Sorted arrays of selected row indices, one per column.
+    """
+    n = len(numeric_x)
+    lo, hi = np.searchsorted(numeric_x, x_bounds)
+    # One row of margin each side so lines run to the viewport edges
+    lo = max(int(lo) - 1, 0)
+    hi = min(int(hi) + 1, n)
+    if hi - lo < 2 or hi - lo == n:
+        return indices
+
+    visible = compute_lttb_indices_batch(
+        numeric_x[lo:hi], Y[:, lo:hi], MAX_DISPLAY_POINTS, MINMAX_RATIO
+    )
+    refined = []
+    for full, inner in zip(indices, visible):
+        left, right = np.searchsorted(full, (lo, hi))
+        refined.append(np.concatenate((full[:left], inner + lo, full[right:])))
+    return refined
 
 
-def create_layout(theme: str = "light") -> go.Layout:
+@functools.lru_cache(maxsize=2)
+def create_layout(theme: str = "light") -> dict:
     """
     Create chart layout with theme-appropriate colors.
 
+    The layout only depends on the theme, so one instance per theme is
+    built and shared. Callers must not mutate it; copy it first.
+
     Args:
         theme: Color theme ('light' or 'dark').
 
     Returns:
-        Plotly Layout object.
+        Plotly layout as a plain dictionary.
     """
-    if theme == "dark":
-        bg_color = "#1a1a1a"
-        grid_color = "#3a3a3a"
-        text_color = "#e8e8e8"
-    else:
-        bg_color = "#ffffff"
-        grid_color = "#e0e0e0"
-        text_color = "#1a1a1a"
+    bg_color, grid_color, text_color = _theme_colors(theme)
 
-    return go.Layout(
+    return dict(
         paper_bgcolor=bg_color,
         plot_bgcolor=bg_color,
-        font=dict(color=text_color, family="Roboto, Helvetica, Arial, sans-serif"),
+        font=dict(color=text_color, family=FONT_FAMILY),
         margin=dict(l=60, r=200, t=60, b=60),
         legend=dict(
             orientation="v",
@@ -850,7 +1165,42 @@ def create_layout(theme: str = "light") -> go.Layout:
     )
 
 
-def create_empty_figure(theme: str = "light") -> go.Figure:
+def _theme_colors(theme: str) -> tuple[str, str, str]:
+    """
+    Chart colors for a theme.
+
+    Args:
+        theme: Color theme ('light' or 'dark').
+
+    Returns:
+        Tuple of (background, grid, text) colors.
+    """
+    if theme == "dark":
+        return "#1a1a1a", "#3a3a3a", "#e8e8e8"
+    return "#ffffff", "#e0e0e0", "#1a1a1a"
+
+
+def _theme_spec(theme: str) -> dict:
+    """
+    Colors for a theme, as consumed by the clientside setTheme callback.
+
+    Args:
+        theme: Color theme ('light' or 'dark').
+
+    Returns:
+        Dict with bg, grid, text, font and palette entries.
+    """
+    bg_color, grid_color, text_color = _theme_colors(theme)
+    return {
+        "bg": bg_color,
+        "grid": grid_color,
+        "text": text_color,
+        "font": FONT_FAMILY,
+        "palette": DARK_PALETTE if theme == "dark" else LIGHT_PALETTE,
+    }
+
+
+def create_empty_figure(theme: str = "light") -> dict:
     """
     Create an empty figure for the initial/no-data state.
 
@@ -858,10 +1208,10 @@ def create_empty_figure(theme: str = "light") -> go.Figure:
         theme: Color theme.
 
     Returns:
-        Empty Plotly Figure with styled layout.
+        Empty figure dict with styled layout.
     """
-    layout = create_layout(theme)
-    layout.annotations = [
+    layout = dict(create_layout(theme))
+    layout["annotations"] = [
         dict(
             text="No data loaded",
             xref="paper",
@@ -872,7 +1222,7 @@ def create_empty_figure(theme: str = "light") -> go.Figure:
             font=dict(size=16),
         )
     ]
-    return go.Figure(data=[], layout=layout)
+    return {"data": [], "layout": layout}
 
 
 def _get_x_values(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
@@ -889,18 +1239,276 @@ def _get_x_values(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
         display_x: Original values for chart display.
         numeric_x: Numeric values for LTTB downsampling.
     """
-    if hasattr(df.index, "to_numpy"):
-        display_x = df.index.to_numpy()
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex):
+        # Timezone-aware values are shown as UTC wall time
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        # Both are zero-copy views of the index data: asi8 is the int64
+        # bit pattern of the datetime64 values. Neither array is modified
+        # downstream.
+        return index.to_numpy(), index.asi8
+
+    if hasattr(index, "to_numpy"):
+        display_x = index.to_numpy()
     else:
-        display_x = np.array(df.index)
+        display_x = np.array(index)
 
-    # Convert datetime to numeric for LTTB algorithm
+    # Also catches datetime64 values outside a DatetimeIndex
     if np.issubdtype(display_x.dtype, np.datetime64):
-        numeric_x = display_x.astype("int64")
-    else:
-        numeric_x = display_x.copy()
+        return display_x, display_x.view(np.int64)
+    return display_x, np.ascontiguousarray(display_x)
+
+
+def _to_plot_x(values: np.ndarray) -> np.ndarray:
+    """
+    Convert x values to a form Plotly serializes as a binary typed array.
+
+    Plotly encodes numeric numpy arrays as base64 typed arrays but writes
+    datetime64 arrays as ISO strings (~30 bytes per point). Datetimes are
+    therefore sent as float64 milliseconds since the epoch, which a date
+    axis displays identically.
+
+    Args:
+        values: Display x values (datetime64 or numeric).
+
+    Returns:
+        Numeric array suitable for a trace's x.
+    """
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").view(np.int64) / 1e6
+    return values
+
+
+def _to_typed_array(values: np.ndarray) -> dict:
+    """
+    Encode an array as a Plotly typed array spec for partial updates.
+
+    Plotly's validators only apply this encoding to numpy arrays inside
+    graph objects; raw trace dicts and Patch values would otherwise be sent
+    as JSON lists.
+
+    Args:
+        values: Numeric array.
+
+    Returns:
+        Dict with 'dtype' and base64 'bdata' keys.
+    """
+    dtype = values.dtype.str[1:]
+    if dtype not in TYPED_ARRAY_DTYPES:
+        values = values.astype(np.float64)
+        dtype = "f8"
+    data = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    return {"dtype": dtype, "bdata": base64.b64encode(data.tobytes()).decode("ascii")}
+
+
+def _append_rows(
+    indexer: Any,
+    df: pd.DataFrame,
+    start_row: int,
+) -> Optional[pd.DataFrame]:
+    """
+    Extend previously loaded data with rows appended to the file.
+
+    Reads only rows from start_row onward instead of the whole file.
+
+    Args:
+        indexer: CSVIndexer with an up-to-date index.
+        df: Numeric DataFrame holding rows [0, start_row).
+        start_row: First row not yet in df.
+
+    Returns:
+        Combined DataFrame, or None if the new rows do not fit the existing
+        columns (missing or non-numeric values, different index type) and a
+        full re-read is needed.
+    """
+    row_count = indexer.index.row_count
+    if start_row >= row_count:
+        return df if start_row == row_count else None
+
+    tail = indexer.read_range(start_row, row_count)
+    if tail.index.dtype != df.index.dtype:
+        return None
+    for col in df.columns:
+        if col not in tail.columns or str(tail[col].dtype) not in NUMERIC_DTYPES:
+            return None
+
+    return pd.concat([df, tail[df.columns]])
+
+
+def _x_range_bounds(
+    x_range: Optional[list],
+    index: pd.Index,
+) -> Optional[tuple[float, float]]:
+    """
+    Convert a Plotly x-axis range to bounds in numeric x units.
+
+    Matches _get_x_values(): datetimes become int64 counts in the index's
+    unit (UTC wall time, as displayed on the axis); other indexes use the
+    values as-is.
+
+    Args:
+        x_range: [start, end] from the figure layout, or None.
+        index: DataFrame index the range refers to.
+
+    Returns:
+        (start, end) tuple, or None if there is no usable range.
+    """
+    if not x_range or len(x_range) != 2:
+        return None
+
+    try:
+        if isinstance(index, pd.DatetimeIndex):
+            bounds = []
+            for value in x_range:
+                ts = pd.Timestamp(value)
+                if ts.tzinfo is not None:
+                    ts = ts.tz_convert("UTC").tz_localize(None)
+                bounds.append(ts.as_unit(index.unit).value)
+            return bounds[0], bounds[1]
+        return float(x_range[0]), float(x_range[1])
+    except (ValueError, TypeError):
+        return None
+
+
+def _read_follow_data(
+    indexer: CSVIndexer,
+    df: Optional[pd.DataFrame],
+    row_count: Optional[int],
+    lttb_cache: dict,
+) -> tuple[int, Optional[pd.DataFrame], Optional[int], dict]:
+    """
+    Read rows appended since the last follow tick and warm the LTTB cache.
+
+    Extends the indexer's index and the cache passed in. Background reads
+    get copies of both (see _schedule_follow_read), so app state only
+    changes on the callback thread. Truncated files are re-indexed from
+    scratch.
+
+    Args:
+        indexer: CSVIndexer of the followed file.
+        df: Currently loaded numeric DataFrame, or None.
+        row_count: Row count df was read at, or None if df is stale.
+        lttb_cache: Downsampling cache for df (see create_traces).
+
+    Returns:
+        Tuple of (new_rows, df_numeric, row_count, lttb_cache). With no new
+        rows, the inputs are returned unchanged.
+    """
+    # Check for new data (handles truncation with rebuild)
+    try:
+        new_rows = indexer.update_index()
+    except ValueError as e:
+        # File truncated - rebuild index from scratch
+        logger.warning("File truncation detected, rebuilding index: %s", e)
+        indexer.index = None
+        indexer.build_index()
+        lttb_cache = {}  # Rows changed in place; cached indices are stale
+        row_count = None  # Cached rows are stale too
+        new_rows = indexer.index.row_count  # Treat as full reload
+
+    if new_rows == 0:
+        return 0, df, row_count, lttb_cache
+
+    index = indexer.index
+    df_numeric = None
+    if df is not None and row_count is not None:
+        # Append only the new rows to the cached data
+        df_numeric = _append_rows(indexer, df, row_count)
+    if df_numeric is None:
+        df_numeric = filter_numeric_columns(indexer.read_range(0, index.row_count))
+
+    # Downsample now so the tick only reuses the cached indices
+    _, numeric_x = _get_x_values(df_numeric)
+    if len(numeric_x) > MAX_DISPLAY_POINTS:
+        _lttb_indices(
+            numeric_x, _column_matrix(df_numeric), list(df_numeric.columns), lttb_cache
+        )
+
+    return new_rows, df_numeric, index.row_count, lttb_cache
+
+
+def _prefetch_follow_data(
+    indexer: CSVIndexer,
+    df: Optional[pd.DataFrame],
+    row_count: Optional[int],
+    lttb_cache: dict,
+) -> tuple[CSVIndexer, dict, tuple]:
+    """
+    Run _read_follow_data() on the follow executor.
+
+    Returns:
+        Tuple of (indexer, lttb_cache passed in, _read_follow_data() result).
+    """
+    return indexer, lttb_cache, _read_follow_data(indexer, df, row_count, lttb_cache)
+
+
+def _schedule_follow_read(app: dash.Dash) -> None:
+    """
+    Start reading the next follow tick's data on the follow executor.
+
+    The worker extends its own copies of the indexer (and index) and of the
+    LTTB cache, so callbacks keep reading the current ones undisturbed; the
+    tick that takes the result swaps the copies in. Cached index arrays are
+    replaced rather than modified, so shallow copies suffice.
+
+    Args:
+        app: Dash application (uses its indexer, loaded data and LTTB cache).
+    """
+    indexer = copy.copy(app._csv_indexer)
+    if indexer.index is not None:
+        indexer.index = dataclasses.replace(indexer.index)
+    app._follow_future = app._follow_executor.submit(
+        _prefetch_follow_data,
+        indexer,
+        app._current_df,
+        app._current_row_count,
+        dict(app._lttb_cache),
+    )
+
+
+def _adopt_follow_prefetch(app: dash.Dash, prefetch: tuple) -> int:
+    """
+    Swap a finished background follow read into the app state.
+
+    Args:
+        app: Dash application.
+        prefetch: Result of _prefetch_follow_data().
+
+    Returns:
+        Number of new rows the background read found.
+    """
+    indexer, cache_in, (new_rows, df_numeric, row_count, lttb_cache) = prefetch
+    app._csv_indexer = indexer
+    if lttb_cache is not cache_in:
+        app._plotted_indices = None  # Truncated and re-read from scratch
+    app._lttb_cache = lttb_cache
+    app._current_df = df_numeric
+    app._current_row_count = row_count
+    return new_rows
+
+
+def _discard_follow_prefetch(app: dash.Dash) -> None:
+    """
+    Wait for any background follow read and drop its result.
+
+    Called before the indexer or loaded data is replaced, so a read of the
+    old file is never swapped in afterwards.
+
+    Args:
+        app: Dash application.
+    """
+    pending, app._follow_future = app._follow_future, None
+    if pending is not None:
+        try:
+            pending.result()
+        except Exception as e:
+            logger.debug("Discarded follow prefetch failed: %s", e)
 
-    return display_x, numeric_x
+
+def _monotonic_ms() -> int:
+    """Return the monotonic clock in integer milliseconds."""
+    return time.monotonic_ns() // 1_000_000
 
 
 def _format_timestamp(value: Any) -> str:
@@ -918,75 +1526,87 @@ def _format_timestamp(value: Any) -> str:
     return str(value)
 
 
-def _update_figure_theme(figure_dict: dict, theme: str) -> dict:
+def _relayout_x_range(relayout_data: dict, x_range: Optional[list]) -> Optional[list]:
     """
-    Update figure colors for a new theme.
+    Apply a relayout event to the tracked x-axis range.
 
     Args:
-        figure_dict: Current figure as dictionary.
-        theme: New theme ('light' or 'dark').
+        relayout_data: Plotly relayoutData.
+        x_range: Range before the event, or None when autoranged.
 
     Returns:
-        Updated figure dictionary.
+        [start, end] after the event, or None when autoranged.
     """
-    if theme == "dark":
-        bg_color = "#1a1a1a"
-        grid_color = "#3a3a3a"
-        text_color = "#e8e8e8"
-    else:
-        bg_color = "#ffffff"
-        grid_color = "#e0e0e0"
-        text_color = "#1a1a1a"
-
-    # Update layout
-    layout = figure_dict.get("layout", {})
-    layout["paper_bgcolor"] = bg_color
-    layout["plot_bgcolor"] = bg_color
-    layout["font"] = {"color": text_color, "family": "Roboto, Helvetica, Arial, sans-serif"}
-
-    # Update axis colors
-    for axis in ["xaxis", "yaxis"]:
-        if axis in layout:
-            layout[axis]["gridcolor"] = grid_color
-            layout[axis]["linecolor"] = grid_color
-            layout[axis]["zerolinecolor"] = grid_color
-
-    # Update trace colors
-    palette = DARK_PALETTE if theme == "dark" else LIGHT_PALETTE
-    for i, trace in enumerate(figure_dict.get("data", [])):
-        if "line" in trace:
-            trace["line"]["color"] = palette[i % len(palette)]
-
-    return figure_dict
+    if relayout_data.get("xaxis.autorange") is True:
+        return None
+    if isinstance(relayout_data.get("xaxis.range"), list):
+        return list(relayout_data["xaxis.range"])
+    start = relayout_data.get("xaxis.range[0]")
+    end = relayout_data.get("xaxis.range[1]")
+    if start is None and end is None:
+        return x_range
+    if x_range is None and (start is None or end is None):
+        return None  # Half a range on an autoranged axis: bounds unknown
+    previous = x_range or [None, None]
+    return [
+        previous[0] if start is None else start,
+        previous[1] if end is None else end,
+    ]
 
 
-def _preserve_legend_state(old_figure: dict, new_figure: go.Figure) -> None:
+def _restyle_visibility(
+    restyle_data: list,
+    trace_names: list,
+    visibility: dict[str, Any],
+) -> dict[str, Any]:
     """
-    Preserve legend visibility state from old figure to new figure.
+    Apply a restyle event's visibility changes to the legend state.
 
     Args:
-        old_figure: Previous figure as dictionary.
-        new_figure: New Figure object to update.
+        restyle_data: Plotly restyleData, [changes, trace_indices]. Indices
+            of None mean every trace.
+        trace_names: Trace names in figure order.
+        visibility: Trace name -> visible before the event.
+
+    Returns:
+        New dict of trace name -> visible (True, False or 'legendonly').
+    """
+    changes, indices = restyle_data[0], restyle_data[1]
+    values = changes["visible"]
+    if indices is None:
+        indices = range(len(trace_names))
+    elif not isinstance(indices, list):
+        indices = [indices]
+    if not isinstance(values, list):
+        values = [values]
+
+    updated = dict(visibility)
+    for n, i in enumerate(indices):
+        if 0 <= i < len(trace_names) and values:
+            # Plotly cycles a shorter value list over the traces
+            updated[trace_names[i]] = values[n % len(values)]
+    return updated
+
+
+def _visible_columns(trace_names: list, visibility: dict[str, Any]) -> list:
     """
-    old_traces = old_figure.get("data", [])
-    visibility_map = {}
+    List the traces shown on the chart.
 
-    for trace in old_traces:
-        name = trace.get("name")
-        visible = trace.get("visible", True)
-        if name:
-            visibility_map[name] = visible
+    Args:
+        trace_names: Trace names in figure order.
+        visibility: Trace name -> visible; missing names are visible.
 
-    for trace in new_figure.data:
-        if trace.name in visibility_map:
-            trace.visible = visibility_map[trace.name]
+    Returns:
+        Names whose traces are visible ('legendonly' counts as hidden).
+    """
+    return [name for name in trace_names if visibility.get(name, True) is True]
 
 
 def _compute_y_range_for_x_viewport(
-    current_figure: dict,
     relayout_data: dict,
     df: Optional[pd.DataFrame],
-) -> dict:
+    visible_columns: list,
+) -> Any:
     """
     Compute Y-axis range from data within the visible X range.
 
@@ -996,12 +1616,12 @@ def _compute_y_range_for_x_viewport(
     via legend toggle).
 
     Args:
-        current_figure: Current figure dictionary.
         relayout_data: Plotly relayout data with new X range.
         df: Source DataFrame with datetime or numeric index.
+        visible_columns: Names of the traces not hidden via the legend.
 
     Returns:
-        Updated figure dictionary with computed Y-axis range, or no_update.
+        Patch setting only the Y-axis range, or no_update.
     """
     if df is None or df.empty:
         return no_update
@@ -1035,61 +1655,69 @@ def _compute_y_range_for_x_viewport(
                 x_start_val = pd.to_datetime(x_start)
                 x_end_val = pd.to_datetime(x_end)
 
-        # Filter DataFrame to visible X range
-        mask = (df.index >= x_start_val) & (df.index <= x_end_val)
-        df_visible = df.loc[mask]
+        # Locate the visible rows: binary search on a sorted index (the
+        # usual case) instead of a full-length comparison mask
+        if df.index.is_monotonic_increasing:
+            lo = df.index.searchsorted(x_start_val, side="left")
+            hi = df.index.searchsorted(x_end_val, side="right")
+            visible_rows = slice(lo, hi)
+            has_visible = hi > lo
+        else:
+            visible_rows = (df.index >= x_start_val) & (df.index <= x_end_val)
+            has_visible = visible_rows.any()
 
-        if df_visible.empty:
+        if not has_visible:
             return no_update
 
-        # Determine which columns are visible based on legend state
-        # Plotly trace visibility: True, 'legendonly', or undefined (defaults to True)
-        visible_columns = []
-        for trace in current_figure.get("data", []):
-            trace_name = trace.get("name")
-            trace_visible = trace.get("visible", True)
-            # 'legendonly' means hidden via legend click; True or undefined means visible
-            if trace_name and trace_visible is True:
-                visible_columns.append(trace_name)
-
         # Filter to only visible columns that exist in DataFrame
-        columns_to_use = [col for col in visible_columns if col in df_visible.columns]
+        columns_to_use = [col for col in visible_columns if col in df.columns]
 
         if not columns_to_use:
             # No visible columns - cannot compute range
             return no_update
 
-        # Compute Y min/max across only visible columns
-        df_filtered = df_visible[columns_to_use]
-        y_min = df_filtered.min().min()
-        y_max = df_filtered.max().max()
+        # Compute Y min/max across only visible columns, on views of each
+        # column's array (no frame copy); fmin/fmax skip NaN without warnings
+        y_min = np.nan
+        y_max = np.nan
+        for col in columns_to_use:
+            values = df[col].to_numpy()[visible_rows]
+            y_min = np.fmin(y_min, np.fmin.reduce(values))
+            y_max = np.fmax(y_max, np.fmax.reduce(values))
 
         if pd.isna(y_min) or pd.isna(y_max):
             return no_update
 
-        # Add padding (5%) for visual comfort
-        y_range_span = y_max - y_min
-        if y_range_span == 0:
-            # Handle flat data - add fixed padding
-            y_padding = abs(y_max) * 0.1 if y_max != 0 else 1.0
-        else:
-            y_padding = y_range_span * 0.05
-
-        y_min_padded = y_min - y_padding
-        y_max_padded = y_max + y_padding
-
-        # Update figure with computed Y range
-        updated_figure = dict(current_figure)
-        if "layout" in updated_figure:
-            layout = dict(updated_figure["layout"])
-            yaxis = dict(layout.get("yaxis", {}))
-            yaxis["range"] = [y_min_padded, y_max_padded]
-            yaxis["autorange"] = False  # Use explicit range
-            layout["yaxis"] = yaxis
-            updated_figure["layout"] = layout
-
-        return updated_figure
+        return _y_range_patch(y_min, y_max)
 
     except Exception as e:
         logger.debug("Y-range computation failed: %s", e)
         return no_update
+
+
+def _y_range_patch(y_min: float, y_max: float) -> Patch:
+    """
+    Build a figure update that sets only the Y-axis range.
+
+    Sent as a Patch so zoom, pan and legend toggles do not resend the trace
+    arrays the browser already has.
+
+    Args:
+        y_min: Smallest visible value.
+        y_max: Largest visible value.
+
+    Returns:
+        Patch setting layout.yaxis.range (with padding) and disabling autorange.
+    """
+    # Add padding (5%) for visual comfort
+    y_range_span = y_max - y_min
+    if y_range_span == 0:
+        # Handle flat data - add fixed padding
+        y_padding = abs(y_max) * 0.1 if y_max != 0 else 1.0
+    else:
+        y_padding = y_range_span * 0.05
+
+    patch = Patch()
+    patch["layout"]["yaxis"]["range"] = [float(y_min - y_padding), float(y_max + y_padding)]
+    patch["layout"]["yaxis"]["autorange"] = False  # Use explicit range
+    return patch
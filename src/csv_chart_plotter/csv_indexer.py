@@ -6,34 +6,272 @@ without loading the entire file into memory. Memory footprint is
 approximately 8 bytes per row (numpy int64 offset array).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from io import StringIO
-from typing import Optional
+from io import BytesIO
+from typing import Callable, Optional, TypeVar
+import csv
 import logging
-import re
+import mmap
+import os
+import threading
+import warnings
+import zipfile
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-# Pattern to detect ISO 8601 UTC timestamps ending with 'Z'
-_UTC_TIMESTAMP_PATTERN = re.compile(
-    r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?Z$"
-)
+_T = TypeVar("_T")
+
+# Minimum length of an ISO 8601 UTC timestamp: YYYY-MM-DDTHH:MM:SSZ
+_UTC_TIMESTAMP_MIN_LENGTH = 20
+
+# Bytes searched per vectorized pass when locating line boundaries
+_SCAN_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Sidecar index cache, written next to the CSV: metadata in <name>.idx.npz,
+# row offsets as raw little-endian int64 in <name>.idx.offsets (memory-mapped)
+INDEX_CACHE_SUFFIX = ".idx.npz"
+OFFSETS_CACHE_SUFFIX = ".idx.offsets"
+_INDEX_CACHE_VERSION = 4
+_INDEX_CACHE_CHECK_BYTES = 64  # Bytes compared at the file start and cached end
 
 
 @dataclass
 class CSVIndex:
-    """Byte offset index for a CSV file."""
+    """
+    Byte offset index for a CSV file.
+
+    Files whose rows all have the same byte length (common for sensor
+    logs) store only that length: offsets are header_offset + i *
+    row_length and row_offsets is None.
+    """
 
     file_path: Path
-    row_offsets: np.ndarray  # int64 array of byte offsets
+    row_offsets: Optional[np.ndarray]  # int64 byte offsets (np.memmap when cached)
     header_offset: int  # byte offset where data rows begin
     columns: list[str]  # column names from header
     row_count: int  # number of data rows (excludes header)
     file_size: int  # file size at index build time
+    tail_offset: int  # end of the last indexed row (header_offset if none)
+    row_length: Optional[int] = None  # fixed row stride, replaces row_offsets
+
+    def row_offset(self, row: int) -> int:
+        """Byte offset of a data row."""
+        if self.row_length is not None:
+            return self.header_offset + row * self.row_length
+        return int(self.row_offsets[row])
+
+    def offsets(self) -> np.ndarray:
+        """All row offsets as an int64 array (computed for fixed-length rows)."""
+        if self.row_length is not None:
+            return self.header_offset + self.row_length * np.arange(
+                self.row_count, dtype=np.int64
+            )
+        return self.row_offsets
+
+
+def _fixed_row_length(offsets: np.ndarray, header_offset: int) -> Optional[int]:
+    """
+    Return the common row stride if offsets are evenly spaced from the header.
+
+    Args:
+        offsets: int64 array of row start offsets.
+        header_offset: Byte offset where data rows begin.
+
+    Returns:
+        Row length in bytes, or None if rows vary (or there are fewer than 2).
+    """
+    if len(offsets) < 2 or offsets[0] != header_offset:
+        return None
+    deltas = np.diff(offsets)
+    if deltas.min() != deltas.max():
+        return None
+    return int(deltas[0])
+
+
+def _map_chunks(func: Callable[[int], _T], chunk_starts: list[int]) -> list[_T]:
+    """
+    Apply func to each chunk start, in parallel when there are several.
+
+    The per-chunk work is numpy comparisons and reductions over the
+    mapped bytes, which release the GIL, so threads scale across cores.
+
+    Args:
+        func: Function taking a chunk start and returning its result.
+        chunk_starts: Chunk start positions.
+
+    Returns:
+        Results in chunk order.
+    """
+    workers = min(len(chunk_starts), os.cpu_count() or 1)
+    if workers <= 1:
+        return [func(pos) for pos in chunk_starts]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as executor:
+        return list(executor.map(func, chunk_starts))
+
+
+def _line_bounds(mm: mmap.mmap, start: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Locate the non-empty lines in a mapped file from a byte offset onward.
+
+    Args:
+        mm: Read-only memory map of the file.
+        start: Byte offset to start at (start of a line).
+
+    Returns:
+        Tuple of int64 arrays (line starts, line ends). Ends exclude the
+        line terminator (LF or CRLF); a final line without a terminator
+        runs to end of file.
+    """
+    end = len(mm)
+    if start >= end:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    buf = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+    try:
+        # Search in chunks to bound the temporary comparison array
+        def find_newlines(pos: int) -> np.ndarray:
+            return np.flatnonzero(buf[pos:pos + _SCAN_CHUNK_BYTES] == 0x0A) + pos
+
+        newlines = np.concatenate(
+            _map_chunks(find_newlines, list(range(0, len(buf), _SCAN_CHUNK_BYTES)))
+        ).astype(np.int64, copy=False)
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(buf)]))
+
+        # Strip trailing CRs (rstrip of "\r\n"), then drop empty lines
+        while True:
+            has_cr = ends > starts
+            has_cr[has_cr] = buf[ends[has_cr] - 1] == 0x0D
+            if not has_cr.any():
+                break
+            ends = ends - has_cr
+    finally:
+        del buf  # Release the buffer export so the mmap can be closed
+
+    keep = ends > starts
+    return starts[keep] + start, ends[keep] + start
+
+
+def _advise_sequential(mm: mmap.mmap) -> None:
+    """Hint the kernel to read ahead aggressively for a front-to-back scan."""
+    if hasattr(mmap, "MADV_SEQUENTIAL"):  # Not available on Windows
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+
+def _advise_random(fd: int) -> None:
+    """Hint the kernel not to read ahead past the ranges actually read."""
+    if hasattr(os, "posix_fadvise"):  # Not available on Windows
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+
+
+def _row_byte_counts(
+    mm: mmap.mmap, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count commas per line and flag lines that need a full parse.
+
+    Each batch of lines (those starting within one _SCAN_CHUNK_BYTES
+    window) is compared once and summed per line with np.add.reduceat;
+    batches are processed in parallel. The bytes between a
+    line's end and the next line's start are only line terminators, so
+    summing from start to start gives the same result as start to end.
+
+    Args:
+        mm: Read-only memory map of the file.
+        starts: int64 array of line start offsets (non-empty lines).
+        ends: int64 array of line end offsets.
+
+    Returns:
+        Tuple of (int64 comma count per line, bool array marking lines
+        containing a quote or non-ASCII bytes).
+    """
+    commas = np.empty(len(starts), dtype=np.int64)
+    special = np.empty(len(starts), dtype=bool)
+    if not len(starts):
+        return commas, special
+
+    # First line of each batch; every batch holds at least one line.
+    # Windows starting inside the last line find no line start after them.
+    windows = np.arange(starts[0], ends[-1], _SCAN_CHUNK_BYTES)
+    firsts = np.unique(np.searchsorted(starts, windows))
+    firsts = firsts[firsts < len(starts)]
+    lasts = np.append(firsts[1:], len(starts))
+    batches = dict(zip(firsts.tolist(), lasts.tolist()))
+
+    buf = np.frombuffer(mm, dtype=np.uint8)
+    try:
+        def count_batch(first: int) -> None:
+            last = batches[first]
+            seg_start = starts[first]
+            segment = buf[seg_start:ends[last - 1]]
+            offsets = starts[first:last] - seg_start
+            commas[first:last] = np.add.reduceat(
+                (segment == 0x2C).view(np.uint8), offsets, dtype=np.int64
+            )
+            flagged = (segment == 0x22) | (segment >= 0x80)
+            special[first:last] = np.logical_or.reduceat(flagged, offsets)
+
+        _map_chunks(count_batch, list(batches))
+    finally:
+        del buf  # Release the buffer export so the mmap can be closed
+    return commas, special
+
+
+def _looks_like_utc_timestamp(value: str) -> bool:
+    """
+    Check for the ISO 8601 UTC shape YYYY-MM-DD[T ]HH:MM:SS[.fff]Z.
+
+    Only the fixed separator positions and the Z suffix are checked, which
+    is enough to pick the parser; malformed values fail parsing instead.
+
+    Args:
+        value: Candidate cell value.
+
+    Returns:
+        True if the value has the UTC timestamp shape.
+    """
+    return (
+        len(value) >= _UTC_TIMESTAMP_MIN_LENGTH
+        and value[-1] == "Z"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] in "T "
+        and value[13] == ":"
+        and value[16] == ":"
+    )
+
+
+def _parse_utc_timestamps(values: np.ndarray) -> np.ndarray:
+    """
+    Parse ISO 8601 UTC timestamp strings to naive UTC datetime64[ns].
+
+    numpy's C ISO 8601 parser handles the common case (no missing values)
+    once the Z suffix is stripped, skipping pandas' format inference;
+    anything it rejects is parsed by pandas (missing values become NaT).
+
+    Args:
+        values: Array of timestamp strings.
+
+    Returns:
+        datetime64[ns] array in UTC.
+
+    Raises:
+        ValueError: If the values cannot be parsed as timestamps.
+    """
+    with warnings.catch_warnings():
+        # numpy warns (rather than fails) on values with an offset suffix
+        warnings.simplefilter("error")
+        try:
+            return np.strings.rstrip(values.astype(str), "Z").astype("datetime64[ns]")
+        except (ValueError, Warning):
+            pass
+    return pd.to_datetime(values, utc=True).tz_localize(None).to_numpy()
 
 
 class CSVIndexer:
@@ -63,14 +301,61 @@ class CSVIndexer:
         """
         self.file_path = Path(file_path)
         self.index: Optional[CSVIndex] = None
+        # Float columns seen by the first read_range(); later reads skip
+        # type inference for them. Filled under the lock, since concurrent
+        # reads may race to set it.
+        self._float_columns: Optional[dict[str, type]] = None
+        self._schema_lock = threading.Lock()
+        self.cache_path = self.file_path.with_name(self.file_path.name + INDEX_CACHE_SUFFIX)
+        self.offsets_cache_path = self.file_path.with_name(
+            self.file_path.name + OFFSETS_CACHE_SUFFIX
+        )
+
+    def load_or_build_index(self) -> CSVIndex:
+        """
+        Load the index from its sidecar cache, or build it by scanning.
+
+        A cached index is reused when the file is unchanged, or when it has
+        only grown (the bytes at its start and at the cached end still
+        match); appended rows are then indexed with update_index(). The
+        cache is rewritten whenever the index was built or extended.
+
+        Cached row offsets are memory-mapped rather than loaded, so only
+        the pages read_range() touches are resident.
+
+        Returns:
+            CSVIndex with row offsets and metadata.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file is empty or has no header.
+        """
+        self.index = self._load_cached_index()
+        if self.index is None:
+            self.build_index()
+            changed = True
+        else:
+            try:
+                changed = self.update_index() > 0
+            except ValueError:
+                # Shrunk since the cache was written
+                self.index = None
+                self.build_index()
+                changed = True
+
+        if changed:
+            self._save_cached_index()
+        return self.index
 
     def build_index(self) -> CSVIndex:
         """
         Build byte-offset index by scanning the file.
 
-        Reads the file line by line in binary mode, recording the byte
-        offset of each data row. The header row is parsed to extract
-        column names but is not included in the row offsets.
+        Reads the header with a buffered readline, then memory-maps the
+        file and scans it for row boundaries without per-line reads,
+        recording the byte offset of each data row. The header row is
+        parsed to extract column names but is not included in the row
+        offsets.
 
         Returns:
             CSVIndex with row offsets and metadata.
@@ -86,10 +371,8 @@ class CSVIndexer:
         if file_size == 0:
             raise ValueError(f"CSV file is empty: {self.file_path}")
 
-        offsets: list[int] = []
         columns: list[str] = []
         header_offset = 0
-        malformed_count = 0
 
         with self.file_path.open("rb") as f:
             # Read and parse header
@@ -107,46 +390,14 @@ class CSVIndexer:
                 raise ValueError(f"CSV header is empty: {self.file_path}")
 
             header_offset = f.tell()
-            expected_column_count = len(columns)
 
             # Scan data rows
-            while True:
-                row_offset = f.tell()
-                line = f.readline()
-
-                if not line:
-                    # End of file
-                    break
-
-                # Handle trailing newline without content
-                stripped = line.rstrip(b"\r\n")
-                if not stripped:
-                    # Empty line at end of file, skip
-                    continue
-
-                try:
-                    text = stripped.decode("utf-8")
-                    fields = self._parse_csv_row(text)
-
-                    if len(fields) != expected_column_count:
-                        malformed_count += 1
-                        logger.warning(
-                            "Row %d: expected %d columns, got %d - skipping",
-                            len(offsets) + 1,
-                            expected_column_count,
-                            len(fields),
-                        )
-                        continue
-
-                    offsets.append(row_offset)
-
-                except UnicodeDecodeError:
-                    malformed_count += 1
-                    logger.warning(
-                        "Row %d: invalid UTF-8 encoding - skipping",
-                        len(offsets) + 1,
-                    )
-                    continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _advise_sequential(mm)
+                file_size = len(mm)
+                offsets, malformed_count, tail_offset = self._scan_rows(
+                    mm, header_offset, len(columns), 0
+                )
 
         if malformed_count > 0:
             logger.info(
@@ -155,13 +406,18 @@ class CSVIndexer:
                 malformed_count,
             )
 
+        with self._schema_lock:
+            self._float_columns = None
+        row_length = _fixed_row_length(offsets, header_offset)
         self.index = CSVIndex(
             file_path=self.file_path,
-            row_offsets=np.array(offsets, dtype=np.int64),
+            row_offsets=None if row_length is not None else offsets,
             header_offset=header_offset,
             columns=columns,
             row_count=len(offsets),
             file_size=file_size,
+            tail_offset=header_offset if tail_offset is None else tail_offset,
+            row_length=row_length,
         )
 
         logger.debug(
@@ -178,7 +434,8 @@ class CSVIndexer:
         Read a range of rows from the indexed CSV.
 
         Opens a fresh file handle for thread safety. Seeks directly to
-        the start offset and reads only the required bytes.
+        the start offset and reads only the required bytes (plus the
+        header line).
 
         Args:
             start_row: 0-based inclusive start row index.
@@ -210,33 +467,52 @@ class CSVIndexer:
             )
 
         # Calculate byte range to read
-        start_offset = self.index.row_offsets[start_row]
+        start_offset = self.index.row_offset(start_row)
 
         if end_row >= self.index.row_count:
             # Read to end of file
             end_offset = self.index.file_size
         else:
-            end_offset = self.index.row_offsets[end_row]
+            end_offset = self.index.row_offset(end_row)
 
         bytes_to_read = end_offset - start_offset
 
-        # Read raw bytes
+        # Read raw bytes, preceded by the file's own header line. pandas
+        # parses the bytes directly: no decode to str or text copy.
         with self.file_path.open("rb") as f:
-            f.seek(start_offset)
-            raw_bytes = f.read(bytes_to_read)
-
-        # Decode and parse with pandas
-        text = raw_bytes.decode("utf-8")
-
-        # Prepend header for pandas parsing
-        header_line = ",".join(self.index.columns)
-        csv_text = header_line + "\n" + text
+            _advise_random(f.fileno())
+            if start_row == 0:
+                # The header directly precedes the first row: one read
+                raw_bytes = f.read(end_offset)
+            else:
+                header_bytes = f.read(self.index.header_offset)
+                f.seek(start_offset)
+                raw_bytes = header_bytes + f.read(bytes_to_read)
 
-        df = pd.read_csv(
-            StringIO(csv_text),
-            index_col=0,  # First column as index
-            encoding="utf-8",
-        )
+        dtype = self._float_columns or None
+        try:
+            df = pd.read_csv(
+                BytesIO(raw_bytes),
+                index_col=0,  # First column as index
+                encoding="utf-8",
+                dtype=dtype,
+            )
+        except ValueError:
+            if dtype is None:
+                raise
+            # A cached float column no longer parses as float: infer again
+            with self._schema_lock:
+                if self._float_columns is dtype:
+                    self._float_columns = None
+            df = pd.read_csv(BytesIO(raw_bytes), index_col=0, encoding="utf-8")
+
+        with self._schema_lock:
+            if self._float_columns is None:
+                self._float_columns = {
+                    col: np.float64
+                    for col, col_dtype in df.dtypes.items()
+                    if col_dtype == np.float64
+                }
 
         # Convert UTC timestamps to local time
         df = self._convert_timestamps(df)
@@ -272,65 +548,28 @@ class CSVIndexer:
             )
 
         # File has grown - scan from last known position
-        new_offsets: list[int] = []
-        expected_column_count = len(self.index.columns)
-        malformed_count = 0
-
-        # Determine starting position
-        if self.index.row_count > 0:
-            last_offset = self.index.row_offsets[-1]
-        else:
-            last_offset = self.index.header_offset
-
         with self.file_path.open("rb") as f:
-            f.seek(last_offset)
-
-            # Skip the last indexed row (we already have its offset)
-            if self.index.row_count > 0:
-                f.readline()
-
-            while True:
-                row_offset = f.tell()
-                line = f.readline()
-
-                if not line:
-                    break
-
-                stripped = line.rstrip(b"\r\n")
-                if not stripped:
-                    continue
-
-                try:
-                    text = stripped.decode("utf-8")
-                    fields = self._parse_csv_row(text)
-
-                    if len(fields) != expected_column_count:
-                        malformed_count += 1
-                        logger.warning(
-                            "Row %d: expected %d columns, got %d - skipping",
-                            self.index.row_count + len(new_offsets) + 1,
-                            expected_column_count,
-                            len(fields),
-                        )
-                        continue
-
-                    new_offsets.append(row_offset)
-
-                except UnicodeDecodeError:
-                    malformed_count += 1
-                    logger.warning(
-                        "Row %d: invalid UTF-8 encoding - skipping",
-                        self.index.row_count + len(new_offsets) + 1,
-                    )
-                    continue
-
-        if new_offsets:
-            # Extend the offset array
-            self.index.row_offsets = np.concatenate(
-                [self.index.row_offsets, np.array(new_offsets, dtype=np.int64)]
-            )
-            self.index.row_count = len(self.index.row_offsets)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _advise_sequential(mm)
+                if self.index.row_count > 0:
+                    # Resume after the last indexed row's line terminator
+                    newline = mm.find(b"\n", self.index.tail_offset)
+                    start = len(mm) if newline == -1 else newline + 1
+                else:
+                    start = self.index.header_offset
+
+                new_offsets, malformed_count, tail_offset = self._scan_rows(
+                    mm, start, len(self.index.columns), self.index.row_count
+                )
+
+        if len(new_offsets):
+            if not self._continues_row_length(new_offsets):
+                # Extend the offset array
+                self.index.row_offsets = self._extend_offsets(new_offsets)
+                self.index.row_length = None
+            self.index.row_count += len(new_offsets)
             self.index.file_size = current_size
+            self.index.tail_offset = tail_offset
 
             logger.debug(
                 "Index updated: %d new rows, total %d rows",
@@ -347,6 +586,224 @@ class CSVIndexer:
 
         return len(new_offsets)
 
+    def _continues_row_length(self, new_offsets: np.ndarray) -> bool:
+        """Check whether appended rows keep a fixed-length index implicit."""
+        index = self.index
+        if index.row_length is None:
+            return False
+        expected = index.header_offset + index.row_length * np.arange(
+            index.row_count, index.row_count + len(new_offsets), dtype=np.int64
+        )
+        return np.array_equal(new_offsets, expected)
+
+    def _load_cached_index(self) -> Optional[CSVIndex]:
+        """
+        Load the sidecar index if it still describes the file.
+
+        Returns:
+            Cached CSVIndex, or None if missing, stale or unreadable.
+        """
+        try:
+            stat = self.file_path.stat()
+            with np.load(self.cache_path, allow_pickle=False) as cache:
+                if int(cache["version"]) != _INDEX_CACHE_VERSION:
+                    return None
+                file_size = int(cache["file_size"])
+                if stat.st_size < file_size:
+                    return None
+                if stat.st_size == file_size and stat.st_mtime_ns != int(cache["mtime_ns"]):
+                    return None
+                head, tail = self._cache_check_bytes(file_size)
+                if head != cache["head"].tobytes() or tail != cache["tail"].tobytes():
+                    return None
+
+                row_count = int(cache["row_count"])
+                row_length = int(cache["row_length"]) or None  # 0: offsets file
+                index = CSVIndex(
+                    file_path=self.file_path,
+                    row_offsets=None if row_length else self._map_offsets(row_count),
+                    header_offset=int(cache["header_offset"]),
+                    columns=cache["columns"].tolist(),
+                    row_count=row_count,
+                    file_size=file_size,
+                    tail_offset=int(cache["tail_offset"]),
+                    row_length=row_length,
+                )
+        except FileNotFoundError:
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"CSV file not found: {self.file_path}") from None
+            return None
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            logger.debug("Ignoring unreadable index cache %s: %s", self.cache_path, e)
+            return None
+
+        logger.debug("Loaded cached index for %s: %d rows", self.file_path.name, index.row_count)
+        return index
+
+    def _save_cached_index(self) -> None:
+        """
+        Write the current index to the sidecar cache.
+
+        Failures (e.g. a read-only directory) are logged and ignored.
+        """
+        index = self.index
+        try:
+            # Offsets already mapped from the cache were extended in place
+            # by update_index(); otherwise write them out and map them.
+            # Fixed-length rows need no offsets file.
+            if index.row_length is None and not isinstance(index.row_offsets, np.memmap):
+                temp_path = self.offsets_cache_path.with_name(
+                    self.offsets_cache_path.name + ".tmp"
+                )
+                index.row_offsets.astype("<i8", copy=False).tofile(temp_path)
+                os.replace(temp_path, self.offsets_cache_path)
+                index.row_offsets = self._map_offsets(index.row_count)
+
+            # The metadata is written last: it commits the offsets
+            head, tail = self._cache_check_bytes(index.file_size)
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with temp_path.open("wb") as f:
+                np.savez(
+                    f,
+                    version=_INDEX_CACHE_VERSION,
+                    row_count=index.row_count,
+                    header_offset=index.header_offset,
+                    columns=np.array(index.columns, dtype=str),
+                    file_size=index.file_size,
+                    tail_offset=index.tail_offset,
+                    row_length=index.row_length or 0,
+                    mtime_ns=self.file_path.stat().st_mtime_ns,
+                    head=np.frombuffer(head, dtype=np.uint8),
+                    tail=np.frombuffer(tail, dtype=np.uint8),
+                )
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.debug("Could not write index cache %s: %s", self.cache_path, e)
+
+    def _map_offsets(self, row_count: int) -> np.ndarray:
+        """
+        Memory-map the first row_count offsets of the offsets cache file.
+
+        Args:
+            row_count: Number of offsets to map.
+
+        Returns:
+            Read-only int64 array backed by the file.
+
+        Raises:
+            OSError: If the file is missing.
+            ValueError: If the file is shorter than row_count offsets.
+        """
+        if row_count == 0:
+            return np.empty(0, dtype=np.int64)  # Zero-length files cannot be mapped
+        return np.memmap(self.offsets_cache_path, dtype="<i8", mode="r", shape=(row_count,))
+
+    def _extend_offsets(self, new_offsets: np.ndarray) -> np.ndarray:
+        """
+        Append row offsets to the index.
+
+        Offsets mapped from the cache are written to the offsets file after
+        the indexed rows and remapped, instead of copying the whole array
+        into memory; in-memory offsets are concatenated.
+
+        Args:
+            new_offsets: Offsets of the newly indexed rows.
+
+        Returns:
+            The extended offsets array.
+        """
+        offsets = self.index.offsets()
+        if isinstance(offsets, np.memmap):
+            try:
+                with self.offsets_cache_path.open("r+b") as f:
+                    f.seek(self.index.row_count * 8)
+                    f.write(new_offsets.astype("<i8", copy=False).tobytes())
+                return self._map_offsets(self.index.row_count + len(new_offsets))
+            except (OSError, ValueError) as e:
+                logger.debug("Could not extend cached offsets, keeping them in memory: %s", e)
+        return np.concatenate([offsets, new_offsets])
+
+    def _cache_check_bytes(self, file_size: int) -> tuple[bytes, bytes]:
+        """
+        Read the bytes used to check that a cached index matches the file.
+
+        Args:
+            file_size: File size the index was built at.
+
+        Returns:
+            Tuple of (bytes at the file start, bytes just before file_size).
+        """
+        with self.file_path.open("rb") as f:
+            head = f.read(_INDEX_CACHE_CHECK_BYTES)
+            f.seek(max(file_size - _INDEX_CACHE_CHECK_BYTES, 0))
+            tail = f.read(min(file_size, _INDEX_CACHE_CHECK_BYTES))
+        return head, tail
+
+    def _scan_rows(
+        self,
+        mm: mmap.mmap,
+        start: int,
+        expected_column_count: int,
+        row_base: int,
+    ) -> tuple[np.ndarray, int, Optional[int]]:
+        """
+        Find and validate the data rows from a byte offset to end of file.
+
+        Line boundaries are found with a single vectorized newline search
+        over the mapped bytes instead of reading line by line. Empty lines
+        are skipped; rows with the wrong column count or invalid UTF-8
+        are skipped with a warning. Only the field count is needed: commas
+        are counted for all rows in bulk, and only rows with quotes,
+        non-ASCII bytes or the wrong count are decoded in Python.
+
+        Args:
+            mm: Read-only memory map of the whole file.
+            start: Byte offset to start scanning at (start of a line).
+            expected_column_count: Number of columns in the header.
+            row_base: Rows already indexed before start (for log messages).
+
+        Returns:
+            Tuple of (int64 array of row start offsets, malformed row count,
+            end offset of the last valid row or None if there is none).
+        """
+        starts, ends = _line_bounds(mm, start)
+
+        commas, special = _row_byte_counts(mm, starts, ends)
+
+        # Only quoted/non-ASCII rows and rows with the wrong comma count
+        # need a closer look; everything else is valid as counted
+        valid = np.ones(len(starts), dtype=bool)
+        malformed_count = 0
+        candidates = np.flatnonzero(special | (commas != expected_column_count - 1))
+        for i in candidates.tolist():
+            row_number = row_base + i - malformed_count + 1
+            field_count = int(commas[i]) + 1
+            if special[i]:
+                row = mm[starts[i]:ends[i]]
+                try:
+                    text = row.decode("utf-8")
+                except UnicodeDecodeError:
+                    valid[i] = False
+                    malformed_count += 1
+                    logger.warning("Row %d: invalid UTF-8 encoding - skipping", row_number)
+                    continue
+                if b'"' in row:
+                    field_count = len(self._parse_csv_row(text))
+
+            if field_count != expected_column_count:
+                valid[i] = False
+                malformed_count += 1
+                logger.warning(
+                    "Row %d: expected %d columns, got %d - skipping",
+                    row_number,
+                    expected_column_count,
+                    field_count,
+                )
+
+        valid_ends = ends[valid]
+        tail_offset = int(valid_ends[-1]) if len(valid_ends) else None
+        return starts[valid], malformed_count, tail_offset
+
     def _convert_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert UTC timestamps (ISO 8601 with Z suffix) to local time.
@@ -365,10 +822,11 @@ class CSVIndexer:
         if df.index.dtype == object:
             df.index = self._convert_series_timestamps(df.index)
 
-        # Check each column
-        for col in df.columns:
-            if df[col].dtype == object:
-                df[col] = self._convert_series_timestamps(df[col])
+        # Check each string column; numeric and already-parsed datetime
+        # columns are skipped without touching their values
+        object_columns = df.columns[df.dtypes == object]
+        for col in object_columns:
+            df[col] = self._convert_series_timestamps(df[col])
 
         return df
 
@@ -396,12 +854,11 @@ class CSVIndexer:
             return series
 
         # Check if values match UTC timestamp pattern
-        if not any(_UTC_TIMESTAMP_PATTERN.match(str(v)) for v in sample_values):
+        if not any(_looks_like_utc_timestamp(v) for v in sample_values):
             return series
 
         try:
             # Parse as datetime, convert from UTC to local
-            from datetime import timezone as tz
             import time
             
             # Get local timezone offset
@@ -410,16 +867,13 @@ class CSVIndexer:
             else:
                 local_tz_offset = time.timezone
             
+            # Naive local time: UTC minus the local offset
+            local = _parse_utc_timestamps(series.to_numpy()) - np.timedelta64(
+                local_tz_offset, "s"
+            )
             if isinstance(series, pd.Index):
-                parsed = pd.to_datetime(series, utc=True)
-                # Convert to local timezone then strip tz info for naive local time
-                local = parsed.tz_convert(tz.utc).tz_localize(None) - pd.Timedelta(seconds=local_tz_offset)
-                return local
-            else:
-                parsed = pd.to_datetime(series, utc=True)
-                # Convert to local timezone then strip tz info for naive local time
-                local = parsed.dt.tz_convert(tz.utc).dt.tz_localize(None) - pd.Timedelta(seconds=local_tz_offset)
-                return local
+                return pd.DatetimeIndex(local, name=series.name)
+            return pd.Series(local, index=series.index, name=series.name)
         except (ValueError, TypeError):
             # Parsing failed, return original
             return series
@@ -429,7 +883,7 @@ class CSVIndexer:
         """
         Parse a single CSV row, handling quoted fields.
 
-        Simple parser that handles:
+        Uses the stdlib csv parser (implemented in C), which handles:
         - Comma-separated values
         - Double-quoted fields containing commas
         - Escaped quotes ("") within quoted fields
@@ -440,42 +894,4 @@ class CSVIndexer:
         Returns:
             List of field values.
         """
-        fields: list[str] = []
-        current_field: list[str] = []
-        in_quotes = False
-        i = 0
-        n = len(text)
-
-        while i < n:
-            char = text[i]
-
-            if in_quotes:
-                if char == '"':
-                    # Check for escaped quote
-                    if i + 1 < n and text[i + 1] == '"':
-                        current_field.append('"')
-                        i += 2
-                        continue
-                    else:
-                        in_quotes = False
-                        i += 1
-                        continue
-                else:
-                    current_field.append(char)
-                    i += 1
-            else:
-                if char == '"':
-                    in_quotes = True
-                    i += 1
-                elif char == ",":
-                    fields.append("".join(current_field))
-                    current_field = []
-                    i += 1
-                else:
-                    current_field.append(char)
-                    i += 1
-
-        # Don't forget the last field
-        fields.append("".join(current_field))
-
-        return fields
+        return next(csv.reader((text,)), None) or [""]
@@ -5,11 +5,12 @@ Provides debounced file modification events for follow mode.
 Implements FR-FOLLOW-01 through FR-FOLLOW-09 from specification.
 """
 
+import os
 import time
 import logging
 from pathlib import Path
 from typing import Callable, Optional
-from threading import Lock
+from threading import Condition, Lock, Thread
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileDeletedEvent
@@ -25,6 +26,12 @@ class CSVFileHandler(FileSystemEventHandler):
     
     Debounce timing measures from render completion, not event trigger.
     This prevents update storms when the chart is still rendering.
+    
+    Modify events only mark the file dirty; a worker thread coalesces
+    every event in a debounce window into one size check and at most one
+    callback. Render completion and size reset store single attributes,
+    which is atomic under the GIL, so the lock only guards the size
+    compare-and-update that decides whether the callback fires.
     """
     
     def __init__(
@@ -42,11 +49,19 @@ class CSVFileHandler(FileSystemEventHandler):
         """
         super().__init__()
         self.file_path = file_path.resolve()
+        self._file_name = os.path.normcase(self.file_path.name)
         self.on_change = on_change
         self.last_complete_time = 0.0
         self._lock = Lock()
         self._last_size = self._get_file_size()
         self._file_deleted = False
+        self._changed = Condition()
+        self._dirty = False
+        self._closed = False
+        self._worker = Thread(
+            target=self._process_changes, name="csv-monitor", daemon=True
+        )
+        self._worker.start()
     
     def _get_file_size(self) -> int:
         """Get current file size, returning 0 if file does not exist."""
@@ -55,68 +70,119 @@ class CSVFileHandler(FileSystemEventHandler):
         except (FileNotFoundError, OSError):
             return 0
     
+    def _is_monitored_file(self, src_path: str | bytes) -> bool:
+        """
+        Check whether an event path refers to the monitored file.
+        
+        Events for other files in the directory are rejected by name
+        before paying for Path.resolve() (symlink resolution syscalls).
+        """
+        src_path = os.fsdecode(src_path)
+        if os.path.normcase(os.path.basename(src_path)) != self._file_name:
+            return False
+        return Path(src_path).resolve() == self.file_path
+    
     def on_modified(self, event: FileModifiedEvent) -> None:
         """
         Handle file modification events.
         
-        Applies debouncing based on last render completion time.
-        Detects file truncation via size comparison.
+        Marks the file dirty for the worker thread; the size check and
+        callback happen there, once per debounce window.
         """
         if event.is_directory:
             return
         
-        event_path = Path(event.src_path).resolve()
-        if event_path != self.file_path:
+        if not self._is_monitored_file(event.src_path):
             return
         
-        with self._lock:
-            # Clear deleted flag if file reappears
-            if self._file_deleted:
-                logger.info("Monitored file reappeared: %s", self.file_path)
-                self._file_deleted = False
-            
-            current_time = time.time()
-            
-            # Debounce: skip if insufficient time since last render completion
-            if current_time - self.last_complete_time < DEBOUNCE_INTERVAL:
-                logger.debug(
-                    "Debouncing file change - %.1fs since last render complete",
-                    current_time - self.last_complete_time
-                )
-                return
+        # Clear deleted flag if file reappears
+        if self._file_deleted:
+            logger.info("Monitored file reappeared: %s", self.file_path)
+            self._file_deleted = False
+        
+        with self._changed:
+            self._dirty = True
+            self._changed.notify()
+    
+    def _process_changes(self) -> None:
+        """
+        Worker loop: wait for a change, debounce, then check the size.
+        
+        Debouncing is measured from the last render completion; changes
+        arriving while waiting are folded into the same check.
+        """
+        while True:
+            with self._changed:
+                while not self._dirty and not self._closed:
+                    self._changed.wait()
+                if self._closed:
+                    return
+                
+                # Debounce: wait out the interval since last render completion
+                elapsed = time.monotonic() - self.last_complete_time
+                if elapsed < DEBOUNCE_INTERVAL:
+                    logger.debug(
+                        "Debouncing file change - %.1fs since last render complete",
+                        elapsed
+                    )
+                    self._changed.wait(DEBOUNCE_INTERVAL - elapsed)
+                    continue  # Re-check: a render may have completed meanwhile
+                
+                self._dirty = False
             
-            # Detect file size change
-            current_size = self._get_file_size()
+            self._check_size_change()
+    
+    def _check_size_change(self) -> None:
+        """
+        Compare the file size with the last seen size and fire the callback.
+        
+        Detects file truncation via size comparison.
+        """
+        current_size = self._get_file_size()
+        if current_size == self._last_size:
+            # File modified but size unchanged - likely metadata or same-length content
+            logger.debug("File modified but size unchanged, skipping update")
+            return
+        
+        with self._lock:
             previous_size = self._last_size
-            
             if current_size == previous_size:
-                # File modified but size unchanged - likely metadata or same-length content
-                logger.debug("File modified but size unchanged, skipping update")
                 return
-            
-            is_truncation = current_size < previous_size
-            
-            if is_truncation:
-                logger.warning(
-                    "File truncation detected: %d -> %d bytes. Triggering full reload.",
-                    previous_size,
-                    current_size
-                )
-            else:
-                logger.debug(
-                    "File growth detected: %d -> %d bytes",
-                    previous_size,
-                    current_size
-                )
-            
             self._last_size = current_size
         
+        is_truncation = current_size < previous_size
+        
+        if is_truncation:
+            logger.warning(
+                "File truncation detected: %d -> %d bytes. Triggering full reload.",
+                previous_size,
+                current_size
+            )
+        else:
+            logger.debug(
+                "File growth detected: %d -> %d bytes",
+                previous_size,
+                current_size
+            )
+        
         # Invoke callback outside lock to prevent deadlocks
         try:
             self.on_change(self.file_path, is_truncation)
         except Exception:
             logger.exception("Error in file change callback")
     
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread, dropping any pending change.
+        
+        Args:
+            timeout: Seconds to wait for the worker to exit.
+        """
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        self._worker.join(timeout=timeout)
+    
     def on_deleted(self, event: FileDeletedEvent) -> None:
         """
         Handle file deletion events.
@@ -126,18 +192,16 @@ class CSVFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
         
-        event_path = Path(event.src_path).resolve()
-        if event_path != self.file_path:
+        if not self._is_monitored_file(event.src_path):
             return
         
-        with self._lock:
-            if not self._file_deleted:
-                logger.warning(
-                    "Monitored file deleted: %s. Continuing to poll.",
-                    self.file_path
-                )
-                self._file_deleted = True
-                self._last_size = 0
+        if not self._file_deleted:
+            logger.warning(
+                "Monitored file deleted: %s. Continuing to poll.",
+                self.file_path
+            )
+            self._file_deleted = True
+            self._last_size = 0
     
     def mark_render_complete(self) -> None:
         """
@@ -146,9 +210,8 @@ class CSVFileHandler(FileSystemEventHandler):
         Resets the debounce timer, allowing the next file change
         to trigger an update after DEBOUNCE_INTERVAL elapses.
         """
-        with self._lock:
-            self.last_complete_time = time.time()
-            logger.debug("Render complete marked at %.3f", self.last_complete_time)
+        self.last_complete_time = time.monotonic()
+        logger.debug("Render complete marked at %.3f", self.last_complete_time)
     
     def reset_file_size(self) -> None:
         """
@@ -156,9 +219,8 @@ class CSVFileHandler(FileSystemEventHandler):
         
         Call after a full index rebuild to resynchronize state.
         """
-        with self._lock:
-            self._last_size = self._get_file_size()
-            logger.debug("File size reset to %d bytes", self._last_size)
+        self._last_size = self._get_file_size()
+        logger.debug("File size reset to %d bytes", self._last_size)
 
 
 class CSVMonitor:
@@ -251,6 +313,8 @@ class CSVMonitor:
                 if self._observer.is_alive():
                     logger.warning("Observer thread did not terminate cleanly")
                 
+                self._handler.close()
+                
                 self._observer = None
                 self._handler = None
                 
@@ -264,9 +328,9 @@ class CSVMonitor:
         The next file change will only trigger an update after
         DEBOUNCE_INTERVAL seconds have elapsed.
         """
-        with self._lock:
-            if self._handler is not None:
-                self._handler.mark_render_complete()
+        handler = self._handler
+        if handler is not None:
+            handler.mark_render_complete()
     
     def reset_file_tracking(self) -> None:
         """
@@ -275,9 +339,9 @@ class CSVMonitor:
         Call after a full index rebuild (e.g., after truncation)
         to resynchronize the monitor's internal state.
         """
-        with self._lock:
-            if self._handler is not None:
-                self._handler.reset_file_size()
+        handler = self._handler
+        if handler is not None:
+            handler.reset_file_size()
     
     def trigger_manual_reload(self) -> None:
         """
@@ -4,6 +4,34 @@ Logging Configuration - Consistent logging setup for the application.
 
 import logging
 import sys
+import time
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+
+    asctime otherwise costs a strftime call per record; bursts of records
+    (e.g. per-row warnings while indexing) share one formatted second and
+    only differ in the milliseconds.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached: tuple[int, str] = (-1, "")  # (epoch second, formatted)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._cached
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._cached = (second, formatted)  # Single assignment: thread-safe
+        return self.default_msec_format % (formatted, record.msecs)
 
 
 def configure_logging(level: int = logging.INFO) -> None:
@@ -13,8 +41,6 @@ def configure_logging(level: int = logging.INFO) -> None:
     Args:
         level: Logging level (default: INFO)
     """
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stderr)]
-    )
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(_CachedTimeFormatter(LOG_FORMAT))
+    logging.basicConfig(level=level, handlers=[handler])
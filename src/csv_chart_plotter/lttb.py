@@ -5,18 +5,60 @@ Reduces point density while preserving visual shape of time-series data.
 Two-phase approach: min-max preselection + LTTB refinement.
 Performance: 10-30× faster than pure LTTB with comparable visual fidelity.
 
+Large inputs use tsdownsample's multi-threaded path automatically; the
+thread count can be capped with the TSDOWNSAMPLE_MAX_THREADS environment
+variable.
+
 Reference: https://arxiv.org/abs/2305.00332
 """
 
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
 import numpy as np
-import pandas as pd
 from tsdownsample import MinMaxLTTBDownsampler
 
+# pandas is only needed by downsample_dataframe; import it there
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Default ratio for min-max preselection phase
 # Higher values improve speed but may miss mid-range features
 # Research establishes 4 as optimal balance
 DEFAULT_MINMAX_RATIO = 4
 
+# Shared downsampler: it holds no per-call state, so one instance serves
+# every call (and every thread)
+_MINMAX_LTTB = MinMaxLTTBDownsampler()
+
+# Input length from which downsampling always runs multi-threaded
+_PARALLEL_THRESHOLD = 1_000_000
+
+
+# Long-lived pool for batch downsampling, created on first use
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the shared downsampling thread pool, creating it once."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, 8), thread_name_prefix="lttb"
+            )
+            atexit.register(_POOL.shutdown, wait=False)
+        return _POOL
+
+
+def _use_parallel(n: int, parallel: bool) -> bool:
+    """Whether to run multi-threaded: on request, or for large inputs."""
+    return parallel or n >= _PARALLEL_THRESHOLD
+
 
 def lttb_downsample(
     x: np.ndarray,
@@ -37,7 +79,8 @@ def lttb_downsample(
         y: Y-axis values (numeric data), must be 1D
         threshold: Maximum number of points to return (must be >= 2)
         minmax_ratio: Preselection multiplier (default 4, higher = faster but less detail)
-        parallel: Enable multi-threaded execution (default False)
+        parallel: Enable multi-threaded execution (default False; always
+            enabled from _PARALLEL_THRESHOLD points)
         
     Returns:
         Tuple of (downsampled_x, downsampled_y)
@@ -68,24 +111,23 @@ def lttb_downsample(
         return x.copy(), y.copy()
     
     # Use tsdownsample MinMaxLTTB implementation
-    downsampler = MinMaxLTTBDownsampler()
-    indices = downsampler.downsample(
+    indices = _MINMAX_LTTB.downsample(
         x, y, 
         n_out=threshold, 
         minmax_ratio=minmax_ratio,
-        parallel=parallel
+        parallel=_use_parallel(n, parallel)
     )
     
     return x[indices], y[indices]
 
 
 def downsample_dataframe(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     x_values: np.ndarray,
     threshold: int = 4000,
     minmax_ratio: int = DEFAULT_MINMAX_RATIO,
     parallel: bool = False
-) -> tuple[np.ndarray, pd.DataFrame]:
+) -> tuple[np.ndarray, "pd.DataFrame"]:
     """
     Apply MinMaxLTTB to all columns of a DataFrame.
     
@@ -98,7 +140,8 @@ def downsample_dataframe(
         x_values: X-axis values (same length as df)
         threshold: Maximum points per trace (default 4000)
         minmax_ratio: Preselection multiplier (default 4)
-        parallel: Enable multi-threaded execution (default False)
+        parallel: Enable multi-threaded execution (default False; always
+            enabled from _PARALLEL_THRESHOLD points)
         
     Returns:
         Tuple of (downsampled_x, downsampled_df)
@@ -111,6 +154,8 @@ def downsample_dataframe(
         but this implementation uses a unified index from the first
         column to maintain x-axis alignment across all traces.
     """
+    import pandas as pd
+    
     if threshold < 2:
         raise ValueError("threshold must be >= 2")
     
@@ -143,12 +188,8 @@ def downsample_dataframe(
     )
     sampled_x = x_values[sampled_indices]
     
-    # Apply indices to all columns
-    downsampled_data = {}
-    for col in df.columns:
-        downsampled_data[col] = df[col].iloc[sampled_indices].to_numpy()
-    
-    downsampled_df = pd.DataFrame(downsampled_data)
+    # Apply indices to all columns in one take over the frame's blocks
+    downsampled_df = df.take(sampled_indices).reset_index(drop=True)
     
     return sampled_x, downsampled_df
 
@@ -167,26 +208,74 @@ def compute_lttb_indices(
     
     Args:
         x: X-axis values
-        y: Y-axis values (used for area calculation)
+        y: Y-axis values (used for area calculation); float32 or float64
         threshold: Target number of points
         minmax_ratio: Preselection multiplier (default 4)
-        parallel: Enable multi-threaded execution (default False)
+        parallel: Enable multi-threaded execution (default False; always
+            enabled from _PARALLEL_THRESHOLD points)
         
     Returns:
-        Array of indices selected by MinMaxLTTB algorithm
+        int64 array of indices selected by MinMaxLTTB algorithm
     """
     n = len(x)
     
     if n <= threshold:
-        return np.arange(n)
+        return np.arange(n, dtype=np.int64)
     
     # Use tsdownsample for index computation
-    downsampler = MinMaxLTTBDownsampler()
-    indices = downsampler.downsample(
+    indices = _MINMAX_LTTB.downsample(
         x, y,
         n_out=threshold,
         minmax_ratio=minmax_ratio,
-        parallel=parallel
+        parallel=_use_parallel(n, parallel)
     )
     
-    return indices
+    # tsdownsample returns unsigned indices; int64 matches np.arange and
+    # concatenates with it without promotion to float64
+    return indices.astype(np.int64, copy=False)
+
+
+def compute_lttb_indices_batch(
+    x: np.ndarray,
+    ys: np.ndarray,
+    threshold: int,
+    minmax_ratio: int = DEFAULT_MINMAX_RATIO,
+    parallel: bool = False
+) -> list[np.ndarray]:
+    """
+    Compute MinMaxLTTB sampling indices for several series sharing one x axis.
+    
+    The x array is prepared once for every series, instead of per
+    column. Series are downsampled concurrently on a shared thread pool;
+    tsdownsample releases the GIL while it runs.
+    
+    Args:
+        x: X-axis values shared by all series
+        ys: 2D array (n_series, n) or sequence of 1D Y arrays
+        threshold: Target number of points per series
+        minmax_ratio: Preselection multiplier (default 4)
+        parallel: Enable multi-threaded execution (default False; always
+            enabled from _PARALLEL_THRESHOLD points)
+        
+    Returns:
+        List with one int64 index array per series, in input order
+    """
+    n = len(x)
+    
+    if n <= threshold:
+        return [np.arange(n, dtype=np.int64) for _ in ys]
+    
+    x = np.ascontiguousarray(x)
+    use_parallel = _use_parallel(n, parallel)
+    
+    def downsample(y: np.ndarray) -> np.ndarray:
+        return _MINMAX_LTTB.downsample(
+            x, np.ascontiguousarray(y),
+            n_out=threshold,
+            minmax_ratio=minmax_ratio,
+            parallel=use_parallel
+        ).astype(np.int64, copy=False)
+    
+    if len(ys) <= 1 or (os.cpu_count() or 1) <= 1:
+        return [downsample(y) for y in ys]
+    return list(_get_pool().map(downsample, ys))
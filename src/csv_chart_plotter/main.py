@@ -68,35 +68,32 @@ class PyWebViewAPI:
         return _app_state.get("selected_file")
 
 
-def find_available_port(start: int = 8050, max_attempts: int = 100) -> int:
+def find_available_port(start: int = 8050) -> int:
     """
-    Find an available port starting from the given port.
+    Find an available port, preferring the given port.
 
-    Iterates through ports beginning at `start`, testing each for availability
-    by attempting to bind a socket. Returns the first port that can be bound.
+    Tries to bind `start`; if it is taken, binds port 0 once and lets the
+    OS pick a free port, instead of probing ports one by one.
 
     Args:
-        start: Port to start searching from.
-        max_attempts: Maximum number of ports to try.
+        start: Preferred port.
 
     Returns:
         Available port number.
 
     Raises:
-        RuntimeError: If no available port found within max_attempts.
+        RuntimeError: If no port could be bound.
     """
-    for offset in range(max_attempts):
-        port = start + offset
+    for port in (start, 0):
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.bind(("127.0.0.1", port))
+                port = sock.getsockname()[1]
                 logger.debug("Found available port: %d", port)
                 return port
         except OSError:
             continue
-    raise RuntimeError(
-        f"No available port found in range {start}-{start + max_attempts - 1}"
-    )
+    raise RuntimeError(f"No available port found (port {start} and OS-assigned)")
 
 
 def validate_file(file_path: Path) -> None:
@@ -194,9 +191,9 @@ def main() -> int:
 
             logger.info("Loading CSV: %s", csv_path)
 
-            # Build index and load data
+            # Build (or load the cached) index and load data
             indexer = CSVIndexer(csv_path)
-            index = indexer.build_index()
+            index = indexer.load_or_build_index()
 
             logger.info(
                 "Indexed %d rows, %d columns from %s",
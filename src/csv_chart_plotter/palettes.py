@@ -72,3 +72,19 @@ def get_trace_color(index: int, theme: str = 'light') -> str:
     """
     palette = DARK_PALETTE if theme == 'dark' else LIGHT_PALETTE
     return palette[index % len(palette)]
+
+
+def get_trace_colors(count: int, theme: str = 'light') -> list[str]:
+    """
+    Get colors for the first `count` traces, cycling through the palette.
+
+    Args:
+        count: Number of traces
+        theme: 'light' or 'dark'
+
+    Returns:
+        List of hex color strings, one per trace
+    """
+    palette = DARK_PALETTE if theme == 'dark' else LIGHT_PALETTE
+    repeats, remainder = divmod(count, len(palette))
+    return palette * repeats + palette[:remainder]
@@ -28,7 +28,7 @@ def temp_csv_file():
     temp_path.unlink(missing_ok=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def numeric_dataframe():
     """DataFrame with all numeric columns."""
     return pd.DataFrame({
@@ -38,7 +38,7 @@ def numeric_dataframe():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_dataframe():
     """DataFrame with mixed numeric and non-numeric columns."""
     return pd.DataFrame({
@@ -49,7 +49,7 @@ def mixed_dataframe():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dataframe_with_nans():
     """DataFrame with various NaN patterns."""
     return pd.DataFrame({
@@ -84,10 +84,14 @@ def empty_csv_file():
     Path(f.name).unlink(missing_ok=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_numeric_arrays():
-    """Generate large arrays for LTTB downsampling tests."""
+    """Generate large arrays for LTTB downsampling tests (seeded, read-only)."""
     n = 10000
+    rng = np.random.default_rng(0)
     x = np.arange(n, dtype=np.float64)
-    y = np.sin(x / 100) + np.random.normal(0, 0.1, n)
+    y = np.sin(x / 100) + rng.normal(0, 0.1, n)
+    # Shared across the session: fail loudly if a test writes to them
+    x.flags.writeable = False
+    y.flags.writeable = False
     return x, y
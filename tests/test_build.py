@@ -0,0 +1,143 @@
+"""Unit tests for the build script (build.py)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def fake_upx(tmp_path, monkeypatch):
+    """Stand-in UPX recording its command lines; -t reports packed files."""
+    exe = tmp_path / "app.exe"
+    exe.write_bytes(b"\0" * 1024)
+    calls = []
+    packed = {"value": False}
+
+    def run(cmd, **kwargs):
+        calls.append(cmd[1:])
+        if cmd[1] == "-t":
+            return subprocess.CompletedProcess(cmd, 0 if packed["value"] else 2, "", "")
+        if packed["value"]:
+            return subprocess.CompletedProcess(cmd, 2, "", "AlreadyPackedException")
+        packed["value"] = True
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setattr(build.shutil, "which", lambda name: "upx")
+    monkeypatch.setattr(build.subprocess, "run", run)
+    return exe, calls
+
+
+class TestCompressArtifact:
+    """Tests for compress_artifact()."""
+
+    def test_compresses_unpacked_executable(self, fake_upx):
+        """An unpacked executable is compressed with LZMA."""
+        exe, calls = fake_upx
+
+        assert build.compress_artifact(exe)
+        assert calls[-1] == ["--best", "--lzma", str(exe)]
+
+    def test_reused_packed_executable_is_not_recompressed(self, fake_upx):
+        """A second run over an already packed executable still succeeds."""
+        exe, calls = fake_upx
+        assert build.compress_artifact(exe)
+        calls.clear()
+
+        assert build.compress_artifact(exe)
+        assert calls == [["-t", "-q", str(exe)]]
+
+
+class TestCheckCompiler:
+    """Tests for check_compiler() on Windows."""
+
+    @pytest.fixture(autouse=True)
+    def windows(self, monkeypatch):
+        """Pretend to run on Windows with the probe cache bypassed."""
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setattr(build, "check_compiler", build.check_compiler.__wrapped__)
+
+    def test_cl_on_path_without_vswhere(self, monkeypatch):
+        """An MSVC on PATH is accepted when vswhere finds no installation."""
+        monkeypatch.setattr(build, "_find_visual_studio", lambda: None)
+        monkeypatch.setattr(build.shutil, "which", lambda name: r"C:\VC\bin\cl.exe")
+
+        assert build.check_compiler()
+        assert build._msvc_environment() == {}  # Existing environment is kept
+
+    def test_no_compiler_fails(self, monkeypatch):
+        """Without vswhere or cl.exe on PATH the check fails."""
+        monkeypatch.setattr(build, "_find_visual_studio", lambda: None)
+        monkeypatch.setattr(build.shutil, "which", lambda name: None)
+
+        assert not build.check_compiler()
+
+
+class TestLowPriority:
+    """Tests for the --nice process priority helpers."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX niceness")
+    def test_child_is_reniced_without_preexec_fn(self):
+        """The child starts normally and is reniced by +10 afterwards."""
+        assert "preexec_fn" not in build._low_priority_popen_kwargs()
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            build._lower_priority(proc.pid)
+            expected = min(os.getpriority(os.PRIO_PROCESS, 0) + 10, 19)
+            assert os.getpriority(os.PRIO_PROCESS, proc.pid) == expected
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+class TestCheckNuitka:
+    """Tests for check_nuitka() version parsing."""
+
+    @pytest.fixture(autouse=True)
+    def uncached(self, monkeypatch):
+        """Bypass the probe cache."""
+        monkeypatch.setattr(build, "check_nuitka", build.check_nuitka.__wrapped__)
+
+    @pytest.mark.parametrize(
+        "output, ok",
+        [("2.8.9\nCommercial: None\n", True), ("4.0\n", True), ("2.8\n", False), ("1.9.7\n", False)],
+    )
+    def test_minimum_version(self, monkeypatch, output, ok):
+        """Versions are compared numerically against MIN_NUITKA_VERSION."""
+        monkeypatch.setattr(
+            build.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, output, ""),
+        )
+
+        assert build.check_nuitka() is ok
+
+
+class TestDiskCache:
+    """Tests for the disk_cache() probe decorator."""
+
+    def test_toolchain_change_invalidates_cached_probe(self, tmp_path, monkeypatch):
+        """A cached success is not reused after Nuitka or the compiler changes."""
+        calls = []
+
+        @build.disk_cache(tmp_path / "probe.json", ttl=3600)
+        def probe():
+            calls.append(1)
+            return True
+
+        monkeypatch.setattr(build, "_compiler_path", lambda: "/usr/bin/gcc")
+        monkeypatch.setattr(build, "_nuitka_version", lambda: "2.8.9")
+        assert probe() and probe()
+        assert len(calls) == 1
+
+        monkeypatch.setattr(build, "_nuitka_version", lambda: "2.9.0")
+        assert probe()
+        assert len(calls) == 2
+
+        monkeypatch.setattr(build, "_compiler_path", lambda: "/opt/cc/bin/gcc")
+        assert probe()
+        assert len(calls) == 3
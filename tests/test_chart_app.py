@@ -1,10 +1,20 @@
 """Unit tests for chart application module."""
 
+import base64
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from dash import no_update
+from dash import Patch, no_update
+
+from csv_chart_plotter.column_filter import filter_numeric_columns
+from csv_chart_plotter.csv_indexer import CSVIndexer
 
 from csv_chart_plotter.chart_app import (
     create_traces,
@@ -12,9 +22,39 @@ from csv_chart_plotter.chart_app import (
     create_empty_figure,
     create_layout,
     _compute_y_range_for_x_viewport,
+    _append_rows,
+    _adopt_follow_prefetch,
+    _column_matrix,
+    _get_x_values,
+    _lttb_indices,
+    _read_follow_data,
+    _refine_viewport_indices,
+    _relayout_x_range,
+    _restyle_visibility,
+    _schedule_follow_read,
+    _tail_starts,
+    _to_typed_array,
+    _visible_columns,
+    _x_range_bounds,
+    MAX_DISPLAY_POINTS,
+    create_app,
 )
 
 
+def _decode_typed_array(spec: dict) -> np.ndarray:
+    """Decode a Plotly typed array spec."""
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+
+
+def _patched(patch: Patch) -> dict:
+    """Map the dotted locations assigned by a Patch to their values."""
+    return {
+        ".".join(map(str, op["location"])): op["params"]["value"]
+        for op in patch.to_plotly_json()["operations"]
+        if op["operation"] == "Assign"
+    }
+
+
 class TestCreateTraces:
     """Tests for create_traces()."""
 
@@ -35,7 +75,7 @@ class TestCreateTraces:
         traces = create_traces(numeric_dataframe, x_values, theme="light")
 
         for trace in traces:
-            assert trace.mode == "lines"
+            assert trace["mode"] == "lines"
 
     def test_traces_have_connectgaps_false(self, numeric_dataframe):
         """All traces have connectgaps=False for NaN handling."""
@@ -45,7 +85,7 @@ class TestCreateTraces:
         traces = create_traces(numeric_dataframe, x_values, theme="light")
 
         for trace in traces:
-            assert trace.connectgaps is False
+            assert trace["connectgaps"] is False
 
     def test_traces_are_scattergl(self, numeric_dataframe):
         """All traces are ScatterGL for performance."""
@@ -55,7 +95,10 @@ class TestCreateTraces:
         traces = create_traces(numeric_dataframe, x_values, theme="light")
 
         for trace in traces:
-            assert isinstance(trace, go.Scattergl)
+            assert trace["type"] == "scattergl"
+
+        fig = go.Figure(data=traces)
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
 
     def test_traces_have_column_names(self, numeric_dataframe):
         """Trace names match DataFrame column names."""
@@ -64,9 +107,340 @@ class TestCreateTraces:
 
         traces = create_traces(numeric_dataframe, x_values, theme="light")
 
-        trace_names = [t.name for t in traces]
+        trace_names = [t["name"] for t in traces]
         assert trace_names == ["col1", "col2", "col3"]
 
+    def test_traces_apply_legend_visibility(self, numeric_dataframe):
+        """Traces take their visibility from the name -> visible map."""
+        x_array = np.arange(len(numeric_dataframe), dtype=np.float64)
+        x_values = (x_array, x_array)
+
+        traces = create_traces(
+            numeric_dataframe, x_values, theme="light", visibility={"col2": "legendonly"}
+        )
+
+        assert [t["visible"] for t in traces] == [True, "legendonly", True]
+
+    def test_trace_values_are_float32(self, numeric_dataframe):
+        """Trace Y values are sent as float32 (WebGL precision)."""
+        x_array = np.arange(len(numeric_dataframe), dtype=np.float64)
+        x_values = (x_array, x_array)
+
+        traces = create_traces(numeric_dataframe, x_values, theme="light")
+
+        for trace, col in zip(traces, numeric_dataframe.columns):
+            assert trace["y"]["dtype"] == "f4"
+            y = _decode_typed_array(trace["y"])
+            np.testing.assert_allclose(y, numeric_dataframe[col].to_numpy(), rtol=1e-6)
+
+    def test_datetime_x_sent_as_epoch_milliseconds(self, numeric_dataframe):
+        """Datetime x values become float64 epoch milliseconds."""
+        dates = pd.date_range("2025-01-01", periods=len(numeric_dataframe), freq="s")
+        display_x = dates.to_numpy()
+        x_values = (display_x, display_x.astype("int64"))
+
+        traces = create_traces(numeric_dataframe, x_values, theme="light")
+
+        assert traces[0]["x"]["dtype"] == "f8"
+        x = _decode_typed_array(traces[0]["x"])
+        assert x[0] == dates[0].value / 1e6
+        assert x[1] - x[0] == 1000.0
+
+
+class TestLttbIndexCache:
+    """Tests for _lttb_indices() incremental reuse."""
+
+    def test_appended_rows_extend_cached_indices(self):
+        """Appended rows keep the cached prefix and downsample only the tail."""
+        x = np.arange(103_000, dtype=np.int64)
+        y = np.sin(x / 500.0)
+        cache = {}
+
+        [first] = _lttb_indices(x[:100_000], y[None, :100_000], ["col"], cache)
+        [second] = _lttb_indices(x, y[None, :], ["col"], cache)
+
+        assert len(first) == MAX_DISPLAY_POINTS
+        np.testing.assert_array_equal(second[: len(first) - 1], first[:-1])
+        assert second[-1] == len(x) - 1
+        assert np.all(np.diff(second) > 0)
+
+    def test_large_append_triggers_full_recompute(self):
+        """Appending beyond the rebuild ratio re-downsamples from scratch."""
+        x = np.arange(200_000, dtype=np.int64)
+        y = np.cos(x / 300.0)
+        cache = {}
+
+        _lttb_indices(x[:100_000], y[None, :100_000], ["col"], cache)
+        [indices] = _lttb_indices(x, y[None, :], ["col"], cache)
+
+        assert len(indices) == MAX_DISPLAY_POINTS
+        assert cache["col"][2] == len(x)
+
+
+class TestRefineViewportIndices:
+    """Tests for _refine_viewport_indices() visible-slice downsampling."""
+
+    def test_viewport_downsampled_at_full_density(self):
+        """Rows in the viewport get their own sample; overview points remain."""
+        x = np.arange(1_000_000, dtype=np.int64)
+        Y = np.sin(x / 700.0)[None, :]
+        [full] = _lttb_indices(x, Y, ["col"], None)
+
+        [refined] = _refine_viewport_indices(x, Y, [full], (500_000, 520_000))
+
+        inside = refined[(refined >= 500_000) & (refined < 520_000)]
+        assert len(inside) > MAX_DISPLAY_POINTS * 0.9
+        assert refined[0] == 0 and refined[-1] == len(x) - 1
+        assert np.all(np.diff(refined) > 0)
+
+    def test_viewport_covering_all_rows_keeps_indices(self):
+        """A viewport spanning the whole series leaves indices unchanged."""
+        x = np.arange(100_000, dtype=np.int64)
+        Y = np.cos(x / 300.0)[None, :]
+        [full] = _lttb_indices(x, Y, ["col"], None)
+
+        [refined] = _refine_viewport_indices(x, Y, [full], (-1, 200_000))
+
+        assert refined is full
+
+
+class TestTailStarts:
+    """Tests for _tail_starts() follow-mode streaming check."""
+
+    def test_incremental_downsample_streams_tail(self):
+        """Indices from an incremental LTTB update extend the plotted ones."""
+        x = np.arange(103_000, dtype=np.int64)
+        Y = np.sin(x / 500.0)[None, :]
+        cache = {}
+        plotted = _lttb_indices(x[:100_000], Y[:, :100_000], ["col"], cache)
+        indices = _lttb_indices(x, Y, ["col"], cache)
+
+        assert _tail_starts(plotted, indices) == [len(plotted[0])]
+
+    def test_changed_prefix_is_not_streamed(self):
+        """Any change before the end of a trace requires a full update."""
+        plotted = [np.array([0, 5, 9])]
+
+        assert _tail_starts(plotted, [np.array([0, 4, 9, 12])]) is None
+        assert _tail_starts(None, [np.array([0, 4, 9])]) is None
+
+
+class TestXRangeBounds:
+    """Tests for _x_range_bounds()."""
+
+    def test_datetime_range_to_nanoseconds(self):
+        """Plotly date strings map onto the int64 nanosecond x axis."""
+        index = pd.date_range("2025-01-01", periods=10, freq="s")
+
+        bounds = _x_range_bounds(["2025-01-01 00:00:02", "2025-01-01T00:00:05+00:00"], index)
+
+        assert bounds == (index[2].value, index[5].value)
+
+    def test_missing_range_returns_none(self):
+        """No range means no viewport clipping."""
+        assert _x_range_bounds(None, pd.RangeIndex(10)) is None
+
+
+class TestColumnMatrix:
+    """Tests for _column_matrix()."""
+
+    def test_single_block_rows_are_columns(self, numeric_dataframe):
+        """A single-block frame yields one contiguous float32 row per column."""
+        Y = _column_matrix(numeric_dataframe)
+
+        assert Y.dtype == np.float32
+        assert Y.flags["C_CONTIGUOUS"]
+        for row, col in zip(Y, numeric_dataframe.columns):
+            np.testing.assert_allclose(row, numeric_dataframe[col], rtol=1e-6)
+
+    def test_mixed_blocks_keep_column_order(self):
+        """Frames with several dtype blocks fall back to to_numpy()."""
+        df = pd.DataFrame({
+            "a": np.arange(5, dtype=np.int64),
+            "b": np.linspace(0, 1, 5),
+            "c": np.arange(5, 10, dtype=np.int32),
+        })
+
+        Y = _column_matrix(df)
+
+        np.testing.assert_array_equal(Y[0], df["a"])
+        np.testing.assert_allclose(Y[1], df["b"], rtol=1e-6)
+        np.testing.assert_array_equal(Y[2], df["c"])
+
+    def test_changed_block_internals_fall_back(self, numeric_dataframe, monkeypatch):
+        """Missing pandas block attributes fall back to to_numpy()."""
+        from pandas.core.internals.blocks import NumpyBlock
+
+        def missing(self):
+            raise AttributeError("mgr_locs")
+
+        monkeypatch.setattr(NumpyBlock, "mgr_locs", property(missing), raising=False)
+        df = numeric_dataframe[["col1", "col3"]]
+
+        Y = _column_matrix(df)
+
+        assert Y.dtype == np.float32
+        assert Y.flags.c_contiguous
+        np.testing.assert_allclose(Y, df.to_numpy().T, rtol=1e-6)
+
+
+class TestGetXValues:
+    """Tests for _get_x_values()."""
+
+    def test_datetime_index_numeric_view(self):
+        """Numeric x for a datetime index is a zero-copy int64 view."""
+        dates = pd.date_range("2025-01-01", periods=5, freq="s")
+        df = pd.DataFrame({"value": range(5)}, index=dates)
+
+        display_x, numeric_x = _get_x_values(df)
+
+        assert numeric_x.dtype == np.int64
+        assert np.shares_memory(display_x, numeric_x)
+        assert numeric_x[0] == dates[0].value
+
+    def test_tz_aware_index_uses_utc(self):
+        """Timezone-aware datetimes are plotted as UTC wall time."""
+        dates = pd.date_range("2025-01-01", periods=5, freq="s", tz="Europe/Berlin")
+        df = pd.DataFrame({"value": range(5)}, index=dates)
+
+        display_x, numeric_x = _get_x_values(df)
+
+        assert np.issubdtype(display_x.dtype, np.datetime64)
+        np.testing.assert_array_equal(numeric_x, dates.asi8)
+
+
+class TestAppendRows:
+    """Tests for _append_rows()."""
+
+    def test_appends_only_new_rows(self, temp_csv_file):
+        """New rows are read and appended to the cached numeric data."""
+        indexer = CSVIndexer(temp_csv_file)
+        index = indexer.build_index()
+        loaded_rows = index.row_count
+        df = filter_numeric_columns(indexer.read_range(0, loaded_rows))
+        with open(temp_csv_file, "a") as f:
+            f.write("2025-01-01T10:03:00Z,4.0,40.0,D\n")
+        indexer.update_index()
+
+        result = _append_rows(indexer, df, loaded_rows)
+
+        assert list(result.columns) == ["Value1", "Value2"]
+        assert result["Value1"].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert isinstance(result.index, pd.DatetimeIndex)
+
+    def test_returns_none_for_non_numeric_tail(self, temp_csv_file):
+        """A non-numeric value in an appended row requires a full re-read."""
+        indexer = CSVIndexer(temp_csv_file)
+        index = indexer.build_index()
+        loaded_rows = index.row_count
+        df = filter_numeric_columns(indexer.read_range(0, loaded_rows))
+        with open(temp_csv_file, "a") as f:
+            f.write("2025-01-01T10:03:00Z,oops,40.0,D\n")
+        indexer.update_index()
+
+        assert _append_rows(indexer, df, loaded_rows) is None
+
+
+class TestReadFollowData:
+    """Tests for _read_follow_data()."""
+
+    def test_reads_appended_rows(self, temp_csv_file):
+        """Appended rows are returned with the new row count."""
+        indexer = CSVIndexer(temp_csv_file)
+        index = indexer.build_index()
+        loaded_rows = index.row_count
+        df = filter_numeric_columns(indexer.read_range(0, loaded_rows))
+        cache = {}
+        with open(temp_csv_file, "a") as f:
+            f.write("2025-01-01T10:03:00Z,4.0,40.0,D\n")
+
+        new_rows, result, row_count, result_cache = _read_follow_data(
+            indexer, df, loaded_rows, cache
+        )
+
+        assert new_rows == 1
+        assert row_count == loaded_rows + 1
+        assert result["Value1"].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert result_cache is cache
+
+    def test_no_new_rows_returns_inputs(self, temp_csv_file):
+        """Without new rows the loaded data is returned unchanged."""
+        indexer = CSVIndexer(temp_csv_file)
+        index = indexer.build_index()
+        df = filter_numeric_columns(indexer.read_range(0, index.row_count))
+
+        new_rows, result, row_count, _ = _read_follow_data(
+            indexer, df, index.row_count, {}
+        )
+
+        assert new_rows == 0
+        assert result is df
+        assert row_count == index.row_count
+
+
+class TestFollowPrefetch:
+    """Tests for _schedule_follow_read() and _adopt_follow_prefetch()."""
+
+    def test_background_read_leaves_app_state_until_adopted(self, temp_csv_file):
+        """The worker extends copies; the tick swaps them in, then catches up."""
+        indexer = CSVIndexer(temp_csv_file)
+        index = indexer.build_index()
+        df = filter_numeric_columns(indexer.read_range(0, index.row_count))
+        cache = {}
+        app = SimpleNamespace(
+            _csv_indexer=indexer,
+            _current_df=df,
+            _current_row_count=index.row_count,
+            _lttb_cache=cache,
+            _plotted_indices=None,
+            _follow_executor=ThreadPoolExecutor(max_workers=1),
+        )
+        with open(temp_csv_file, "a") as f:
+            f.write("2025-01-01T10:03:00Z,4.0,40.0,D\n")
+
+        _schedule_follow_read(app)
+        prefetch = app._follow_future.result()
+        app._follow_executor.shutdown()
+
+        assert indexer.index.row_count == 3
+        assert app._current_df is df
+        assert app._lttb_cache is cache
+
+        with open(temp_csv_file, "a") as f:
+            f.write("2025-01-01T10:04:00Z,5.0,50.0,E\n")
+        assert _adopt_follow_prefetch(app, prefetch) == 1
+        assert app._current_row_count == 4
+
+        new_rows, result, row_count, _ = _read_follow_data(
+            app._csv_indexer, app._current_df, app._current_row_count, app._lttb_cache
+        )
+
+        assert new_rows == 1
+        assert row_count == 5
+        assert result["Value1"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+class TestToTypedArray:
+    """Tests for _to_typed_array()."""
+
+    def test_round_trips_float32(self):
+        """Encoded bytes decode back to the original values."""
+        values = np.array([1.5, -2.25, 3.0], dtype=np.float32)
+
+        spec = _to_typed_array(values)
+
+        assert spec["dtype"] == "f4"
+        decoded = _decode_typed_array(spec)
+        np.testing.assert_array_equal(decoded, values)
+
+    def test_unsupported_dtype_sent_as_float64(self):
+        """int64 (not decodable by plotly.js) is widened to float64."""
+        spec = _to_typed_array(np.array([1, 2, 3], dtype=np.int64))
+
+        assert spec["dtype"] == "f8"
+        decoded = _decode_typed_array(spec)
+        np.testing.assert_array_equal(decoded, [1.0, 2.0, 3.0])
+
 
 class TestCreateEmptyFigure:
     """Tests for create_empty_figure()."""
@@ -75,21 +449,24 @@ class TestCreateEmptyFigure:
         """Create figure with no data and appropriate annotation."""
         fig = create_empty_figure(theme="light")
 
-        assert isinstance(fig, go.Figure)
-        assert len(fig.data) == 0
+        assert isinstance(fig, dict)
+        assert len(fig["data"]) == 0
 
         # Should have "No data loaded" annotation
-        annotations = fig.layout.annotations
+        annotations = fig["layout"]["annotations"]
         assert len(annotations) == 1
-        assert "No data" in annotations[0].text
+        assert "No data" in annotations[0]["text"]
+
+        # Valid Plotly figure spec
+        go.Figure(fig)
 
     def test_empty_figure_respects_theme(self):
         """Empty figure applies theme colors."""
         fig_light = create_empty_figure(theme="light")
         fig_dark = create_empty_figure(theme="dark")
 
-        assert fig_light.layout.paper_bgcolor == "#ffffff"
-        assert fig_dark.layout.paper_bgcolor == "#1a1a1a"
+        assert fig_light["layout"]["paper_bgcolor"] == "#ffffff"
+        assert fig_dark["layout"]["paper_bgcolor"] == "#1a1a1a"
 
 
 class TestCreateFigure:
@@ -102,8 +479,11 @@ class TestCreateFigure:
 
         fig = create_figure(numeric_dataframe, x_values, theme="light")
 
-        assert isinstance(fig, go.Figure)
-        assert len(fig.data) == 3  # Three traces
+        assert isinstance(fig, dict)
+        assert len(fig["data"]) == 3  # Three traces
+
+        # Valid Plotly figure spec
+        assert len(go.Figure(fig).data) == 3
 
     def test_create_figure_theme_colors(self, numeric_dataframe):
         """Figure layout reflects theme setting."""
@@ -112,8 +492,8 @@ class TestCreateFigure:
 
         fig = create_figure(numeric_dataframe, x_values, theme="dark")
 
-        assert fig.layout.paper_bgcolor == "#1a1a1a"
-        assert fig.layout.plot_bgcolor == "#1a1a1a"
+        assert fig["layout"]["paper_bgcolor"] == "#1a1a1a"
+        assert fig["layout"]["plot_bgcolor"] == "#1a1a1a"
 
 
 class TestCreateLayout:
@@ -123,28 +503,33 @@ class TestCreateLayout:
         """Light theme has white background."""
         layout = create_layout(theme="light")
 
-        assert layout.paper_bgcolor == "#ffffff"
-        assert layout.plot_bgcolor == "#ffffff"
+        assert layout["paper_bgcolor"] == "#ffffff"
+        assert layout["plot_bgcolor"] == "#ffffff"
 
     def test_create_layout_dark_theme(self):
         """Dark theme has dark background."""
         layout = create_layout(theme="dark")
 
-        assert layout.paper_bgcolor == "#1a1a1a"
-        assert layout.plot_bgcolor == "#1a1a1a"
+        assert layout["paper_bgcolor"] == "#1a1a1a"
+        assert layout["plot_bgcolor"] == "#1a1a1a"
 
     def test_layout_has_legend_config(self):
         """Layout includes legend configuration."""
         layout = create_layout(theme="light")
 
-        assert layout.legend is not None
-        assert layout.legend.orientation == "v"
+        assert layout["legend"] is not None
+        assert layout["legend"]["orientation"] == "v"
 
     def test_layout_has_yaxis_fixedrange(self):
         """Y-axis has fixedrange=True for X-only zoom behavior."""
         layout = create_layout(theme="light")
 
-        assert layout.yaxis.fixedrange is True
+        assert layout["yaxis"]["fixedrange"] is True
+
+    def test_layout_is_memoized_per_theme(self):
+        """Repeated calls for a theme return the same layout."""
+        assert create_layout(theme="light") is create_layout(theme="light")
+        assert create_layout(theme="light") is not create_layout(theme="dark")
 
 
 class TestComputeYRangeForXViewport:
@@ -159,36 +544,33 @@ class TestComputeYRangeForXViewport:
             index=dates,
         )
 
-        # Current figure with layout and trace visibility
-        current_figure = {
-            "layout": {"yaxis": {"autorange": True}},
-            "data": [{"name": "value", "visible": True}],
-        }
-
         # Zoom to middle portion (rows 2-5 with values 10, 4, 5, 6)
         relayout_data = {
             "xaxis.range[0]": dates[2].isoformat(),
             "xaxis.range[1]": dates[5].isoformat(),
         }
 
-        result = _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+        result = _compute_y_range_for_x_viewport(relayout_data, df, ["value"])
 
         assert result != no_update
-        assert "layout" in result
-        y_range = result["layout"]["yaxis"]["range"]
+        # Only the Y axis is sent back; the traces stay in the browser
+        updates = _patched(result)
+        assert set(updates) == {"layout.yaxis.range", "layout.yaxis.autorange"}
+        assert updates["layout.yaxis.autorange"] is False
+        y_range = updates["layout.yaxis.range"]
         # Y range should be based on values 10, 4, 5, 6 (min=4, max=10) with padding
         assert y_range[0] < 4  # Lower bound with padding
         assert y_range[1] > 10  # Upper bound with padding
 
     def test_returns_no_update_when_no_df(self):
         """Return no_update when DataFrame is None."""
-        result = _compute_y_range_for_x_viewport({}, {}, None)
+        result = _compute_y_range_for_x_viewport({}, None, ["value"])
         assert result == no_update
 
     def test_returns_no_update_when_missing_x_range(self):
         """Return no_update when relayout_data lacks X range."""
         df = pd.DataFrame({"value": [1, 2, 3]})
-        result = _compute_y_range_for_x_viewport({}, {"autosize": True}, df)
+        result = _compute_y_range_for_x_viewport({"autosize": True}, df, ["value"])
         assert result == no_update
 
     def test_handles_xaxis_range_list_format(self):
@@ -196,18 +578,14 @@ class TestComputeYRangeForXViewport:
         dates = pd.date_range("2025-01-01", periods=5, freq="h")
         df = pd.DataFrame({"value": [1, 5, 3, 7, 2]}, index=dates)
 
-        current_figure = {
-            "layout": {"yaxis": {}},
-            "data": [{"name": "value", "visible": True}],
-        }
         relayout_data = {
             "xaxis.range": [dates[1].isoformat(), dates[3].isoformat()],
         }
 
-        result = _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+        result = _compute_y_range_for_x_viewport(relayout_data, df, ["value"])
 
         assert result != no_update
-        y_range = result["layout"]["yaxis"]["range"]
+        y_range = _patched(result)["layout.yaxis.range"]
         # Values in range: 5, 3, 7 (min=3, max=7)
         assert y_range[0] < 3
         assert y_range[1] > 7
@@ -219,19 +597,15 @@ class TestComputeYRangeForXViewport:
             index=[0, 1, 2, 3, 4],  # Numeric index
         )
 
-        current_figure = {
-            "layout": {"yaxis": {}},
-            "data": [{"name": "value", "visible": True}],
-        }
         relayout_data = {
             "xaxis.range[0]": "1",
             "xaxis.range[1]": "3",
         }
 
-        result = _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+        result = _compute_y_range_for_x_viewport(relayout_data, df, ["value"])
 
         assert result != no_update
-        y_range = result["layout"]["yaxis"]["range"]
+        y_range = _patched(result)["layout.yaxis.range"]
         # Values in range [1, 3]: 20, 30, 40 (min=20, max=40)
         assert y_range[0] < 20
         assert y_range[1] > 40
@@ -247,23 +621,16 @@ class TestComputeYRangeForXViewport:
             index=dates,
         )
 
-        # 'large' trace is hidden via legendonly
-        current_figure = {
-            "layout": {"yaxis": {}},
-            "data": [
-                {"name": "small", "visible": True},
-                {"name": "large", "visible": "legendonly"},  # Hidden
-            ],
-        }
         relayout_data = {
             "xaxis.range[0]": dates[0].isoformat(),
             "xaxis.range[1]": dates[4].isoformat(),
         }
 
-        result = _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+        # 'large' trace is hidden via the legend
+        result = _compute_y_range_for_x_viewport(relayout_data, df, ["small"])
 
         assert result != no_update
-        y_range = result["layout"]["yaxis"]["range"]
+        y_range = _patched(result)["layout.yaxis.range"]
         # Y range should be based only on 'small' column (1-5)
         # NOT include 'large' column (100-500)
         assert y_range[0] < 1  # Lower bound with padding
@@ -275,14 +642,120 @@ class TestComputeYRangeForXViewport:
         dates = pd.date_range("2025-01-01", periods=5, freq="h")
         df = pd.DataFrame({"value": [1, 2, 3, 4, 5]}, index=dates)
 
-        current_figure = {
-            "layout": {"yaxis": {}},
-            "data": [{"name": "value", "visible": "legendonly"}],  # All hidden
-        }
         relayout_data = {
             "xaxis.range[0]": dates[0].isoformat(),
             "xaxis.range[1]": dates[4].isoformat(),
         }
 
-        result = _compute_y_range_for_x_viewport(current_figure, relayout_data, df)
+        result = _compute_y_range_for_x_viewport(relayout_data, df, [])  # All hidden
         assert result == no_update
+
+
+class TestRelayoutXRange:
+    """Tests for _relayout_x_range()."""
+
+    def test_autorange_clears_range(self):
+        """A double-click reset drops the tracked range."""
+        assert _relayout_x_range({"xaxis.autorange": True}, [1, 2]) is None
+
+    def test_range_list_replaces_range(self):
+        """The list form is taken as the new range."""
+        assert _relayout_x_range({"xaxis.range": [3, 4]}, [1, 2]) == [3, 4]
+
+    def test_range_ends_merge_into_previous(self):
+        """Indexed ends update only the end that changed."""
+        assert _relayout_x_range({"xaxis.range[1]": 5}, [1, 2]) == [1, 5]
+        assert _relayout_x_range(
+            {"xaxis.range[0]": 0, "xaxis.range[1]": 9}, None
+        ) == [0, 9]
+
+    def test_half_range_on_autoranged_axis_is_ignored(self):
+        """One end of a range cannot be tracked without the other."""
+        assert _relayout_x_range({"xaxis.range[0]": 0}, None) is None
+
+    def test_unrelated_relayout_keeps_range(self):
+        """Events without X-axis keys leave the range alone."""
+        assert _relayout_x_range({"autosize": True}, [1, 2]) == [1, 2]
+
+
+class TestRestyleVisibility:
+    """Tests for _restyle_visibility() and _visible_columns()."""
+
+    NAMES = ["a", "b", "c"]
+
+    def test_legend_click_hides_one_trace(self):
+        """A single-trace restyle updates only that trace."""
+        visibility = _restyle_visibility(
+            [{"visible": ["legendonly"]}, [1]], self.NAMES, {}
+        )
+
+        assert visibility == {"b": "legendonly"}
+        assert _visible_columns(self.NAMES, visibility) == ["a", "c"]
+
+    def test_double_click_isolates_trace(self):
+        """Per-trace values are matched to their indices."""
+        visibility = _restyle_visibility(
+            [{"visible": [True, "legendonly", "legendonly"]}, [0, 1, 2]],
+            self.NAMES,
+            {"a": "legendonly"},
+        )
+
+        assert _visible_columns(self.NAMES, visibility) == ["a"]
+
+    def test_no_indices_applies_to_all_traces(self):
+        """Indices of None restyle every trace with a scalar value."""
+        visibility = _restyle_visibility(
+            [{"visible": True}, None], self.NAMES, {"a": "legendonly"}
+        )
+
+        assert _visible_columns(self.NAMES, visibility) == self.NAMES
+
+    def test_previous_state_is_not_mutated(self):
+        """A new dict is returned so readers never see a partial update."""
+        before = {"a": True}
+        _restyle_visibility([{"visible": ["legendonly"]}, [0]], self.NAMES, before)
+
+        assert before == {"a": True}
+
+
+class TestFollowCallback:
+    """Tests for the follow-mode callback wiring."""
+
+    def test_follow_tick_does_not_upload_figure(self):
+        """The follow interval must not send the figure back to the server."""
+        app = create_app()
+        follow = [
+            cb for cb in app.callback_map.values()
+            if any(i["id"] == "follow-interval" for i in cb["inputs"])
+        ]
+
+        assert len(follow) == 1
+        assert {"id": "main-chart", "property": "figure"} not in follow[0]["state"]
+
+    def test_server_callbacks_do_not_upload_figure(self):
+        """Only clientside callbacks may read the figure as State."""
+        app = create_app()
+        server = [cb for cb in app.callback_map.values() if "callback" in cb]
+
+        assert server
+        for cb in server:
+            assert {"id": "main-chart", "property": "figure"} not in cb["state"]
+
+
+class TestOptionalWebview:
+    """chart_app without pywebview installed."""
+
+    def test_imports_and_builds_app_without_webview(self):
+        """The module imports and builds an app when webview is missing."""
+        code = (
+            "import sys; sys.modules['webview'] = None\n"  # import webview -> ImportError
+            "from csv_chart_plotter import chart_app\n"
+            "assert chart_app.webview is None\n"
+            "chart_app.create_app()\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -2,10 +2,23 @@
 
 import pytest
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from csv_chart_plotter import csv_indexer
 from csv_chart_plotter.csv_indexer import CSVIndexer, CSVIndex
 
+# Rows of varying length, a quoted field, a malformed row, CRLF and blank
+# lines, ending in a row longer than the small scan chunks below
+_CHUNKED_LAST_ROW = b"9," + b"7" * 60
+_CHUNKED_CSV = (
+    b"Timestamp,Value\n1,1.0\n22,\"2,0\"\r\n\n333,3.0\n4,4,4\n5,55555.5\n"
+    + _CHUNKED_LAST_ROW
+    + b"\n"
+)
+
 
 class TestBuildIndex:
     """Tests for CSVIndexer.build_index()."""
@@ -18,7 +31,50 @@ class TestBuildIndex:
         assert isinstance(index, CSVIndex)
         assert index.row_count == 3
         assert index.columns == ["Timestamp", "Value1", "Value2", "Label"]
-        assert len(index.row_offsets) == 3
+        assert len(index.offsets()) == 3
+
+    def test_build_index_crlf_and_blank_lines(self, tmp_path):
+        """Row offsets skip blank lines and handle CRLF terminators."""
+        csv_file = tmp_path / "crlf.csv"
+        csv_file.write_bytes(b"Timestamp,Value\r\n1,1.0\r\n\r\n2,2.0\r\n3,3.0")
+
+        index = CSVIndexer(csv_file).build_index()
+
+        assert index.header_offset == 17
+        assert index.row_offsets.tolist() == [17, 26, 33]
+
+    def test_fixed_length_rows_store_only_stride(self, tmp_path):
+        """Evenly spaced rows keep a stride; a longer appended row restores offsets."""
+        csv_file = tmp_path / "fixed.csv"
+        csv_file.write_text("Timestamp,Value\n1,1.0\n2,2.0\n3,3.0\n")
+        indexer = CSVIndexer(csv_file)
+        index = indexer.build_index()
+
+        assert index.row_offsets is None
+        assert index.row_length == 6
+        assert index.offsets().tolist() == [16, 22, 28]
+
+        with csv_file.open("a") as f:
+            f.write("10,10.0\n5,5.0\n")
+        indexer.update_index()
+
+        assert indexer.index.row_length is None
+        assert indexer.index.row_offsets.tolist() == [16, 22, 28, 34, 42]
+        assert indexer.read_range(3, 5)["Value"].tolist() == [10.0, 5.0]
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 16, 64, len(_CHUNKED_LAST_ROW)])
+    def test_chunked_scan_matches_serial_scan(self, tmp_path, monkeypatch, chunk_bytes):
+        """Scanning in small parallel chunks finds the same rows as one pass."""
+        csv_file = tmp_path / "chunked.csv"
+        csv_file.write_bytes(_CHUNKED_CSV)
+        serial = CSVIndexer(csv_file).build_index()
+
+        monkeypatch.setattr(csv_indexer, "_SCAN_CHUNK_BYTES", chunk_bytes)
+        index = CSVIndexer(csv_file).build_index()
+
+        assert serial.row_count == 5
+        assert index.offsets().tolist() == serial.offsets().tolist()
+        assert index.tail_offset == serial.tail_offset
 
     def test_build_index_file_not_found(self, tmp_path):
         """Raise FileNotFoundError for non-existent file."""
@@ -36,6 +92,64 @@ class TestBuildIndex:
             indexer.build_index()
 
 
+class TestIndexCache:
+    """Tests for CSVIndexer.load_or_build_index() sidecar cache."""
+
+    def test_unchanged_file_loads_cached_index(self, tmp_path, monkeypatch):
+        """A second open reuses the sidecar instead of scanning the file."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("Timestamp,Value\n2025-01-01T10:00:00Z,1.0\n2025-01-01T10:01:00Z,2.0\n")
+        first = CSVIndexer(csv_file).load_or_build_index()
+        indexer = CSVIndexer(csv_file)
+        monkeypatch.setattr(indexer, "build_index", lambda: pytest.fail("rescanned"))
+
+        index = indexer.load_or_build_index()
+
+        assert index.offsets().tolist() == first.offsets().tolist()
+        assert index.columns == first.columns
+
+    def test_cached_offsets_are_memory_mapped(self, tmp_path):
+        """Cached offsets are file-backed and extended in place on append."""
+        csv_file = tmp_path / "mapped.csv"
+        csv_file.write_text("Timestamp,Value\n2025-01-01T10:00:00Z,1.0\n")
+        indexer = CSVIndexer(csv_file)
+        indexer.load_or_build_index()
+        with csv_file.open("a") as f:
+            f.write("2025-01-01T10:01:00Z,2.0\n")
+
+        indexer.update_index()
+
+        assert isinstance(indexer.index.row_offsets, np.memmap)
+        assert indexer.index.row_offsets.tolist() == [16, 41]
+        df = indexer.read_range(0, 2)
+        assert df["Value"].tolist() == [1.0, 2.0]
+
+    def test_appended_rows_extend_cached_index(self, tmp_path):
+        """Rows appended after caching are indexed incrementally."""
+        csv_file = tmp_path / "growing.csv"
+        csv_file.write_text("Timestamp,Value\n2025-01-01T10:00:00Z,1.0\n")
+        CSVIndexer(csv_file).load_or_build_index()
+        with csv_file.open("a") as f:
+            f.write("2025-01-01T10:01:00Z,2.0\n")
+
+        index = CSVIndexer(csv_file).load_or_build_index()
+
+        assert index.row_count == 2
+        assert CSVIndexer(csv_file)._load_cached_index().row_count == 2
+
+    def test_rewritten_file_rebuilds_index(self, tmp_path):
+        """A cache whose bytes no longer match the file is ignored."""
+        csv_file = tmp_path / "rewritten.csv"
+        csv_file.write_text("Timestamp,Value\n2025-01-01T10:00:00Z,1.0\n")
+        CSVIndexer(csv_file).load_or_build_index()
+        csv_file.write_text("Timestamp,Other\n2025-01-01T10:00:00Z,1.0\n3,4\n")
+
+        index = CSVIndexer(csv_file).load_or_build_index()
+
+        assert index.columns == ["Timestamp", "Other"]
+        assert index.row_count == 2
+
+
 class TestReadRange:
     """Tests for CSVIndexer.read_range()."""
 
@@ -50,6 +164,42 @@ class TestReadRange:
         assert "Value1" in df.columns
         assert "Value2" in df.columns
 
+    def test_read_range_keeps_quoted_header_names(self, tmp_path):
+        """Header names containing commas survive ranges not starting at row 0."""
+        csv_file = tmp_path / "quoted.csv"
+        csv_file.write_text('Index,"Temp, C",Flow\n1,20.5,3\n2,21.0,4\n')
+        indexer = CSVIndexer(csv_file)
+        indexer.build_index()
+
+        df = indexer.read_range(1, 2)
+
+        assert list(df.columns) == ["Temp, C", "Flow"]
+        assert df["Flow"].tolist() == [4]
+
+    def test_concurrent_reads_share_float_schema(self, tmp_path):
+        """Reads from several threads agree on values and the cached schema."""
+        csv_file = tmp_path / "concurrent.csv"
+        csv_file.write_text("Index,Value\n" + "".join(f"{i},{i}.5\n" for i in range(200)))
+        indexer = CSVIndexer(csv_file)
+        indexer.build_index()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            frames = list(executor.map(lambda i: indexer.read_range(i, i + 50), range(0, 150, 5)))
+
+        for i, df in zip(range(0, 150, 5), frames):
+            assert df["Value"].tolist() == [j + 0.5 for j in range(i, i + 50)]
+        assert indexer._float_columns == {"Value": np.float64}
+
+    def test_read_range_reinfers_when_float_column_changes(self, tmp_path):
+        """Cached float dtypes are dropped when a later range has text."""
+        csv_file = tmp_path / "mixed.csv"
+        csv_file.write_text("Index,Value\n1,1.5\n2,oops\n")
+        indexer = CSVIndexer(csv_file)
+        indexer.build_index()
+
+        assert indexer.read_range(0, 1)["Value"].dtype == np.float64
+        assert indexer.read_range(1, 2)["Value"].tolist() == ["oops"]
+
     def test_read_range_out_of_bounds(self, temp_csv_file):
         """Raise IndexError when end_row exceeds row count."""
         indexer = CSVIndexer(temp_csv_file)
@@ -139,3 +289,21 @@ class TestUTCTimestampConversion:
 
         # Index should remain as string type (Label column)
         assert df.index.dtype == object
+
+    def test_utc_timestamps_with_mixed_fractions(self, tmp_path):
+        """UTC timestamps with and without fractional seconds convert together."""
+        csv_file = tmp_path / "utc_fractions.csv"
+        csv_file.write_text(
+            "Time,Value\n"
+            "2025-01-01T10:00:00Z,1\n"
+            "2025-01-01T10:00:00.250Z,2\n"
+        )
+
+        indexer = CSVIndexer(csv_file)
+        indexer.build_index()
+
+        df = indexer.read_range(0, 2)
+
+        import pandas as pd
+        assert pd.api.types.is_datetime64_any_dtype(df.index)
+        assert (df.index[1] - df.index[0]) == pd.Timedelta(milliseconds=250)
@@ -0,0 +1,90 @@
+"""Unit tests for CSV monitor module."""
+
+import threading
+import time
+
+import pytest
+from watchdog.events import FileModifiedEvent
+
+from csv_chart_plotter import csv_monitor
+from csv_chart_plotter.csv_monitor import CSVFileHandler
+
+DEBOUNCE = 0.3  # Seconds; patched over DEBOUNCE_INTERVAL for these tests
+
+
+@pytest.fixture
+def monitored_csv(tmp_path, monkeypatch):
+    """CSV file with a short debounce interval."""
+    monkeypatch.setattr(csv_monitor, "DEBOUNCE_INTERVAL", DEBOUNCE)
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("Timestamp,Value\n1,1.0\n")
+    return csv_file
+
+
+@pytest.fixture
+def handler(monitored_csv):
+    """Handler recording callbacks, driven directly without an observer."""
+    calls = []
+    called = threading.Event()
+
+    def on_change(path, is_truncation):
+        calls.append((time.monotonic(), is_truncation))
+        called.set()
+
+    handler = CSVFileHandler(monitored_csv, on_change)
+    handler.calls = calls
+    handler.called = called
+    yield handler
+    handler.close()
+
+
+def _append_row(csv_file, handler, value: int) -> None:
+    """Append a row and deliver the modify event for it."""
+    with csv_file.open("a") as f:
+        f.write(f"{value},{value}.0\n")
+    handler.on_modified(FileModifiedEvent(str(csv_file)))
+
+
+class TestCSVFileHandler:
+    """Tests for CSVFileHandler's worker thread."""
+
+    def test_burst_of_events_gives_one_callback(self, monitored_csv, handler):
+        """Events within one debounce window are coalesced into one callback."""
+        handler.mark_render_complete()
+        for value in range(2, 12):
+            _append_row(monitored_csv, handler, value)
+
+        assert handler.called.wait(timeout=5 * DEBOUNCE)
+        time.sleep(DEBOUNCE)  # Leave time for any extra callback
+
+        assert len(handler.calls) == 1
+        assert handler.calls[0][1] is False  # Growth, not truncation
+
+    def test_event_in_debounce_window_is_deferred(self, monitored_csv, handler):
+        """A change right after a render fires once the window has passed."""
+        handler.mark_render_complete()
+        render_time = handler.last_complete_time
+        _append_row(monitored_csv, handler, 2)
+
+        assert not handler.called.wait(timeout=DEBOUNCE / 3)
+        assert handler.called.wait(timeout=5 * DEBOUNCE)
+        assert handler.calls[0][0] - render_time >= DEBOUNCE
+
+    def test_truncation_is_reported(self, monitored_csv, handler):
+        """A shrinking file triggers the callback with is_truncation set."""
+        monitored_csv.write_text("Timestamp,Value\n")
+        handler.on_modified(FileModifiedEvent(str(monitored_csv)))
+
+        assert handler.called.wait(timeout=5 * DEBOUNCE)
+        assert [is_truncation for _, is_truncation in handler.calls] == [True]
+
+    def test_close_joins_worker(self, monitored_csv, handler):
+        """close() stops the worker thread, dropping a pending change."""
+        handler.mark_render_complete()
+        _append_row(monitored_csv, handler, 2)
+
+        handler.close()
+
+        assert not handler._worker.is_alive()
+        time.sleep(DEBOUNCE)
+        assert handler.calls == []
@@ -3,7 +3,12 @@
 import pytest
 import numpy as np
 
-from csv_chart_plotter.lttb import lttb_downsample, downsample_dataframe, compute_lttb_indices
+from csv_chart_plotter.lttb import (
+    lttb_downsample,
+    downsample_dataframe,
+    compute_lttb_indices,
+    compute_lttb_indices_batch,
+)
 
 
 class TestMinMaxLttbDownsample:
@@ -94,6 +99,7 @@ class TestMinMaxLttbDownsample:
         indices = compute_lttb_indices(x, y, threshold=10)
 
         assert isinstance(indices, np.ndarray)
+        assert indices.dtype == np.int64
         assert len(indices) == 10
         assert indices[0] == 0
         assert indices[-1] == 99
@@ -137,3 +143,20 @@ class TestDownsampleDataframe:
 
         with pytest.raises(ValueError, match="length.*must match"):
             downsample_dataframe(numeric_dataframe, x_values, threshold=10)
+
+
+class TestComputeLttbIndicesBatch:
+    """Tests for compute_lttb_indices_batch()."""
+
+    def test_batch_matches_per_series(self, large_numeric_arrays):
+        """Batched indices equal per-series compute_lttb_indices results."""
+        x, y = large_numeric_arrays
+        ys = np.vstack([y, y[::-1].copy(), np.cos(x)])
+
+        batch = compute_lttb_indices_batch(x, ys, threshold=100)
+
+        assert len(batch) == 3
+        for series, indices in zip(ys, batch):
+            np.testing.assert_array_equal(
+                indices, compute_lttb_indices(x, series, threshold=100)
+            )